@@ -1,213 +1,258 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import warnings
-import imageio.v2 as imageio
-import os
+
+from Simulator_Core.Diagnostics import empty_diagnostics
+from Simulator_Core.OperatorCache import grid_axis
+from Simulator_Core.Precision import complex_dtype
+from Simulator_Core.Profiles import evaluate_on_grid
+from Simulator_Core.Recording import Recorder
 
 
 class Grid:
 
-    def __init__(self, grid_parameters):
+    def __init__(self, grid_parameters, sink=None, snapshots=None):
         """
         The grid on which the simulation is performed.
 
         :param grid_parameters: The parameters for the grid. (dataclass)
+        :param sink: Object with a write(time_step, state) method which receives every snapshot_interval-th state.
+        :param snapshots: Array with every snapshot_interval-th state. (only for the history mode "snapshots")
         """
 
         self.grid_parameters = grid_parameters
-        self.grid = np.zeros((self.grid_parameters.time_steps, self.grid_parameters.space_steps), dtype=np.complex_)
+        self.sink = sink
+        self.monitor = None  # Object with a publish(time_step, state) method which receives every state.
+        self.current_time_step = 0
+        self.dtype = complex_dtype(self.grid_parameters)
+
+        # In the "ring" mode only the last history_length time-steps are kept in memory.
+        # The "recorded" mode keeps them like the "ring" mode and records reduced states. (see Simulator_Core.Recording)
+        # The "snapshots" mode wraps already stored (e.g. memory-mapped) snapshots of a finished run.
+        # ---------------------------------------------------------------
+        if self.grid_parameters.history_mode == "full":
+            self.history_length = self.grid_parameters.time_steps
+        elif self.grid_parameters.history_mode in ("ring", "recorded"):
+            self.history_length = self.grid_parameters.history_length
+        elif self.grid_parameters.history_mode == "snapshots":
+            if snapshots is None:
+                raise ValueError("The history mode \"snapshots\" requires snapshots.")
+            self.history_length = len(snapshots)
+            self.current_time_step = (len(snapshots) - 1) * self.grid_parameters.snapshot_interval
+        else:
+            raise ValueError("Unknown history mode: " + str(self.grid_parameters.history_mode))
+
+        if snapshots is not None:
+            self.grid = snapshots
+        else:
+            self.grid = np.zeros((self.history_length, self.grid_parameters.space_steps), dtype=self.dtype)
         self.energy = np.zeros(self.grid_parameters.time_steps)
+        # the simulated time of every timestep (set by the simulation if the time step size is adaptive)
+        self.time = np.arange(self.grid_parameters.time_steps) * self.grid_parameters.time_step_size
+        # energies, momentum and center of mass of every diagnostics_interval-th timestep (set by the simulation)
+        self.diagnostics = empty_diagnostics(self.grid_parameters, 1)
         self.method = ""
 
         # Precalculate the x-axis since it is used quite often
         # ---------------------------------------------------------------
-        self.x_axis = np.zeros(self.grid_parameters.space_steps, dtype=np.complex_)
-        offset = -1 * int(self.grid_parameters.space_steps / 2) * self.grid_parameters.space_step_size
-        if (self.grid_parameters.space_steps % 2) == 0:
-            offset = offset + (self.grid_parameters.space_step_size / 2)
-        for i in range(0, self.grid_parameters.space_steps):
-            self.x_axis[i] = offset + i * self.grid_parameters.space_step_size
+        self.x_axis = grid_axis(self.grid_parameters.space_steps,
+                                self.grid_parameters.space_step_size).astype(np.complex128)
         # ---------------------------------------------------------------
 
+        self.recorder = None
+        if self.grid_parameters.history_mode == "recorded":
+            self.recorder = Recorder(self.grid_parameters, [self.x_axis], dtype=self.dtype)
+
     def set_init_function(self, func, normalize=True):
         """
-        Sets the initial function.
+        Sets the initial function. The function is evaluated once on the real coordinates, directly into the array
+        of the first state. (profiles separably, see Simulator_Core.Profiles)
 
-        :param func: The initial function.
+        :param func: The initial function. (a Profile or a function of the coordinates)
         :param normalize: Set to true if the function should be normalized.
         """
 
+        state = evaluate_on_grid(func, [self.x_axis], out=self.state_buffer(0))
+
         if normalize:
-            self.grid[0] = func(self.x_axis) / np.linalg.norm(func(self.x_axis))
-        else:
-            self.grid[0] = func(self.x_axis)
+            state /= np.linalg.norm(state)
 
-    def print_grid(self):
+        self.set_state(0, state)
+
+    def state_buffer(self, time_step):
         """
-        Prints the grid.
+        Returns the array in which the state of a timestep will be stored, so the simulation can write it in place.
+        (In the "ring" mode with a history_length of 1 this is the array of the current state.)
+
+        :param time_step: The timestep of the state.
         """
 
-        print(np.flipud(self.grid.round(2)))
+        return self.grid[time_step % self.history_length]
 
-    # Functions for plotting the system.
-    # ---------------------------------------------------------------
+    def set_state(self, time_step, state):
+        """
+        Stores the state of the system at a given timestep and hands it to the sink (and the monitor) if required.
 
-    def plot_energy_evolution(self, save=False, log=False):
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep. (may already be the state buffer of the timestep)
         """
-        Plots the energy evolution of the system.
 
-        :param save: Set true if the plot should be saved instead of shown.
-        :param log: Set true if the log should be taken for the y-axis.
+        buffer = self.state_buffer(time_step)
+        if not np.may_share_memory(buffer, state):
+            buffer[...] = state
+        self.current_time_step = time_step
+
+        if self.sink is not None and time_step % self.grid_parameters.snapshot_interval == 0:
+            self.sink.write(time_step, buffer)
+        if self.monitor is not None:
+            self.monitor.publish(time_step, buffer)
+        if self.recorder is not None and time_step % self.recorder.interval == 0:
+            self.recorder.record(time_step, buffer)
+
+    def get_state(self, time_step):
         """
+        Returns the state of the system at a given timestep.
 
-        time_axis = np.zeros(self.grid_parameters.time_steps)
+        :param time_step: The timestep of the state. (has to be kept in the history of the grid)
+        """
 
-        for i in range(0, self.grid_parameters.time_steps):
-            time_axis[i] = i * self.grid_parameters.time_step_size
+        if time_step not in self.stored_time_steps():
+            raise ValueError("Time-step " + str(time_step) + " is not kept in the history of the grid.")
 
-        if log:
-            plt.plot(time_axis, self.energy)
-            plt.yscale("log")
-        else:
-            plt.ylim([-3, 3])  # kind of
-            plt.plot(time_axis, self.energy)
+        if self.grid_parameters.history_mode == "snapshots":
+            return self.grid[time_step // self.grid_parameters.snapshot_interval]
 
-        plt.xlabel("time")
-        plt.ylabel("energy")
-        plt.title("Energy Evolution")
+        return self.grid[time_step % self.history_length]
 
-        if save:
+    def stored_time_steps(self):
+        """
+        Returns the range of timesteps which are kept in the history of the grid.
+        """
 
-            if not os.path.exists("./pictures"):
-                os.makedirs("./pictures")
+        if self.grid_parameters.history_mode == "snapshots":
+            return range(0, self.current_time_step + 1, self.grid_parameters.snapshot_interval)
 
-            plt.savefig("./pictures/energy.png", dpi=300)
-            plt.close()
-        else:
-            plt.show()
+        return range(max(0, self.current_time_step - self.history_length + 1), self.current_time_step + 1)
 
-    def plot_2d(self, time_step, pot=lambda a, u: 0, use_for_gif=False):
+    def plotted_time_steps(self):
+        """
+        Returns the range of timesteps which can be plotted. (the recorded ones in the history mode "recorded")
         """
-        Makes a 2D plot of the system at a given timestep.
 
-        :param time_step: The timestep of the plot.
-        :param pot: The potential function of the system.
-        :param use_for_gif: Only for internal use. (Is set to true when generating a gif.)
+        if self.recorder is not None:
+            return self.recorder.time_steps()
+
+        return self.stored_time_steps()
+
+    def plotted_state(self, time_step):
         """
+        Returns the coordinates of every axis (x, y, z) and the state of a timestep which is plotted. (the reduced
+        record in the history mode "recorded", which is |u|^2 if only the density was recorded)
 
-        # Deactivate Warnings while generating gif
-        warnings.filterwarnings('ignore')
+        :param time_step: The timestep of the state.
+        """
 
-        y_pot = np.zeros(len(self.x_axis))
+        if self.recorder is not None:
+            return self.recorder.axes, self.recorder.get_record(time_step)
 
-        for i in range(0, len(y_pot)):
-            y_pot[i] = pot(self.x_axis[i], self.grid[time_step][i])
+        return [np.real(axis) for axis in [self.x_axis]], self.get_state(time_step)
 
-        x_plot = np.square(abs(self.grid[time_step]))
-        x_plot = x_plot / np.linalg.norm(x_plot)
+    def plotted_history(self):
+        """
+        Returns the plotted timesteps, the coordinates of the x-axis and the states of these timesteps. (the reduced
+        records in the history mode "recorded")
+        """
 
-        x_plot_sec = (self.grid[time_step])
+        time_steps = self.plotted_time_steps()
 
-        fig, ax1 = plt.subplots(figsize=(10, 7), dpi=160)
-        ax2 = ax1.twinx()
+        if self.recorder is not None:
+            first = time_steps.start // self.recorder.interval
+            return time_steps, self.recorder.axes[0], self.recorder.records[first:first + len(time_steps)]
 
-        ax1.plot(self.x_axis, x_plot, label='wave_squared', color="teal")
-        ax1.plot(self.x_axis, x_plot_sec, label='wave', color="lightcoral")
-        ax2.plot(self.x_axis, y_pot, label='potential', color="darkorange")
+        return time_steps, self.x_axis.real, self.grid[:len(time_steps)]
 
-        handles, labels = [(a + b) for a, b in zip(ax1.get_legend_handles_labels(), ax2.get_legend_handles_labels())]
-        plt.legend(handles, labels, loc='upper right')
+    def check_full_history(self):
+        """
+        Raises an error if the grid does not keep every timestep. (needed for plots of the whole system)
+        """
 
-        plt.title(self.method + "\n[dx=" + str(self.grid_parameters.time_step_size) + ", dt=" + str(
-            self.grid_parameters.space_step_size) + "]   Time: " + str(
-            round(time_step * self.grid_parameters.time_step_size, 3)) + "    Time-Step: " + str(time_step))
-        ax1.set_ylabel("wave function")
-        ax2.set_ylabel("potential")
-        ax1.set_xlabel("space")
+        if self.grid_parameters.history_mode == "ring":
+            raise ValueError("Plotting the whole system is not possible with the history mode \"ring\".")
 
-        if use_for_gif:
-            plt.savefig("./gif/picture_for_giv_" + str(time_step) + ".png")
-            plt.close()
+    def print_grid(self):
+        """
+        Prints the grid.
+        """
 
-        warnings.filterwarnings('default')
+        print(np.flipud(self.grid.round(2)))
 
-    def plot_3d(self, square=True):
+    # Functions for plotting the system. (see Simulator_1D.Visualization, which is only imported when they are used)
+    # ---------------------------------------------------------------
+
+    def plot_energy_evolution(self, save=False, log=False):
         """
-        Plots a 3D plot of the whole system.
+        Plots the energy evolution of the system. (the norm sum(|u|^2) if no diagnostics were recorded)
 
-        :param square: Set to true if the system should be squared.
+        :param save: Set true if the plot should be saved instead of shown.
+        :param log: Set true if the log should be taken for the y-axis.
         """
 
-        # Deactivate Warnings while generating gif
-        warnings.filterwarnings('ignore')
+        from Simulator_Core.Visualization import plot_energy_evolution
+        plot_energy_evolution(self, save, log)
 
-        y_axis = np.zeros(self.grid_parameters.time_steps)
-        for i in range(0, self.grid_parameters.time_steps):
-            y_axis[i] = i * self.grid_parameters.time_step_size
+    def frame(self, time_step, state=None, pot=lambda a, u: 0):
+        """
+        Returns the draw function and its arguments for the 2D plot of one timestep. (see FrameRenderer)
 
-        x, y = np.meshgrid(self.x_axis.real, y_axis)
+        :param time_step: The timestep of the frame.
+        :param state: The wave function at the timestep. (default: the stored state)
+        :param pot: The potential function of the system.
+        """
 
-        if square:
-            z = np.square(abs(self.grid))
-        else:
-            z = self.grid.real
+        from Simulator_1D.Visualization import frame
+        return frame(self, time_step, state, pot)
 
-        ax = plt.axes(projection='3d')
-        ax.plot_wireframe(x, y, z, color='green')
-        ax.set_xlabel('space')
-        ax.set_ylabel('time')
-        ax.set_zlabel('wave function')
+    def plot_2d(self, time_step, pot=lambda a, u: 0):
+        """
+        Makes a 2D plot of the system at a given timestep.
 
-        warnings.filterwarnings('default')
+        :param time_step: The timestep of the plot.
+        :param pot: The potential function of the system.
+        """
 
-    def heatmap(self, square=True, save=False):
+        from Simulator_1D.Visualization import plot_2d
+        plot_2d(self, time_step, pot)
+
+    def plot_3d(self, square=True):
         """
-        Makes a heatmap of the whole system.
+        Plots a 3D plot of the whole system.
 
         :param square: Set to true if the system should be squared.
-        :param save: Set true if the plot should be saved instead of shown.
         """
 
-        if square:
-            z = np.square(abs(self.grid))
-        else:
-            z = self.grid.real
-
-        plt.figure(dpi=150)
-        plt.imshow(z, cmap='viridis', interpolation='nearest', origin='lower')
-        plt.xlabel("grid points on the x-axis")
-        plt.ylabel("time-step")
-        plt.title("1D Split-Operator Method\n" + "dt=" + str(self.grid_parameters.time_step_size) + " dx=" + str(
-            self.grid_parameters.space_step_size))  #
-        cbar = plt.colorbar()
-        cbar.set_label('squared wave function value')
+        from Simulator_1D.Visualization import plot_3d
+        plot_3d(self, square)
 
-        if save:
+    def heatmap(self, square=True, save=False):
+        """
+        Makes a heatmap of the whole system.
 
-            if not os.path.exists("./pictures"):
-                os.makedirs("./pictures")
+        :param square: Set to true if the system should be squared.
+        :param save: Set true if the plot should be saved instead of shown.
+        """
 
-            plt.savefig("./pictures/2D-heatmap.png", dpi=300)
-            plt.close()
-        else:
-            plt.show()
-            plt.close()
+        from Simulator_1D.Visualization import heatmap
+        heatmap(self, square, save)
 
-    def gif(self, pot=lambda a: 0):
+    def gif(self, pot=lambda a, u: 0, path="simulation.gif", stride=1, fps=10, processes=None):
         """
-        Makes a gif of the whole system. Consisting of a 2D plot of every timestep.
+        Makes a gif (or an mp4) of the whole system. Consisting of a 2D plot of every stride-th stored timestep.
+        The frames are rendered in a pool of processes and streamed directly into the file.
 
         :param pot: The potential function of the system.
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param stride: Only every stride-th stored timestep is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
         """
 
-        if not os.path.exists("./gif"):
-            os.makedirs("./gif")
-
-        for i in range(0, self.grid_parameters.time_steps):
-            print("Generating picture: (" + str(i + 1) + "/" + str(self.grid_parameters.time_steps) + ")")
-            self.plot_2d(i, pot, True)
-
-        images = list()
-        for i in range(0, self.grid_parameters.time_steps):
-            images.append(imageio.imread("gif/picture_for_giv_" + str(i) + ".png"))
-        imageio.mimsave("simulation.gif", images)
+        from Simulator_1D.Visualization import gif
+        gif(self, pot, path, stride, fps, processes)
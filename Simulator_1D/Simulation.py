@@ -1,27 +1,42 @@
-import numpy as np
-import math
+from Simulator_Core.SplitOperator import SplitOperatorSimulation
 
 
-class Simulation:
+class Simulation(SplitOperatorSimulation):
 
-    def __init__(self, grid, potential=lambda x=0: 0):
+    def __init__(self, grid, potential=lambda x=0, u=0: 0, gravity=5):
         """
-        Class that carries out the actual simulation.
+        Class that carries out the actual simulation. (see SplitOperatorSimulation)
 
         :param grid: The grid on which the simulation is carried out.
         :param potential: The potential function used for the simulation. (default 0)
+        :param gravity: The "gravity" of the system. (How much the waves attract one another.)
         """
 
-        self.grid = grid
-        self.potential = potential
+        super().__init__(grid, gravity, potential)
 
-    def set_init_function(self, func):
+    def axes(self):
         """
-        Sets the initial function of the system.
+        Returns the coordinates of the x-axis of the grid.
+        """
+
+        return [self.grid.x_axis]
+
+    def spacings(self):
+        """
+        Returns the space step size of the grid.
+        """
+
+        return (self.grid.grid_parameters.space_step_size,)
+
+    def start_split_operator(self, checkpoint=None):
+        """
+        Starts the 1D simulation of the Schrödinger Poison equation using the split operator method.
 
-        :param func: The function to which the initial function should be set to. (wrapper function)
+        :param checkpoint: The restored checkpoint from which the run is continued. (see resume_from)
         """
-        self.grid.set_init_function(func)
+
+        self.grid.method = "Split-Time"
+        super().start_split_operator(checkpoint)
 
     def plot_energy_evolution(self, save=False, log=False):
         """
@@ -50,12 +65,18 @@ class Simulation:
 
         self.grid.plot_3d(square)
 
-    def gif(self):
+    def gif(self, path="simulation.gif", stride=1, fps=10, processes=None):
         """
-        Makes a gif of the whole system. Consisting of a 2D plot of every timestep. (wrapper function)
+        Makes a gif (or an mp4) of the whole system. Consisting of a 2D plot of every stride-th stored timestep.
+        (wrapper function)
+
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param stride: Only every stride-th stored timestep is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
         """
 
-        self.grid.gif(self.potential)
+        self.grid.gif(self.potential, path, stride, fps, processes)
 
     def heatmap(self, square=True, save=False):
         """
@@ -66,62 +87,3 @@ class Simulation:
         """
 
         self.grid.heatmap(square, save)
-
-    def start_split_operator(self):
-        """
-        Starts the 1D simulation of the Schrödinger Poison equation using the split operator method.
-        """
-
-        self.grid.method = "Split-Time"
-
-        dt = self.grid.grid_parameters.time_step_size
-
-        # define operators (which are actually vectors)
-        # ---------------------------------------------
-        v = self.potential(self.grid.x_axis)
-        opr_r = np.power(math.e, -1 * 1j * v * dt)
-
-        # Info: From k = (2*pi)/L | The 2 vanishes since the grid is divided in half.
-        space_step = self.grid.grid_parameters.space_steps
-        k = (np.fft.fftfreq(space_step) * (space_step / 2) * math.pi / self.grid.x_axis[-1])
-        opr_k = np.power(math.e, -0.5 * 1j * np.power(k, 2) * dt)
-
-        k[0] = 0.0001
-
-        # set the first energy
-        # ------------------------
-        self.grid.energy[0] = np.sum(np.square(np.abs(self.grid.grid[0])))
-
-        # iterate
-        # ------------------------
-        for i in range(0, self.grid.grid_parameters.time_steps - 1):
-
-            # FFT
-            # ------------------------
-            tmp = np.fft.fft(self.grid.grid[i])
-            v = np.fft.fft(np.abs(np.power(self.grid.grid[i], 2)))
-
-            # Poisson
-            # ------------------------
-            v = (-1 / (np.power(np.abs(k), 2))) * v  # (np.power(np.abs(k)
-
-            # Momentum
-            # ------------------------
-            tmp = tmp * opr_k
-
-            # IFFT
-            # ------------------------
-            tmp = np.fft.ifft(tmp)
-            v = np.fft.ifft(v)
-
-            # Position
-            # ------------------------
-            v = v * 5 + self.potential(self.grid.x_axis)
-            opr_r = np.power(math.e, -1 * 1j * v * dt)
-            tmp = tmp * opr_r
-
-            self.grid.grid[i + 1] = tmp
-
-            # save the current energy of the system
-            # ------------------------
-            self.grid.energy[i + 1] = np.sum(np.square(np.abs(self.grid.grid[i + 1])))
@@ -0,0 +1,167 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import warnings
+
+from Simulator_Core.FrameRenderer import FrameRenderer
+from Simulator_Core.Recording import plot_values
+from Simulator_Core.Visualization import save_or_show
+
+
+# Plots of the 1D grid. (imported by the plotting methods of the grid, so a run without plots does not load matplotlib)
+# ---------------------------------------------------------------
+
+def frame(grid, time_step, state=None, pot=lambda a, u: 0):
+    """
+    Returns the draw function and its arguments for the 2D plot of one timestep. (see FrameRenderer)
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep of the frame.
+    :param state: The wave function at the timestep. (default: the plotted state, see Grid.plotted_state)
+    :param pot: The potential function of the system.
+    """
+
+    if state is None:
+        (x_axis,), state = grid.plotted_state(time_step)
+    else:
+        x_axis = grid.x_axis.real
+
+    y_pot = np.zeros(len(x_axis))
+
+    for i in range(0, len(y_pot)):
+        y_pot[i] = np.real(pot(x_axis[i], state[i]))
+
+    x_plot = plot_values(state)
+    x_plot = x_plot / np.linalg.norm(x_plot)
+
+    # Info: The real part is not known if only the density was recorded.
+    x_plot_sec = np.array(state.real) if np.iscomplexobj(state) else None
+
+    title = grid.method + "\n[dx=" + str(grid.grid_parameters.time_step_size) + ", dt=" + str(
+        grid.grid_parameters.space_step_size) + "]   Time: " + str(
+        round(grid.time[time_step], 3)) + "    Time-Step: " + str(time_step)
+
+    return draw_plot, (np.array(x_axis), x_plot, x_plot_sec, y_pot, title)
+
+
+def plot_2d(grid, time_step, pot=lambda a, u: 0):
+    """
+    Makes a 2D plot of the system at a given timestep.
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep of the plot.
+    :param pot: The potential function of the system.
+    """
+
+    # Deactivate Warnings while plotting
+    warnings.filterwarnings('ignore')
+
+    draw, arguments = frame(grid, time_step, pot=pot)
+    draw(*arguments)
+
+    warnings.filterwarnings('default')
+
+
+def plot_3d(grid, square=True):
+    """
+    Plots a 3D plot of the whole system.
+
+    :param grid: The grid of the run.
+    :param square: Set to true if the system should be squared.
+    """
+
+    grid.check_full_history()
+
+    # Deactivate Warnings while generating gif
+    warnings.filterwarnings('ignore')
+
+    time_steps, x_axis, states = grid.plotted_history()
+    y_axis = grid.time[np.array(time_steps)]
+
+    x, y = np.meshgrid(x_axis, y_axis)
+    z = plot_values(states, square)
+
+    ax = plt.axes(projection='3d')
+    ax.plot_wireframe(x, y, z, color='green')
+    ax.set_xlabel('space')
+    ax.set_ylabel('time')
+    ax.set_zlabel('wave function')
+
+    warnings.filterwarnings('default')
+
+
+def heatmap(grid, square=True, save=False):
+    """
+    Makes a heatmap of the whole system.
+
+    :param grid: The grid of the run.
+    :param square: Set to true if the system should be squared.
+    :param save: Set true if the plot should be saved instead of shown.
+    """
+
+    grid.check_full_history()
+
+    time_steps, x_axis, states = grid.plotted_history()
+    z = plot_values(states, square)
+
+    plt.figure(dpi=150)
+    plt.imshow(z, cmap='viridis', interpolation='nearest', origin='lower', aspect='auto',
+               extent=(x_axis[0], x_axis[-1], time_steps[0], time_steps[-1]))
+    plt.xlabel("x")
+    plt.ylabel("time-step")
+    plt.title("1D Split-Operator Method\n" + "dt=" + str(grid.grid_parameters.time_step_size) + " dx=" + str(
+        grid.grid_parameters.space_step_size))  #
+    cbar = plt.colorbar()
+    cbar.set_label('squared wave function value')
+
+    save_or_show("2D-heatmap.png" if save else "")
+
+
+def gif(grid, pot=lambda a, u: 0, path="simulation.gif", stride=1, fps=10, processes=None):
+    """
+    Makes a gif (or an mp4) of the whole system. Consisting of a 2D plot of every stride-th stored timestep.
+    The frames are rendered in a pool of processes and streamed directly into the file.
+
+    :param grid: The grid of the run.
+    :param pot: The potential function of the system.
+    :param path: The file of the animation. (".gif" or ".mp4")
+    :param stride: Only every stride-th stored timestep is rendered.
+    :param fps: The frames per second of an mp4 file.
+    :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+    """
+
+    renderer = FrameRenderer(path, fps, processes)
+
+    time_steps = grid.plotted_time_steps()[::stride]
+    for n, i in enumerate(time_steps):
+        print("Rendering frame: (" + str(n + 1) + "/" + str(len(time_steps)) + ")")
+        renderer.submit(*frame(grid, i, pot=pot))
+
+    renderer.close()
+
+
+def draw_plot(x, wave_squared, wave, potential, title):
+    """
+    Draws the 2D plot of one timestep onto a new figure. (module level, so it can be used by the rendering processes)
+
+    :param x: The coordinates of the grid points.
+    :param wave_squared: The normalized squared wave function.
+    :param wave: The real part of the wave function. (None if only the density was recorded)
+    :param potential: The potential at the grid points.
+    :param title: The title of the plot.
+    """
+
+    fig, ax1 = plt.subplots(figsize=(10, 7), dpi=160)
+    ax2 = ax1.twinx()
+
+    ax1.plot(x, wave_squared, label='wave_squared', color="teal")
+    if wave is not None:
+        ax1.plot(x, wave, label='wave', color="lightcoral")
+    ax2.plot(x, potential, label='potential', color="darkorange")
+
+    handles, labels = [(a + b) for a, b in zip(ax1.get_legend_handles_labels(), ax2.get_legend_handles_labels())]
+    plt.legend(handles, labels, loc='upper right')
+
+    plt.title(title)
+    ax1.set_ylabel("wave function")
+    ax2.set_ylabel("potential")
+    ax1.set_xlabel("space")
@@ -0,0 +1,154 @@
+import numpy as np
+
+from Simulator_Core.FFTBackend import create_fft_backend
+from Simulator_Core.OperatorCache import operator_tables
+from Simulator_Core.PositionKernel import create_position_kernel
+from Simulator_Core.Precision import complex_dtype, real_dtype
+from Simulator_Core.Profiles import evaluate_on_grid
+from Simulator_Core.SplitOperator import StepPhases, split_operator_step
+
+
+class EnsembleSimulation:
+
+    def __init__(self, grids, gravities, potentials=lambda x=0, y=0: 0):
+        """
+        Class that carries out the simulation of several grids at once. The states of all members are stacked into
+        one (members, X, Y) array, which is advanced with one batched FFT per step.
+
+        :param grids: The grids of the members. (with the same size, time steps, integrator and precision)
+        :param gravities: The "gravity" of every member. (or one value for all members)
+        :param potentials: The potential function of every member. (or one function for all members, default 0)
+        """
+
+        self.grids = list(grids)
+        self.gravities = np.broadcast_to(np.asarray(gravities, dtype=float), (len(self.grids),))
+
+        if callable(potentials):
+            potentials = [potentials] * len(self.grids)
+        self.potentials = list(potentials)
+
+        if len(self.potentials) != len(self.grids):
+            raise ValueError("The ensemble needs one potential function for every grid.")
+
+        # Info: Everything which is shared by the batched operators has to be the same for every member.
+        first = self.grids[0].grid_parameters
+        for grid in self.grids:
+            if self.shared_parameters(grid.grid_parameters) != self.shared_parameters(first):
+                raise ValueError("The grids of an ensemble need the same size, time steps, integrator and precision.")
+
+        # Info: The features of SplitOperatorSimulation which the batched loop does not have are rejected for every
+        #       member instead of being ignored.
+        for grid_parameters in [grid.grid_parameters for grid in self.grids]:
+            if grid_parameters.adaptive:
+                raise ValueError("The ensemble simulation does not support adaptive time steps.")
+            if grid_parameters.checkpoint_interval > 0:
+                raise ValueError("The ensemble simulation does not support checkpoints.")
+            if grid_parameters.diagnostics_interval > 0:
+                raise ValueError("The ensemble simulation does not support diagnostics.")
+            if grid_parameters.profile:
+                raise ValueError("The ensemble simulation does not support profiling.")
+            if grid_parameters.absorbing_width > 0:
+                raise ValueError("The ensemble simulation does not support absorbing boundaries.")
+            if grid_parameters.engine != "numpy":
+                raise ValueError("The ensemble simulation only supports the engine \"numpy\".")
+
+    @staticmethod
+    def shared_parameters(grid_parameters):
+        """
+        Returns the grid parameters which have to be the same for every member of the ensemble.
+
+        :param grid_parameters: The parameters of one grid. (dataclass)
+        """
+
+        return (grid_parameters.time_steps, grid_parameters.time_step_size, grid_parameters.space_steps_X,
+                grid_parameters.space_step_size_X, grid_parameters.space_steps_Y, grid_parameters.space_step_size_Y,
+                grid_parameters.integrator, grid_parameters.precision)
+
+    def set_init_functions(self, functions):
+        """
+        Sets the initial function of every member.
+
+        :param functions: The initial function of every member. (or one function for all members)
+        """
+
+        if callable(functions):
+            functions = [functions] * len(self.grids)
+
+        for grid, func in zip(self.grids, functions):
+            grid.set_init_function(func)
+
+    def start_split_operator(self):
+        """
+        Starts the 2D simulation of the Schrödinger Poison equation for every member using the split operator method.
+        """
+
+        grid = self.grids[0]
+        grid_parameters = grid.grid_parameters
+        dt = grid_parameters.time_step_size
+        members = len(self.grids)
+        dtype = complex_dtype(grid_parameters)
+        dtype_real = real_dtype(grid_parameters)
+
+        # define operators (which are actually vectors)
+        # Info: The tables are cached for the grid parameters, see Simulator_Core/OperatorCache.py.
+        #       The k=0 mode of the Poisson kernel only adds a (huge) constant to the potential, which is a global
+        #       phase of the state. In single precision it would swallow the rest of the potential, so it is left out.
+        # -------------------------------------------------------------
+        tables = operator_tables(grid_parameters, [grid.x_axis, grid.y_axis], indexing="xy",
+                                 drop_zero_mode=dtype_real != np.float64)
+
+        # one momentum operator for every Strang step of the integrator (shared by all members)
+        weights = tables.weights
+        oprs_k = tables.oprs_k
+
+        # Poisson kernel of every member
+        # Info: The gravity of every member is folded into its kernel, so the position kernels get a gravity of 1.
+        # ------------------------
+        poisson = (self.gravities[:, np.newaxis, np.newaxis] * tables.poisson).astype(dtype_real)
+
+        # static external potential of every member (evaluated only once)
+        # ------------------------
+        shape = grid.grid.shape[1:]
+        batch_shape = (members,) + shape
+        v_ext = np.empty(batch_shape, dtype=dtype_real)
+        for n, potential_function in enumerate(self.potentials):
+            v_ext[n] = np.real(evaluate_on_grid(potential_function, [grid.x_axis, grid.y_axis], "xy"))
+
+        # FFT backend and position kernel selected in the grid parameters
+        # ------------------------
+        fft = create_fft_backend(grid_parameters, shape, dtype, batch_shape=(members,))
+        kernel = create_position_kernel(grid_parameters)
+
+        # preallocated buffers for the stacked states, densities and potentials
+        # Info: The density and the potential always belong to the current states.
+        # ------------------------
+        states = np.empty(batch_shape, dtype=dtype)
+        density = np.empty(batch_shape, dtype=dtype_real)
+        potential = np.empty(batch_shape, dtype=dtype_real)
+
+        # the phases of the batched step (see split_operator_step)
+        # ------------------------
+        phases = StepPhases(fft, kernel, poisson, v_ext, 1, density, potential)
+        lie = grid_parameters.integrator == "lie"
+
+        # set the first states and energies
+        # ------------------------
+        for n, member in enumerate(self.grids):
+            states[n] = member.get_state(0)
+
+        phases.poisson(phases.density(states))
+        energy = np.sum(density, axis=(1, 2), dtype=float)
+        for n, member in enumerate(self.grids):
+            member.energy[0] = energy[n]
+
+        # iterate
+        # Info: The states of the members are advanced in place.
+        # ------------------------
+        for i in range(0, grid_parameters.time_steps - 1):
+
+            split_operator_step(phases, states, potential, dt, oprs_k, weights, lie, states)
+
+            energy = np.sum(density, axis=(1, 2), dtype=float)
+            for n, member in enumerate(self.grids):
+                member.set_state(i + 1, states[n])
+                member.energy[i + 1] = energy[n]
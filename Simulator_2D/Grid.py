@@ -1,221 +1,246 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import warnings
-import imageio.v2 as imageio
-import os
+
+from Simulator_Core.Diagnostics import empty_diagnostics
+from Simulator_Core.OperatorCache import grid_axis
+from Simulator_Core.Precision import complex_dtype
+from Simulator_Core.Profiles import evaluate_on_grid
+from Simulator_Core.Recording import Recorder
 
 
 class Grid:
 
-    def __init__(self, grid_parameters):
+    def __init__(self, grid_parameters, sink=None, snapshots=None):
         """
         The grid on which the simulation is performed.
 
         :param grid_parameters: The parameters for the grid. (dataclass)
+        :param sink: Object with a write(time_step, state) method which receives every snapshot_interval-th state.
+        :param snapshots: Array with every snapshot_interval-th state. (only for the history mode "snapshots")
         """
 
         self.grid_parameters = grid_parameters
-        self.grid = np.zeros(
-            (self.grid_parameters.time_steps, self.grid_parameters.space_steps_X, self.grid_parameters.space_steps_Y),
-            dtype=np.complex_)
+        self.sink = sink
+        self.monitor = None  # Object with a publish(time_step, state) method which receives every state.
+        self.current_time_step = 0
+        self.dtype = complex_dtype(self.grid_parameters)
+
+        # In the "ring" mode only the last history_length time-steps are kept in memory.
+        # The "recorded" mode keeps them like the "ring" mode and records reduced states. (see Simulator_Core.Recording)
+        # The "snapshots" mode wraps already stored (e.g. memory-mapped) snapshots of a finished run.
+        # ---------------------------------------------------------------
+        if self.grid_parameters.history_mode == "full":
+            self.history_length = self.grid_parameters.time_steps
+        elif self.grid_parameters.history_mode in ("ring", "recorded"):
+            self.history_length = self.grid_parameters.history_length
+        elif self.grid_parameters.history_mode == "snapshots":
+            if snapshots is None:
+                raise ValueError("The history mode \"snapshots\" requires snapshots.")
+            self.history_length = len(snapshots)
+            self.current_time_step = (len(snapshots) - 1) * self.grid_parameters.snapshot_interval
+        else:
+            raise ValueError("Unknown history mode: " + str(self.grid_parameters.history_mode))
+
+        if snapshots is not None:
+            self.grid = snapshots
+        else:
+            self.grid = np.zeros(
+                (self.history_length, self.grid_parameters.space_steps_X, self.grid_parameters.space_steps_Y),
+                dtype=self.dtype)
         self.energy = np.zeros(self.grid_parameters.time_steps)
+        # the simulated time of every timestep (set by the simulation if the time step size is adaptive)
+        self.time = np.arange(self.grid_parameters.time_steps) * self.grid_parameters.time_step_size
+        # energies, momentum and center of mass of every diagnostics_interval-th timestep (set by the simulation)
+        self.diagnostics = empty_diagnostics(self.grid_parameters, 2)
         self.method = ""
 
         # Precalculate the x-axis since it is used quite often
         # ---------------------------------------------------------------
-        self.x_axis = np.zeros(self.grid_parameters.space_steps_X, dtype=np.complex_)
-        offset = -1 * int(self.grid_parameters.space_steps_X / 2) * self.grid_parameters.space_step_size_X
-        if (self.grid_parameters.space_steps_X % 2) == 0:
-            offset = offset + (self.grid_parameters.space_step_size_X / 2)
-        for i in range(0, self.grid_parameters.space_steps_X):
-            self.x_axis[i] = offset + i * self.grid_parameters.space_step_size_X
+        self.x_axis = grid_axis(self.grid_parameters.space_steps_X,
+                                self.grid_parameters.space_step_size_X).astype(np.complex128)
         # ---------------------------------------------------------------
 
         # Precalculate the y-axis since it is used quite often
         # ---------------------------------------------------------------
-        self.y_axis = np.zeros(self.grid_parameters.space_steps_Y, dtype=np.complex_)
-        offset = -1 * int(self.grid_parameters.space_steps_Y / 2) * self.grid_parameters.space_step_size_Y
-        if (self.grid_parameters.space_step_size_Y % 2) == 0:
-            offset = offset + (self.grid_parameters.space_step_size_Y / 2)
-        for i in range(0, self.grid_parameters.space_steps_Y):
-            self.y_axis[i] = offset + i * self.grid_parameters.space_step_size_Y
+        # Info: The offset of the y-axis has always been chosen by the step size (not the number of steps).
+        self.y_axis = grid_axis(self.grid_parameters.space_steps_Y, self.grid_parameters.space_step_size_Y,
+                                (self.grid_parameters.space_step_size_Y % 2) == 0).astype(np.complex128)
         # ---------------------------------------------------------------
 
+        self.recorder = None
+        if self.grid_parameters.history_mode == "recorded":
+            self.recorder = Recorder(self.grid_parameters, [self.x_axis, self.y_axis], "xy", dtype=self.dtype)
+
     def set_init_function(self, func, normalize=True):
         """
-        Sets the initial function.
+        Sets the initial function. The function is evaluated once on the real coordinates, directly into the array
+        of the first state. (profiles separably, see Simulator_Core.Profiles)
 
-        :param func: The initial function.
+        :param func: The initial function. (a Profile or a function of the coordinates)
         :param normalize: Set to true if the function should be normalized.
         """
 
-        xv, yv = np.meshgrid(self.x_axis, self.y_axis)
+        state = evaluate_on_grid(func, [self.x_axis, self.y_axis], "xy", out=self.state_buffer(0))
 
         if normalize:
-            self.grid[0] = func(xv, yv) / np.linalg.norm(func(xv, yv))
-        else:
-            self.grid[0] = func(xv, yv)
+            state /= np.linalg.norm(state)
 
-    def print_grid(self):
-        """
-        Prints the grid.
+        self.set_state(0, state)
+
+    def state_buffer(self, time_step):
         """
+        Returns the array in which the state of a timestep will be stored, so the simulation can write it in place.
+        (In the "ring" mode with a history_length of 1 this is the array of the current state.)
 
-        print(np.flipud(self.grid.round(2)))
+        :param time_step: The timestep of the state.
+        """
 
-    # Functions for plotting the system.
-    # ---------------------------------------------------------------
+        return self.grid[time_step % self.history_length]
 
-    def plot_3d(self, time_step=0, square=True, use_for_gif=False):
+    def set_state(self, time_step, state):
         """
-        Funktion prints a 3D wireframe of the system at one specified timestep.
+        Stores the state of the system at a given timestep and hands it to the sink (and the monitor) if required.
 
-        :param time_step: The timestep which should be plotted.
-        :param square: Set to true if the function in the graph should be squared.
-        :param use_for_gif: Only for internal use. (Is set to true when generating a gif.)
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep. (may already be the state buffer of the timestep)
         """
 
-        # Deactivate Warnings while generating gif
-        warnings.filterwarnings('ignore')
+        buffer = self.state_buffer(time_step)
+        if not np.may_share_memory(buffer, state):
+            buffer[...] = state
+        self.current_time_step = time_step
 
-        x, y = np.meshgrid(self.x_axis.real, self.y_axis.real)
+        if self.sink is not None and time_step % self.grid_parameters.snapshot_interval == 0:
+            self.sink.write(time_step, buffer)
+        if self.monitor is not None:
+            self.monitor.publish(time_step, buffer)
+        if self.recorder is not None and time_step % self.recorder.interval == 0:
+            self.recorder.record(time_step, buffer)
 
-        if square:
-            z = np.square(abs(self.grid[time_step]))
-        else:
-            z = self.grid[time_step].real
+    def get_state(self, time_step):
+        """
+        Returns the state of the system at a given timestep.
 
-        # fig = plt.figure(figsize=(10, 7), dpi=90)
-        ax = plt.axes(projection='3d')
-        # ax.contour3D(X, Y, Z, 50, cmap='binary')
-        ax.plot_wireframe(x, y, z, color='teal')
-        # ax.plot_surface(X, Y, Z, rstride=1, cstride=1, cmap='viridis', edgecolor='none')
-        ax.set_xlabel('x-axis')
-        ax.set_ylabel('y-axis')
-        ax.set_zlabel('wave function squared')
-        ax.set_title(self.method + "\ntime-step: " + str(time_step) + " dt=" + str(
-            self.grid_parameters.time_step_size) + " dx=" + str(self.grid_parameters.space_step_size_X) + " dy=" + str(
-            self.grid_parameters.space_step_size_Y))
+        :param time_step: The timestep of the state. (has to be kept in the history of the grid)
+        """
+
+        if time_step not in self.stored_time_steps():
+            raise ValueError("Time-step " + str(time_step) + " is not kept in the history of the grid.")
 
-        if use_for_gif:
-            plt.savefig("./gif/picture_for_giv_" + str(time_step) + ".png", dpi=300)
-            plt.close()
+        if self.grid_parameters.history_mode == "snapshots":
+            return self.grid[time_step // self.grid_parameters.snapshot_interval]
 
-        warnings.filterwarnings('default')
+        return self.grid[time_step % self.history_length]
 
-    def gif(self):
+    def stored_time_steps(self):
         """
-        Makes a gif of the whole system. Consisting of a 3D plot of every timestep.
+        Returns the range of timesteps which are kept in the history of the grid.
         """
 
-        if not os.path.exists("./gif"):
-            os.makedirs("./gif")
+        if self.grid_parameters.history_mode == "snapshots":
+            return range(0, self.current_time_step + 1, self.grid_parameters.snapshot_interval)
 
-        for i in range(0, self.grid_parameters.time_steps):
-            print("Generating picture: (" + str(i + 1) + "/" + str(self.grid_parameters.time_steps) + ")")
-            self.plot_3d(i, True, True)
+        return range(max(0, self.current_time_step - self.history_length + 1), self.current_time_step + 1)
 
-        images = list()
-        for i in range(0, self.grid_parameters.time_steps):
-            images.append(imageio.imread("./gif/picture_for_giv_" + str(i) + ".png"))
-        imageio.mimsave("simulation.gif", images)
+    def plotted_time_steps(self):
+        """
+        Returns the range of timesteps which can be plotted. (the recorded ones in the history mode "recorded")
+        """
 
-    # Funktion to plot one time-step as a 2D heatmap
-    ##############################################################
-    def heatmap(self, time_step=0, square=True, save=False):
+        if self.recorder is not None:
+            return self.recorder.time_steps()
+
+        return self.stored_time_steps()
+
+    def plotted_state(self, time_step):
         """
-        Makes a heatmap of the system at a given timestep.
+        Returns the coordinates of every axis (x, y, z) and the state of a timestep which is plotted. (the reduced
+        record in the history mode "recorded", which is |u|^2 if only the density was recorded)
 
-        :param time_step: The timestep which should be plotted.
-        :param square: Set to true if the system should be squared.
-        :param save: Set true if the plot should be saved instead of shown.
+        :param time_step: The timestep of the state.
         """
 
-        if square:
-            z = np.square(abs(self.grid[time_step]))
-        else:
-            z = self.grid[time_step].real
+        if self.recorder is not None:
+            return self.recorder.axes, self.recorder.get_record(time_step)
 
-        # plt.figure(figsize=(10, 7), dpi=160)
-        plt.imshow(z, cmap='viridis', interpolation='nearest')
-        plt.xlabel("grid points on the x-axis")
-        plt.ylabel("grid points on the y-axis")
-        plt.title("time-step: " + str(time_step) + "\ndt=" + str(self.grid_parameters.time_step_size) + " dx=" + str(
-            self.grid_parameters.space_step_size_X) + " dy=" + str(self.grid_parameters.space_step_size_Y))
-        cbar = plt.colorbar()
-        cbar.set_label('squared wave function value')
+        return [np.real(axis) for axis in [self.x_axis, self.y_axis]], self.get_state(time_step)
 
-        if save:
+    def print_grid(self):
+        """
+        Prints the grid.
+        """
 
-            if not os.path.exists("./pictures"):
-                os.makedirs("./pictures")
+        print(np.flipud(self.grid.round(2)))
 
-            plt.savefig("./pictures/2D-heatmap-" + str(time_step) + ".png", dpi=300)
-            plt.close()
-        else:
-            plt.show()
-            plt.close()
+    # Functions for plotting the system. (see Simulator_2D.Visualization, which is only imported when they are used)
+    # ---------------------------------------------------------------
 
-    def plot_energy_evolution(self, save=False, log=False):
+    def frame(self, time_step, state=None, square=True):
         """
-        Plots the energy evolution of the system.
+        Returns the draw function and its arguments for the 3D wireframe of one timestep. (see FrameRenderer)
 
-        :param save: Set true if the plot should be saved instead of shown.
-        :param log: Set true if the log should be taken for the y-axis.
+        :param time_step: The timestep of the frame.
+        :param state: The wave function at the timestep. (default: the stored state)
+        :param square: Set to true if the function in the graph should be squared.
         """
 
-        time_axis = np.zeros(self.grid_parameters.time_steps)
-        for i in range(0, self.grid_parameters.time_steps):
-            time_axis[i] = i * self.grid_parameters.time_step_size
+        from Simulator_2D.Visualization import frame
+        return frame(self, time_step, state, square)
 
-        if log:
-            plt.plot(time_axis, self.energy)
-            plt.yscale("log")
-        else:
-            plt.ylim([-3, 3])  # kind of
-            plt.plot(time_axis, self.energy)
+    def plot_3d(self, time_step=0, square=True):
+        """
+        Funktion prints a 3D wireframe of the system at one specified timestep.
+
+        :param time_step: The timestep which should be plotted.
+        :param square: Set to true if the function in the graph should be squared.
+        """
 
-        plt.xlabel("time")
-        plt.ylabel("energy")
-        plt.title("Energy Evolution")
+        from Simulator_2D.Visualization import plot_3d
+        plot_3d(self, time_step, square)
 
-        if save:
+    def gif(self, path="simulation.gif", stride=1, fps=10, processes=None):
+        """
+        Makes a gif (or an mp4) of the whole system. Consisting of a 3D plot of every stride-th stored timestep.
+        The frames are rendered in a pool of processes and streamed directly into the file.
 
-            if not os.path.exists("./pictures"):
-                os.makedirs("./pictures")
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param stride: Only every stride-th stored timestep is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+        """
 
-            plt.savefig("./pictures/energy.png", dpi=300)
-            plt.close()
-        else:
-            plt.show()
+        from Simulator_2D.Visualization import gif
+        gif(self, path, stride, fps, processes)
 
-    def plot_3d_potential(self, potential_function, save=False):
+    def heatmap(self, time_step=0, square=True, save=False):
         """
-        Plots the potential as a 3D graph.
+        Makes a heatmap of the system at a given timestep.
 
-        :param potential_function: The potential function which should be plotted.
+        :param time_step: The timestep which should be plotted.
+        :param square: Set to true if the system should be squared.
         :param save: Set true if the plot should be saved instead of shown.
         """
 
-        x, y = np.meshgrid(self.x_axis.real, self.y_axis.real)
-        z = potential_function(x, y)
+        from Simulator_2D.Visualization import heatmap
+        heatmap(self, time_step, square, save)
+
+    def plot_energy_evolution(self, save=False, log=False):
+        """
+        Plots the energy evolution of the system. (the norm sum(|u|^2) if no diagnostics were recorded)
+
+        :param save: Set true if the plot should be saved instead of shown.
+        :param log: Set true if the log should be taken for the y-axis.
+        """
 
-        # fig = plt.figure(figsize=(10, 7), dpi=90)
-        ax = plt.axes(projection='3d')
-        # ax.contour3D(X, Y, Z, 50, cmap='binary')
-        ax.plot_wireframe(x, y, z, color='coral')
-        # ax.plot_surface(X, Y, Z, rstride=1, cstride=1, cmap='viridis', edgecolor='none')
-        ax.set_xlabel('x-axis')
-        ax.set_ylabel('y-axis')
-        ax.set_zlabel('potential')
-        ax.set_title('Potential')
+        from Simulator_Core.Visualization import plot_energy_evolution
+        plot_energy_evolution(self, save, log)
 
-        if save:
+    def plot_3d_potential(self, potential_function, save=False):
+        """
+        Plots the potential as a 3D graph.
 
-            if not os.path.exists("./pictures"):
-                os.makedirs("./pictures")
+        :param potential_function: The potential function which should be plotted.
+        :param save: Set true if the plot should be saved instead of shown.
+        """
 
-            plt.savefig("./pictures/potential.png", dpi=300)
-            plt.close()
-        else:
-            plt.show()
+        from Simulator_2D.Visualization import plot_3d_potential
+        plot_3d_potential(self, potential_function, save)
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from scipy import stats
+
+from Simulator_Core.Profiles import Gaussian
 
 
 @dataclass
@@ -15,18 +16,42 @@ class GridParameters:
     space_steps_Y: int = 190
     space_step_size_Y: float = 0.3
 
-    input_gravity = 10
+    history_mode: str = "full"    # "full" keeps every time-step, "ring" only the last history_length ones
+    history_length: int = 1       # ("recorded" keeps them like "ring" and records reduced states)
+    record_interval: int = 1      # every record_interval-th time-step is recorded (history mode "recorded")
+    record_stride: int = 1        # only every record_stride-th grid point of every axis is recorded
+    record_binning: bool = False  # the mean |u|^2 of blocks of record_stride points (needs record_density)
+    record_region: tuple = ()     # one (min, max) pair of coordinates per axis (x, y, z) to crop the records to
+    record_density: bool = False  # |u|^2 is recorded as float32 instead of the complex wave function
+    snapshot_interval: int = 1    # every snapshot_interval-th time-step is handed to the sink of the grid
+    precision: str = "double"     # "double" (complex128) or "single" (complex64)
 
-    @staticmethod
-    def initial_function(x, y):
-        """
-        The initial function of the system.
+    fft_backend: str = "numpy"    # "numpy", "scipy" or "pyfftw"
+    fft_workers: int = -1         # threads per FFT for "scipy" and "pyfftw" (-1 uses every core)
+    fft_wisdom_file: str = ""     # file in which "pyfftw" caches its plans between runs
+    operator_cache_dir: str = ""  # directory in which the operator tables are cached between runs
+    position_kernel: str = "numpy"    # "numpy", "numexpr" or "numba" (fused position step)
+    engine: str = "numpy"             # "numpy" (Python loop over the time-steps) or "jax" (compiled loop)
+    integrator: str = "lie"           # "lie", "strang", "yoshida4" or "suzuki4"
 
-        :param x: One parameter the function is dependent of.
-        :param y: A second parameter the function is dependent of.
-        """
+    adaptive: bool = False            # adaptive time step size (time_step_size is the first one)
+    tolerance: float = 1e-4           # allowed local error of one adaptive step
+    cfl_number: float = 0.5           # fraction of the phase and momentum resolvable on the grid per step
+    min_time_step_size: float = 1e-6
+    max_time_step_size: float = 1.0
+
+    checkpoint_interval: int = 0      # a checkpoint is written every checkpoint_interval-th time-step (0 = never)
+    checkpoint_file: str = ""         # .npz file of the checkpoint (replaced atomically)
+    diagnostics_interval: int = 0     # energies, momentum and center of mass every n-th time-step (0 = never)
+    absorbing_width: float = 0.0      # width of the absorbing layers at the edges of the grid (0 = periodic)
+    absorbing_strength: float = 1.0   # absorption rate W of the complex potential -iW at the edges of the grid
+    profile: bool = False             # times every phase of a step and prints a report after the run
+    profile_file: str = ""            # .json file for the Chrome trace of the profiled phases (optional)
+
+    input_gravity = 10
 
-        return stats.norm.pdf(x, -4, 1) * stats.norm.pdf(y, -4, 1) + stats.norm.pdf(x, 4, 1) * stats.norm.pdf(y, 4, 1)
+    # The initial function of the system. (a profile, see Simulator_Core.Profiles, or a function of x and y)
+    initial_function = Gaussian((-4, -4)) + Gaussian((4, 4))
 
     @staticmethod
     def potential_function(x, y, u=0):
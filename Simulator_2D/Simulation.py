@@ -1,33 +1,38 @@
-import numpy as np
-import math
+from Simulator_Core.SplitOperator import SplitOperatorSimulation
 
 
-class Simulation:
+class Simulation(SplitOperatorSimulation):
 
-    def __init__(self, grid, gravity, potential=lambda x=0: 0):
+    # Info: The 2D grid uses meshgrid(x, y), so the first axis of the states belongs to y.
+    indexing = "xy"
+
+    def __init__(self, grid, gravity, potential=lambda x=0, y=0: 0):
         """
-        Class that carries out the actual simulation.
+        Class that carries out the actual simulation. (see SplitOperatorSimulation)
 
         :param grid: The grid on which the simulation is carried out.
         :param potential: The potential function used for the simulation. (default 0)
         :param gravity: The "gravity" of the system. (How much the waves attract one another.)
         """
 
-        self.grid = grid
-        self.potential = potential
-        self.gravity = gravity
+        super().__init__(grid, gravity, potential)
 
-    # Some wrapper functions
-    ##################################
-    def set_init_function(self, func):
+    def axes(self):
+        """
+        Returns the coordinates of the x- and the y-axis of the grid.
         """
-        Sets the initial function of the system.
 
-        :param func: The function to which the initial function should be set to. (wrapper function)
+        return [self.grid.x_axis, self.grid.y_axis]
+
+    def spacings(self):
+        """
+        Returns the space step sizes in the order of the axes of the states. (y, x)
         """
 
-        self.grid.set_init_function(func)
+        return self.grid.grid_parameters.space_step_size_Y, self.grid.grid_parameters.space_step_size_X
 
+    # Some wrapper functions
+    ##################################
     def plot_3d(self, time_step=0, square=True):
         """
         Funktion prints a 3D wireframe of the system at one specified timestep. (wrapper function)
@@ -59,12 +64,18 @@ class Simulation:
 
         self.grid.plot_energy_evolution(save, log)
 
-    def gif(self):
+    def gif(self, path="simulation.gif", stride=1, fps=10, processes=None):
         """
-        Makes a gif of the whole system. Consisting of a 3D plot of every timestep. (wrapper function)
+        Makes a gif (or an mp4) of the whole system. Consisting of a 3D plot of every stride-th stored timestep.
+        (wrapper function)
+
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param stride: Only every stride-th stored timestep is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
         """
 
-        self.grid.gif()
+        self.grid.gif(path, stride, fps, processes)
 
     def plot_3d_potential(self, save=False):
         """
@@ -73,72 +84,4 @@ class Simulation:
         :param save: Set true if the plot should be saved instead of shown.
         """
 
-        self.grid.plot_3d_potential(save)
-
-    def start_split_operator(self):
-        """
-        Starts the 2D simulation of the Schrödinger Poison equation using the split operator method.
-        """
-
-        dt = self.grid.grid_parameters.time_step_size
-
-        # define operators (which are actually vectors)
-        # -------------------------------------------------------------
-        xv, yv = np.meshgrid(self.grid.x_axis, self.grid.y_axis)
-        v = self.potential(xv, yv)
-        opr_r = np.power(math.e, -1 * 1j * v * dt)
-
-        # Info: From k = (2*pi)/L | The 2 vanishes since the grid is divided in half.
-        space_steps_x = self.grid.grid_parameters.space_steps_X
-        kx = np.fft.fftfreq(space_steps_x) * (space_steps_x / 2) * math.pi / self.grid.x_axis[-1]
-
-        # Info: From k = (2*pi)/L | The 2 vanishes since the grid is divided in half.
-        space_steps_y = self.grid.grid_parameters.space_steps_Y
-        ky = np.fft.fftfreq(space_steps_y) * (space_steps_y / 2) * math.pi / self.grid.y_axis[-1]
-
-        k = np.meshgrid(kx, ky)
-        k = np.array(k)
-        k = np.sqrt(np.power(k[0], 2) + np.power(k[1], 2))
-        k[0][0] = 0.0001
-
-        opr_k = np.power(math.e, -0.5 * 1j * np.power(k, 2) * dt)
-
-        # meshgrid for 2D-Potential
-        # ------------------------
-        x, y = np.meshgrid(self.grid.x_axis.real, self.grid.y_axis.real)
-
-        # set the first energy
-        # ------------------------
-        self.grid.energy[0] = np.sum(np.square(np.abs(self.grid.grid[0])))
-
-        # iterate
-        # ------------------------
-        for i in range(0, self.grid.grid_parameters.time_steps - 1):
-
-            # FFT
-            # ------------------------
-            tmp = np.fft.fft2(self.grid.grid[i])
-            v = np.fft.fft2(np.abs(np.power(self.grid.grid[i], 2)))
-
-            # Poisson
-            # ------------------------
-            v = (-1 / (np.power(np.abs(k), 2))) * v  # (np.power(np.abs(k)
-
-            # Momentum
-            # ------------------------
-            tmp = tmp * opr_k
-
-            # IFFT
-            # ------------------------
-            tmp = np.fft.ifft2(tmp)
-            v = np.fft.ifft2(v)
-
-            # Position
-            # ------------------------
-            v = v * self.gravity + self.potential(x, y)
-            opr_r = np.power(math.e, -1 * 1j * v * dt)
-            tmp = tmp * opr_r
-
-            self.grid.grid[i + 1] = tmp
-
-            self.grid.energy[i + 1] = np.sum(np.square(np.abs(self.grid.grid[i + 1])))
+        self.grid.plot_3d_potential(self.potential, save)
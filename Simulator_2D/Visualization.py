@@ -0,0 +1,149 @@
+import numpy as np
+import matplotlib.pyplot as plt
+import warnings
+
+from Simulator_Core.FrameRenderer import FrameRenderer
+from Simulator_Core.Recording import plot_values
+from Simulator_Core.Visualization import save_or_show
+
+
+# Plots of the 2D grid. (imported by the plotting methods of the grid, so a run without plots does not load matplotlib)
+# ---------------------------------------------------------------
+
+def frame(grid, time_step, state=None, square=True):
+    """
+    Returns the draw function and its arguments for the 3D wireframe of one timestep. (see FrameRenderer)
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep of the frame.
+    :param state: The wave function at the timestep. (default: the plotted state, see Grid.plotted_state)
+    :param square: Set to true if the function in the graph should be squared.
+    """
+
+    if state is None:
+        (x_axis, y_axis), state = grid.plotted_state(time_step)
+    else:
+        x_axis, y_axis = grid.x_axis.real, grid.y_axis.real
+
+    x, y = np.meshgrid(x_axis, y_axis)
+    z = np.array(plot_values(state, square))
+
+    title = grid.method + "\ntime-step: " + str(time_step) + " dt=" + str(
+        grid.grid_parameters.time_step_size) + " dx=" + str(grid.grid_parameters.space_step_size_X) + " dy=" + str(
+        grid.grid_parameters.space_step_size_Y)
+
+    return draw_wireframe, (x, y, z, title)
+
+
+def plot_3d(grid, time_step=0, square=True):
+    """
+    Funktion prints a 3D wireframe of the system at one specified timestep.
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep which should be plotted.
+    :param square: Set to true if the function in the graph should be squared.
+    """
+
+    # Deactivate Warnings while plotting
+    warnings.filterwarnings('ignore')
+
+    draw, arguments = frame(grid, time_step, square=square)
+    draw(*arguments)
+
+    warnings.filterwarnings('default')
+
+
+def gif(grid, path="simulation.gif", stride=1, fps=10, processes=None):
+    """
+    Makes a gif (or an mp4) of the whole system. Consisting of a 3D plot of every stride-th stored timestep.
+    The frames are rendered in a pool of processes and streamed directly into the file.
+
+    :param grid: The grid of the run.
+    :param path: The file of the animation. (".gif" or ".mp4")
+    :param stride: Only every stride-th stored timestep is rendered.
+    :param fps: The frames per second of an mp4 file.
+    :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+    """
+
+    renderer = FrameRenderer(path, fps, processes)
+
+    time_steps = grid.plotted_time_steps()[::stride]
+    for n, i in enumerate(time_steps):
+        print("Rendering frame: (" + str(n + 1) + "/" + str(len(time_steps)) + ")")
+        renderer.submit(*frame(grid, i))
+
+    renderer.close()
+
+
+def heatmap(grid, time_step=0, square=True, save=False):
+    """
+    Makes a heatmap of the system at a given timestep.
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep which should be plotted.
+    :param square: Set to true if the system should be squared.
+    :param save: Set true if the plot should be saved instead of shown.
+    """
+
+    (x_axis, y_axis), state = grid.plotted_state(time_step)
+    z = plot_values(state, square)
+
+    # plt.figure(figsize=(10, 7), dpi=160)
+    # Info: The first axis of the states belongs to y, so it is drawn vertically.
+    plt.imshow(z, cmap='viridis', interpolation='nearest', origin='lower',
+               extent=(x_axis[0], x_axis[-1], y_axis[0], y_axis[-1]))
+    plt.xlabel("x")
+    plt.ylabel("y")
+    plt.title("time-step: " + str(time_step) + "\ndt=" + str(grid.grid_parameters.time_step_size) + " dx=" + str(
+        grid.grid_parameters.space_step_size_X) + " dy=" + str(grid.grid_parameters.space_step_size_Y))
+    cbar = plt.colorbar()
+    cbar.set_label('squared wave function value')
+
+    save_or_show("2D-heatmap-" + str(time_step) + ".png" if save else "")
+
+
+def plot_3d_potential(grid, potential_function, save=False):
+    """
+    Plots the potential as a 3D graph.
+
+    :param grid: The grid of the run.
+    :param potential_function: The potential function which should be plotted.
+    :param save: Set true if the plot should be saved instead of shown.
+    """
+
+    x, y = np.meshgrid(grid.x_axis.real, grid.y_axis.real)
+    z = np.broadcast_to(np.real(potential_function(x, y)), x.shape)
+
+    # fig = plt.figure(figsize=(10, 7), dpi=90)
+    ax = plt.axes(projection='3d')
+    # ax.contour3D(X, Y, Z, 50, cmap='binary')
+    ax.plot_wireframe(x, y, z, color='coral')
+    # ax.plot_surface(X, Y, Z, rstride=1, cstride=1, cmap='viridis', edgecolor='none')
+    ax.set_xlabel('x-axis')
+    ax.set_ylabel('y-axis')
+    ax.set_zlabel('potential')
+    ax.set_title('Potential')
+
+    save_or_show("potential.png" if save else "", close=False)
+
+
+def draw_wireframe(x, y, z, title):
+    """
+    Draws a 3D wireframe of the system onto the current pyplot figure. (module level, so it can be sent to the
+    rendering processes)
+
+    :param x: The x-coordinates of the grid points.
+    :param y: The y-coordinates of the grid points.
+    :param z: The (squared) wave function at the grid points.
+    :param title: The title of the plot.
+    """
+
+    # fig = plt.figure(figsize=(10, 7), dpi=90)
+    ax = plt.axes(projection='3d')
+    # ax.contour3D(X, Y, Z, 50, cmap='binary')
+    ax.plot_wireframe(x, y, z, color='teal')
+    # ax.plot_surface(X, Y, Z, rstride=1, cstride=1, cmap='viridis', edgecolor='none')
+    ax.set_xlabel('x-axis')
+    ax.set_ylabel('y-axis')
+    ax.set_zlabel('wave function squared')
+    ax.set_title(title)
@@ -5,10 +5,20 @@ from Simulator_2D.Simulation import Simulation
 grid_parameters = GridParameters()
 grid = Grid(grid_parameters)
 
+# Info: Renders every 5th handed over state into an mp4 while the simulation is running.
+# from Simulator_Core.FrameRenderer import AnimationSink
+# grid.sink = AnimationSink("simulation.mp4", grid.frame, stride=5)
+
+# Info: Publishes every 10th state for the live viewer. (python -m Simulator_Core.LiveMonitor <name>)
+# from Simulator_Core.LiveMonitor import LiveMonitor
+# grid.monitor = LiveMonitor(grid, 10)
+
 my_sym = Simulation(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
 my_sym.set_init_function(grid_parameters.initial_function)
 
 my_sym.start_split_operator()
+# grid.sink.close()
+# grid.monitor.close()
 
 # my_sym.gif()
 
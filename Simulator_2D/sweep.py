@@ -0,0 +1,20 @@
+from Simulator_2D.GridParameters import GridParameters
+from Simulator_Core.ParameterSweep import run_sweep
+from Simulator_Core.Profiles import Gaussian
+
+
+# Two Gaussians with a distance of 4 on the diagonal.
+gaussians_close = Gaussian((-2, -2)) + Gaussian((2, 2))
+
+# Two Gaussians with a distance of 8 on the diagonal.
+gaussians_far = Gaussian((-4, -4)) + Gaussian((4, 4))
+
+
+if __name__ == "__main__":
+    grid_parameters = GridParameters(time_steps=201, space_steps_X=96, space_steps_Y=96)
+
+    variations = {"gravity": [1, 5, 10, 20],
+                  "time_step_size": [0.1, 0.05],
+                  "initial_function": [gaussians_close, gaussians_far]}
+
+    run_sweep(grid_parameters, variations, "./sweep", threads_per_worker=1, snapshot_time_steps=[0, 100, 200])
@@ -0,0 +1,220 @@
+import numpy as np
+
+from Simulator_Core.Diagnostics import empty_diagnostics
+from Simulator_Core.OperatorCache import grid_axis
+from Simulator_Core.Precision import complex_dtype
+from Simulator_Core.Profiles import evaluate_on_grid
+from Simulator_Core.Recording import Recorder
+
+
+class Grid:
+
+    def __init__(self, grid_parameters, sink=None, snapshots=None):
+        """
+        The grid on which the simulation is performed. (the states have the shape (X, Y, Z))
+
+        :param grid_parameters: The parameters for the grid. (dataclass)
+        :param sink: Object with a write(time_step, state) method which receives every snapshot_interval-th state.
+        :param snapshots: Array with every snapshot_interval-th state. (only for the history mode "snapshots")
+        """
+
+        self.grid_parameters = grid_parameters
+        self.sink = sink
+        self.monitor = None  # Object with a publish(time_step, state) method which receives every state.
+        self.current_time_step = 0
+        self.dtype = complex_dtype(self.grid_parameters)
+
+        # In the "ring" mode only the last history_length time-steps are kept in memory.
+        # The "recorded" mode keeps them like the "ring" mode and records reduced states. (see Simulator_Core.Recording)
+        # The "snapshots" mode wraps already stored (e.g. memory-mapped) snapshots of a finished run.
+        # ---------------------------------------------------------------
+        if self.grid_parameters.history_mode == "full":
+            self.history_length = self.grid_parameters.time_steps
+        elif self.grid_parameters.history_mode in ("ring", "recorded"):
+            self.history_length = self.grid_parameters.history_length
+        elif self.grid_parameters.history_mode == "snapshots":
+            if snapshots is None:
+                raise ValueError("The history mode \"snapshots\" requires snapshots.")
+            self.history_length = len(snapshots)
+            self.current_time_step = (len(snapshots) - 1) * self.grid_parameters.snapshot_interval
+        else:
+            raise ValueError("Unknown history mode: " + str(self.grid_parameters.history_mode))
+
+        if snapshots is not None:
+            self.grid = snapshots
+        else:
+            self.grid = np.zeros((self.history_length, self.grid_parameters.space_steps_X,
+                                  self.grid_parameters.space_steps_Y, self.grid_parameters.space_steps_Z),
+                                 dtype=self.dtype)
+        self.energy = np.zeros(self.grid_parameters.time_steps)
+        # the simulated time of every timestep (set by the simulation if the time step size is adaptive)
+        self.time = np.arange(self.grid_parameters.time_steps) * self.grid_parameters.time_step_size
+        # energies, momentum and center of mass of every diagnostics_interval-th timestep (set by the simulation)
+        self.diagnostics = empty_diagnostics(self.grid_parameters, 3)
+        self.method = ""
+
+        # Precalculate the axes since they are used quite often
+        # ---------------------------------------------------------------
+        self.x_axis = grid_axis(self.grid_parameters.space_steps_X, self.grid_parameters.space_step_size_X)
+        self.y_axis = grid_axis(self.grid_parameters.space_steps_Y, self.grid_parameters.space_step_size_Y)
+        self.z_axis = grid_axis(self.grid_parameters.space_steps_Z, self.grid_parameters.space_step_size_Z)
+
+        self.recorder = None
+        if self.grid_parameters.history_mode == "recorded":
+            self.recorder = Recorder(self.grid_parameters, [self.x_axis, self.y_axis, self.z_axis], dtype=self.dtype)
+
+    def meshgrid(self):
+        """
+        Returns the coordinates of every grid point. (three arrays with the shape of one state)
+        """
+
+        return np.meshgrid(self.x_axis, self.y_axis, self.z_axis, indexing="ij")
+
+    def set_init_function(self, func, normalize=True):
+        """
+        Sets the initial function. The function is evaluated once on the real coordinates, directly into the array
+        of the first state. (profiles separably, see Simulator_Core.Profiles)
+
+        :param func: The initial function. (a Profile or a function of the coordinates)
+        :param normalize: Set to true if the function should be normalized.
+        """
+
+        state = evaluate_on_grid(func, [self.x_axis, self.y_axis, self.z_axis], out=self.state_buffer(0))
+
+        if normalize:
+            state /= np.linalg.norm(state)
+
+        self.set_state(0, state)
+
+    def state_buffer(self, time_step):
+        """
+        Returns the array in which the state of a timestep will be stored, so the simulation can write it in place.
+        (In the "ring" mode with a history_length of 1 this is the array of the current state.)
+
+        :param time_step: The timestep of the state.
+        """
+
+        return self.grid[time_step % self.history_length]
+
+    def set_state(self, time_step, state):
+        """
+        Stores the state of the system at a given timestep and hands it to the sink (and the monitor) if required.
+
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep. (may already be the state buffer of the timestep)
+        """
+
+        buffer = self.state_buffer(time_step)
+        if not np.may_share_memory(buffer, state):
+            buffer[...] = state
+        self.current_time_step = time_step
+
+        if self.sink is not None and time_step % self.grid_parameters.snapshot_interval == 0:
+            self.sink.write(time_step, buffer)
+        if self.monitor is not None:
+            self.monitor.publish(time_step, buffer)
+        if self.recorder is not None and time_step % self.recorder.interval == 0:
+            self.recorder.record(time_step, buffer)
+
+    def get_state(self, time_step):
+        """
+        Returns the state of the system at a given timestep.
+
+        :param time_step: The timestep of the state. (has to be kept in the history of the grid)
+        """
+
+        if time_step not in self.stored_time_steps():
+            raise ValueError("Time-step " + str(time_step) + " is not kept in the history of the grid.")
+
+        if self.grid_parameters.history_mode == "snapshots":
+            return self.grid[time_step // self.grid_parameters.snapshot_interval]
+
+        return self.grid[time_step % self.history_length]
+
+    def stored_time_steps(self):
+        """
+        Returns the range of timesteps which are kept in the history of the grid.
+        """
+
+        if self.grid_parameters.history_mode == "snapshots":
+            return range(0, self.current_time_step + 1, self.grid_parameters.snapshot_interval)
+
+        return range(max(0, self.current_time_step - self.history_length + 1), self.current_time_step + 1)
+
+    def plotted_time_steps(self):
+        """
+        Returns the range of timesteps which can be plotted. (the recorded ones in the history mode "recorded")
+        """
+
+        if self.recorder is not None:
+            return self.recorder.time_steps()
+
+        return self.stored_time_steps()
+
+    def plotted_state(self, time_step):
+        """
+        Returns the coordinates of every axis (x, y, z) and the state of a timestep which is plotted. (the reduced
+        record in the history mode "recorded", which is |u|^2 if only the density was recorded)
+
+        :param time_step: The timestep of the state.
+        """
+
+        if self.recorder is not None:
+            return self.recorder.axes, self.recorder.get_record(time_step)
+
+        return [np.real(axis) for axis in [self.x_axis, self.y_axis, self.z_axis]], self.get_state(time_step)
+
+    # Functions for plotting the system. (see Simulator_3D.Visualization, which is only imported when they are used)
+    # ---------------------------------------------------------------
+
+    def frame(self, time_step, state=None, axis=2, square=True):
+        """
+        Returns the draw function and its arguments for the projected heatmap of one timestep. (see FrameRenderer)
+
+        :param time_step: The timestep of the frame.
+        :param state: The wave function at the timestep. (default: the stored state)
+        :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+        :param square: Set to true if the system should be squared.
+        """
+
+        from Simulator_3D.Visualization import frame
+        return frame(self, time_step, state, axis, square)
+
+    def heatmap(self, time_step=0, square=True, save=False, axis=2):
+        """
+        Makes a heatmap of the system at a given timestep, projected along one axis. (column density)
+
+        :param time_step: The timestep which should be plotted.
+        :param square: Set to true if the system should be squared.
+        :param save: Set true if the plot should be saved instead of shown.
+        :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+        """
+
+        from Simulator_3D.Visualization import heatmap
+        heatmap(self, time_step, square, save, axis)
+
+    def gif(self, axis=2, path="simulation.gif", stride=1, fps=10, processes=None):
+        """
+        Makes a gif (or an mp4) of the whole system. Consisting of a projected heatmap of every stride-th stored
+        timestep. The frames are rendered in a pool of processes and streamed directly into the file.
+
+        :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param stride: Only every stride-th stored timestep is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+        """
+
+        from Simulator_3D.Visualization import gif
+        gif(self, axis, path, stride, fps, processes)
+
+    def plot_energy_evolution(self, save=False, log=False):
+        """
+        Plots the energy evolution of the system. (the norm sum(|u|^2) if no diagnostics were recorded)
+
+        :param save: Set true if the plot should be saved instead of shown.
+        :param log: Set true if the log should be taken for the y-axis.
+        """
+
+        from Simulator_Core.Visualization import plot_energy_evolution
+        plot_energy_evolution(self, save, log)
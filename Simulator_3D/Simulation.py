@@ -0,0 +1,71 @@
+from Simulator_Core.SplitOperator import SplitOperatorSimulation
+
+
+class Simulation(SplitOperatorSimulation):
+
+    # Info: The k=0 mode of the Poisson kernel is always left out in 3D.
+    drop_zero_mode = True
+
+    def __init__(self, grid, gravity, potential=lambda x=0, y=0, z=0: 0):
+        """
+        Class that carries out the actual simulation. (see SplitOperatorSimulation)
+
+        :param grid: The grid on which the simulation is carried out.
+        :param potential: The potential function used for the simulation. (default 0)
+        :param gravity: The "gravity" of the system. (How much the waves attract one another.)
+        """
+
+        super().__init__(grid, gravity, potential)
+
+    def axes(self):
+        """
+        Returns the coordinates of the x-, y- and z-axis of the grid.
+        """
+
+        return [self.grid.x_axis, self.grid.y_axis, self.grid.z_axis]
+
+    def spacings(self):
+        """
+        Returns the space step sizes in the order of the axes of the states. (x, y, z)
+        """
+
+        grid_parameters = self.grid.grid_parameters
+        return grid_parameters.space_step_size_X, grid_parameters.space_step_size_Y, grid_parameters.space_step_size_Z
+
+    # Some wrapper functions
+    ##################################
+    def heatmap(self, time_step=0, square=True, save=False, axis=2):
+        """
+        Makes a heatmap of the system at a given timestep, projected along one axis. (wrapper function)
+
+        :param time_step: The timestep which should be plotted.
+        :param square: Set to true if the system should be squared.
+        :param save: Set true if the plot should be saved instead of shown.
+        :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+        """
+
+        self.grid.heatmap(time_step, square, save, axis)
+
+    def plot_energy_evolution(self, save=False, log=False):
+        """
+        Plots the energy evolution of the system. (wrapper function)
+
+        :param save: Set true if the plot should be saved instead of shown.
+        :param log: Set true if the log should be taken for the y-axis.
+        """
+
+        self.grid.plot_energy_evolution(save, log)
+
+    def gif(self, axis=2, path="simulation.gif", stride=1, fps=10, processes=None):
+        """
+        Makes a gif (or an mp4) of the whole system. Consisting of a projected heatmap of every stride-th stored
+        timestep. (wrapper function)
+
+        :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param stride: Only every stride-th stored timestep is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+        """
+
+        self.grid.gif(axis, path, stride, fps, processes)
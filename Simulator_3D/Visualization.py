@@ -0,0 +1,101 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from Simulator_Core.FrameRenderer import FrameRenderer
+from Simulator_Core.Recording import plot_values
+from Simulator_Core.Visualization import save_or_show
+
+
+# Plots of the 3D grid. (imported by the plotting methods of the grid, so a run without plots does not load matplotlib)
+# ---------------------------------------------------------------
+
+def frame(grid, time_step, state=None, axis=2, square=True):
+    """
+    Returns the draw function and its arguments for the projected heatmap of one timestep. (see FrameRenderer)
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep of the frame.
+    :param state: The wave function at the timestep. (default: the plotted state, see Grid.plotted_state)
+    :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+    :param square: Set to true if the system should be squared.
+    """
+
+    if state is None:
+        axes, state = grid.plotted_state(time_step)
+    else:
+        axes = [grid.x_axis, grid.y_axis, grid.z_axis]
+
+    z = np.sum(plot_values(state, square), axis=axis)
+
+    labels = [name for n, name in enumerate(["x", "y", "z"]) if n != axis]
+    vertical, horizontal = [coordinates for n, coordinates in enumerate(axes) if n != axis]
+    extent = (horizontal[0], horizontal[-1], vertical[0], vertical[-1])
+    title = ("time-step: " + str(time_step) + " time: " + str(round(grid.time[time_step], 3)) +
+             "\ndx=" + str(grid.grid_parameters.space_step_size_X) + " dy=" +
+             str(grid.grid_parameters.space_step_size_Y) + " dz=" + str(grid.grid_parameters.space_step_size_Z))
+
+    return draw_projection, (z, labels, title, extent)
+
+
+def heatmap(grid, time_step=0, square=True, save=False, axis=2):
+    """
+    Makes a heatmap of the system at a given timestep, projected along one axis. (column density)
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep which should be plotted.
+    :param square: Set to true if the system should be squared.
+    :param save: Set true if the plot should be saved instead of shown.
+    :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+    """
+
+    draw, arguments = frame(grid, time_step, axis=axis, square=square)
+    draw(*arguments)
+
+    save_or_show("3D-heatmap-" + str(time_step) + ".png" if save else "")
+
+
+def gif(grid, axis=2, path="simulation.gif", stride=1, fps=10, processes=None):
+    """
+    Makes a gif (or an mp4) of the whole system. Consisting of a projected heatmap of every stride-th stored
+    timestep. The frames are rendered in a pool of processes and streamed directly into the file.
+
+    :param grid: The grid of the run.
+    :param axis: The axis along which the system is summed up. (0 = x, 1 = y, 2 = z)
+    :param path: The file of the animation. (".gif" or ".mp4")
+    :param stride: Only every stride-th stored timestep is rendered.
+    :param fps: The frames per second of an mp4 file.
+    :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+    """
+
+    renderer = FrameRenderer(path, fps, processes)
+
+    time_steps = grid.plotted_time_steps()[::stride]
+    for n, i in enumerate(time_steps):
+        print("Rendering frame: (" + str(n + 1) + "/" + str(len(time_steps)) + ")")
+        renderer.submit(*frame(grid, i, axis=axis))
+
+    renderer.close()
+
+
+def draw_projection(z, labels, title, extent=None):
+    """
+    Draws the heatmap of a projected state onto the current pyplot figure. (module level, so it can be sent to the
+    rendering processes)
+
+    :param z: The projected (squared) wave function.
+    :param labels: The names of the two remaining axes.
+    :param title: The title of the plot.
+    :param extent: The first and last coordinates of the horizontal and the vertical axis. (default: grid points)
+    """
+
+    # Info: imshow draws the first axis of the array vertically.
+    plt.imshow(z, cmap='viridis', interpolation='nearest', origin='lower', extent=extent)
+    if extent is None:
+        plt.xlabel("grid points on the " + labels[1] + "-axis")
+        plt.ylabel("grid points on the " + labels[0] + "-axis")
+    else:
+        plt.xlabel(labels[1])
+        plt.ylabel(labels[0])
+    plt.title(title)
+    cbar = plt.colorbar()
+    cbar.set_label('projected squared wave function value')
@@ -0,0 +1,23 @@
+from Simulator_3D.GridParameters import GridParameters
+from Simulator_3D.Grid import Grid
+from Simulator_3D.Simulation import Simulation
+from Simulator_Core.Precision import complex_dtype
+from Simulator_Core.SnapshotStore import NpySnapshotWriter, load_snapshots
+
+grid_parameters = GridParameters()
+
+# Info: The grid only keeps the current state, every snapshot_interval-th state is streamed to the disk.
+sink = NpySnapshotWriter("./run_3d", grid_parameters, dtype=complex_dtype(grid_parameters))
+grid = Grid(grid_parameters, sink)
+
+my_sym = Simulation(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+my_sym.set_init_function(grid_parameters.initial_function)
+
+my_sym.start_split_operator()
+sink.close(grid.energy, grid.time)
+
+stored = load_snapshots("./run_3d")
+stored.heatmap(0, True, True)
+stored.heatmap(100, True, True)
+stored.heatmap(200, True, True)
+# stored.gif()
@@ -0,0 +1,95 @@
+import numpy as np
+
+
+# The number of masks (one per time step size) which are kept. (adaptive runs change the time step size every step)
+MASK_CACHE_SIZE = 16
+
+
+def layer_depth(axis, width):
+    """
+    Returns how deep every grid point of an axis lies in the absorbing layers at both ends of the axis. (0 inside)
+
+    :param axis: The coordinates of the grid points of the axis.
+    :param width: The width of the absorbing layers.
+    """
+
+    axis = np.real(axis)
+
+    return np.maximum(axis[0] + width - axis, 0) + np.maximum(axis - (axis[-1] - width), 0)
+
+
+def create_absorbing_boundary(grid_parameters, axes, indexing="ij", dtype=float):
+    """
+    Creates the absorbing boundary selected in the grid parameters. Returns None if the grid is periodic.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param axes: The coordinates of every axis (x, y, z) of the grid.
+    :param indexing: The indexing of the states. ("xy" for the 2D grid, whose first axis is the y-axis)
+    :param dtype: The real data type of the masks.
+    """
+
+    if grid_parameters.absorbing_width <= 0:
+        return None
+
+    return AbsorbingBoundary(axes, grid_parameters.absorbing_width, grid_parameters.absorbing_strength, indexing,
+                             dtype)
+
+
+class AbsorbingBoundary:
+
+    def __init__(self, axes, width, strength, indexing="ij", dtype=float):
+        """
+        Absorbing layers at the edges of the (periodic) grid, so matter which leaves the grid is removed instead of
+        coming back on the other side.
+
+        The layers are a complex absorbing potential -i W with W = strength * (depth / width)^2, which rises from 0
+        at the inner edge of a layer to the strength at the edge of the grid. (summed over the axes in the corners)
+        It is applied as the mask exp(-W dt) of the whole time step after the last momentum step of every step, so
+        the density still belongs to the state. (A mask per Strang step would use the weights of the fourth order
+        integrators, which can be negative and would amplify the state in the layers. The absorption is therefore
+        only first order accurate in time, which does not matter for a layer that only has to remove matter.)
+
+        :param axes: The coordinates of every axis (x, y, z) of the grid.
+        :param width: The width of the absorbing layers.
+        :param strength: The absorption rate at the edges of the grid.
+        :param indexing: The indexing of the states. ("xy" for the 2D grid, whose first axis is the y-axis)
+        :param dtype: The real data type of the masks.
+        """
+
+        for axis in axes:
+            if 2 * width >= np.real(axis[-1] - axis[0]):
+                raise ValueError("The absorbing layers are wider than the grid.")
+
+        depths = [np.square(layer_depth(axis, width) / width) for axis in axes]
+        self.absorption = strength * sum(np.meshgrid(*depths, indexing=indexing, sparse=True))
+        self.dtype = dtype
+        self.masks = {}
+
+    def mask(self, time_step_size):
+        """
+        Returns the (cached) mask exp(-W dt) of a time step size.
+
+        :param time_step_size: The time step size.
+        """
+
+        mask = self.masks.get(time_step_size)
+
+        if mask is None:
+            if len(self.masks) >= MASK_CACHE_SIZE:
+                self.masks.clear()
+            mask = np.exp(-self.absorption * time_step_size).astype(self.dtype)
+            self.masks[time_step_size] = mask
+
+        return mask
+
+    def apply(self, state, time_step_size):
+        """
+        Absorbs the part of a state which lies in the layers. (in place)
+
+        :param state: The wave function.
+        :param time_step_size: The time step size.
+        """
+
+        np.multiply(state, self.mask(time_step_size), out=state)
+
+        return state
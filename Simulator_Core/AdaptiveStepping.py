@@ -0,0 +1,64 @@
+import numpy as np
+import math
+
+
+def step_doubling_error(state_coarse, state_fine, order):
+    """
+    Estimates the local error of the two half steps from the difference to one full step. (Richardson)
+
+    :param state_coarse: The wave function after one step of dt.
+    :param state_fine: The wave function after two steps of dt/2.
+    :param order: The order of the integrator.
+    """
+
+    return np.linalg.norm(state_fine - state_coarse) / np.linalg.norm(state_fine) / (2 ** order - 1)
+
+
+def cfl_time_step_size(potential, spacings, k_max, cfl_number):
+    """
+    Returns the largest time step size for which the position step exp(-i V dt) stays resolved on the grid.
+    The phase of the step has to stay below cfl_number * pi and the momentum kick dt * |grad V| below
+    cfl_number * k_max. (The mean of the potential only adds a global phase and is ignored.)
+
+    :param potential: The whole potential of the position step. (gravity * Poisson potential + external potential)
+    :param spacings: The grid spacing of every axis of the potential.
+    :param k_max: The largest wave number of the grid.
+    :param cfl_number: The fraction of the resolvable phase and momentum which may be used by one step.
+    """
+
+    v = potential - np.mean(potential)
+
+    gradients = np.gradient(v, *spacings)
+    if v.ndim == 1:
+        gradients = [gradients]
+    gradient_max = math.sqrt(np.max(sum(np.square(gradient) for gradient in gradients)))
+    v_max = np.max(np.abs(v))
+
+    time_step_size = math.inf
+    if v_max > 0:
+        time_step_size = min(time_step_size, cfl_number * math.pi / v_max)
+    if gradient_max > 0:
+        time_step_size = min(time_step_size, cfl_number * k_max / gradient_max)
+
+    return time_step_size
+
+
+def next_time_step_size(time_step_size, error, tolerance, order, safety=0.9, min_factor=0.2, max_factor=5.0):
+    """
+    Returns the time step size for the next try from the error of the last one.
+
+    :param time_step_size: The time step size of the last try.
+    :param error: The estimated local error of the last try.
+    :param tolerance: The allowed local error of one step.
+    :param order: The order of the integrator. (the local error scales with dt^(order + 1))
+    :param safety: Factor which keeps the next error a bit below the tolerance.
+    :param min_factor: The largest factor by which the time step size shrinks.
+    :param max_factor: The largest factor by which the time step size grows.
+    """
+
+    if error == 0:
+        return time_step_size * max_factor
+
+    factor = safety * (tolerance / error) ** (1 / (order + 1))
+
+    return time_step_size * min(max_factor, max(min_factor, factor))
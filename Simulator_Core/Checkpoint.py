@@ -0,0 +1,131 @@
+import numpy as np
+import dataclasses
+import json
+import os
+
+from Simulator_Core.Integrators import integrator_weights
+from Simulator_Core.SnapshotStore import state_shape
+
+
+# Parameters which only control how a run is carried out and stored. They may change when a run is resumed.
+# (A different FFT backend, position kernel or engine only changes the rounding of the results.)
+RUN_CONTROL_PARAMETERS = {"time_steps", "history_mode", "history_length", "record_interval", "record_stride",
+                          "record_binning", "record_region", "record_density", "snapshot_interval", "fft_backend",
+                          "fft_workers", "fft_wisdom_file", "operator_cache_dir", "position_kernel",
+                          "engine", "checkpoint_interval", "checkpoint_file", "profile", "profile_file"}
+
+# Parameters of the records of the history mode "recorded". (the records of a checkpoint are only restored if the
+# continued run records the same way)
+RECORD_PARAMETERS = ["history_mode", "record_interval", "record_stride", "record_binning", "record_region",
+                     "record_density"]
+
+
+def checkpoint_due(grid_parameters, time_step):
+    """
+    Returns true if a checkpoint has to be written after a timestep.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param time_step: The timestep which was just finished.
+    """
+
+    if grid_parameters.checkpoint_interval <= 0:
+        return False
+    if not grid_parameters.checkpoint_file:
+        raise ValueError("Checkpoints require a checkpoint_file.")
+
+    return time_step % grid_parameters.checkpoint_interval == 0
+
+
+def write_checkpoint(grid, time_step, potential, time_step_size, gravity):
+    """
+    Writes everything which is needed to continue a run with identical results atomically into a .npz file.
+    (The file is first written to a temporary file, which then replaces the old checkpoint.)
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep of the checkpoint.
+    :param potential: The potential buffer which belongs to the state of the timestep.
+    :param time_step_size: The time step size of the next step. (differs from time_step_size if it is adaptive)
+    :param gravity: The "gravity" of the run.
+    """
+
+    grid_parameters = grid.grid_parameters
+    path = grid_parameters.checkpoint_file
+
+    metadata = {"dimension": len(state_shape(grid_parameters)),
+                "time_step": time_step,
+                "time_step_size": float(time_step_size),
+                "gravity": float(gravity),
+                "integrator_weights": integrator_weights(grid_parameters.integrator),
+                "grid_parameters": dataclasses.asdict(grid_parameters)}
+
+    # the reduced records of the history mode "recorded" (up to the timestep of the checkpoint)
+    records = {}
+    if grid.recorder is not None:
+        records["records"] = grid.recorder.records[:time_step // grid.recorder.interval + 1]
+        metadata["record_first_time_step"] = grid.recorder.first_time_step
+
+    with open(path + ".tmp", "wb") as file:
+        np.savez(file, state=grid.get_state(time_step), potential=potential, energy=grid.energy[:time_step + 1],
+                 time=grid.time[:time_step + 1], diagnostics=grid.diagnostics, metadata=json.dumps(metadata),
+                 **records)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def load_checkpoint(path):
+    """
+    Loads a checkpoint into a dictionary. (state, potential, energy, time, diagnostics, the records if the run was
+    recorded and the entries of the metadata)
+
+    :param path: The .npz file of the checkpoint.
+    """
+
+    with np.load(path) as file:
+        checkpoint = json.loads(str(file["metadata"]))
+        for name in ["state", "potential", "energy", "time", "diagnostics", "records"]:
+            if name in file.files:
+                checkpoint[name] = file[name]
+
+    return checkpoint
+
+
+def restore_checkpoint(grid, checkpoint, gravity):
+    """
+    Checks that a checkpoint belongs to the same simulation and restores the state, energy, time, diagnostics and
+    records of the grid.
+
+    :param grid: The grid on which the run is continued.
+    :param checkpoint: The checkpoint. (see load_checkpoint)
+    :param gravity: The "gravity" of the continued run.
+    """
+
+    current = dataclasses.asdict(grid.grid_parameters)
+    stored = checkpoint["grid_parameters"]
+    different = sorted(name for name in current
+                       if name not in RUN_CONTROL_PARAMETERS and current[name] != stored.get(name))
+
+    if different:
+        raise ValueError("The checkpoint belongs to a simulation with other parameters: " + ", ".join(different))
+    if checkpoint["gravity"] != gravity:
+        raise ValueError("The checkpoint belongs to a simulation with another gravity.")
+
+    time_step = checkpoint["time_step"]
+    if time_step >= grid.grid_parameters.time_steps:
+        raise ValueError("The checkpoint is at timestep " + str(time_step) + ", the run only has " +
+                         str(grid.grid_parameters.time_steps) + " timesteps.")
+
+    grid.energy[:time_step + 1] = checkpoint["energy"]
+    grid.time[:time_step + 1] = checkpoint["time"]
+
+    # Info: The run might be continued with more timesteps, which only adds samples at the end.
+    samples = min(len(grid.diagnostics), len(checkpoint["diagnostics"]))
+    grid.diagnostics[:samples] = checkpoint["diagnostics"][:samples]
+
+    # Info: json stores the record_region as lists.
+    if grid.recorder is not None:
+        same_records = all(json.loads(json.dumps(current[name])) == stored.get(name) for name in RECORD_PARAMETERS)
+        records = checkpoint.get("records") if same_records else None
+        grid.recorder.restore(records, checkpoint.get("record_first_time_step", 0), time_step)
+
+    grid.set_state(time_step, checkpoint["state"])
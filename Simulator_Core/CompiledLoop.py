@@ -0,0 +1,269 @@
+import numpy as np
+
+
+# The maximal number of timesteps which are advanced by one call of a compiled loop.
+CHUNK_STEPS = 64
+
+# The jitted loops of every structure of the integrator, shared by every JaxLoop of the process.
+# Info: jax.jit compiles a loop once per shape and dtype of its arguments, so later runs only pay for the first one.
+jitted_loops = {}
+
+
+def create_compiled_loop(grid_parameters):
+    """
+    Creates the compiled loop of the engine which is selected in the grid parameters. Returns None for the engine
+    "numpy", which iterates the time steps in Python.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    if grid_parameters.engine == "numpy":
+        return None
+    elif grid_parameters.engine == "jax":
+        if grid_parameters.adaptive:
+            raise ValueError("The engine \"jax\" does not support adaptive time steps.")
+        return JaxLoop()
+
+    raise ValueError("Unknown engine: " + str(grid_parameters.engine))
+
+
+def chunk_length(grid):
+    """
+    Returns the maximal number of timesteps of a chunk and whether a chunk hands back the state of every timestep.
+    Only the states which the grid keeps are handed back: with a history_length of 1 a chunk only returns its last
+    state, otherwise every state, but a chunk is never longer than the history. (so a run in the "ring" mode does not
+    need more memory than its history)
+
+    :param grid: The grid of the run.
+    """
+
+    if grid.history_length > 1:
+        return min(CHUNK_STEPS, grid.history_length), True
+
+    return CHUNK_STEPS, False
+
+
+def chunk_end(grid, time_step, length):
+    """
+    Returns the timestep at which the next chunk of a compiled loop has to end: after length timesteps, at the next
+    checkpoint or diagnostics timestep or at the last timestep. Chunks which only hand back their last state also end
+    at every state the sink, the monitor or the recorder of the grid needs.
+
+    :param grid: The grid of the run.
+    :param time_step: The timestep at which the chunk starts.
+    :param length: The maximal number of timesteps of the chunk. (see chunk_length)
+    """
+
+    grid_parameters = grid.grid_parameters
+    end = min(time_step + length, grid_parameters.time_steps - 1)
+
+    intervals = [grid_parameters.checkpoint_interval, grid_parameters.diagnostics_interval]
+    if grid.history_length == 1:
+        if grid.sink is not None:
+            intervals.append(grid_parameters.snapshot_interval)
+        if grid.monitor is not None:
+            intervals.append(getattr(grid.monitor, "interval", 1))
+        if grid.recorder is not None:
+            intervals.append(grid.recorder.interval)
+
+    for interval in intervals:
+        if interval > 0:
+            end = min(end, (time_step // interval + 1) * interval)
+
+    return end
+
+
+class JaxStepPhases:
+
+    def __init__(self, jnp, operators):
+        """
+        The phases of a step with jax arrays. (see SplitOperator.split_operator_step) Every phase returns a new array,
+        so the step can be traced by jax.jit. The FFT backend and the position kernel of the grid parameters are not
+        used.
+
+        :param jnp: The module jax.numpy.
+        :param operators: The operators of the run as jax arrays. (see JaxLoop.compile)
+        """
+
+        self.jnp = jnp
+        self.operators = operators
+
+    def forward_fft(self, state):
+        """
+        Returns the spectrum of a state.
+        """
+
+        return self.jnp.fft.fftn(state)
+
+    def inverse_fft(self, spectrum):
+        """
+        Returns the state of a spectrum. (in the data type of the states)
+        """
+
+        return self.jnp.fft.ifftn(spectrum).astype(spectrum.dtype)
+
+    def kinetic(self, spectrum, opr_k):
+        """
+        Applies a momentum operator to the spectrum of the state.
+        """
+
+        return spectrum * opr_k
+
+    def absorb(self, state, time_step_size):
+        """
+        Applies the mask of the absorbing layers to a state. (the mask of the time step size of the run)
+        """
+
+        if self.operators["mask"] is None:
+            return state
+
+        return state * self.operators["mask"]
+
+    def position(self, state, potential, time_step_size, out=None):
+        """
+        Applies the position operator of the potential and the time step size to a state.
+        """
+
+        # Info: The time step size is rounded to the precision of the potential, like the Python float of the kernels.
+        time_step_size = self.jnp.asarray(time_step_size, dtype=potential.dtype)
+        exponent = -1j * (potential * self.operators["gravity"] + self.operators["v_ext"]) * time_step_size
+
+        return state * self.jnp.exp(exponent).astype(state.dtype)
+
+    def density(self, state):
+        """
+        Returns the density |u|^2 of a state.
+        """
+
+        return self.jnp.square(self.jnp.abs(state))
+
+    def poisson(self, density):
+        """
+        Solves the Poisson equation for a density. (real FFT -> Poisson -> real IFFT)
+        """
+
+        potential = self.jnp.fft.irfftn(self.jnp.fft.rfftn(density) * self.operators["poisson"], s=density.shape)
+        return potential.astype(density.dtype)
+
+
+def jitted_loop(jax, jnp, lie, strang_steps, length, return_states):
+    """
+    Returns the (cached) jitted function which advances a state by a number of timesteps. The operators, the weights
+    and the time step size are arguments, so the function is only compiled once per shape and dtype, and the number
+    of timesteps is traced, so a shorter last chunk uses the same compiled function. (jax.lax.fori_loop)
+
+    :param jax: The module jax.
+    :param jnp: The module jax.numpy.
+    :param lie: Set to true for the integrator "lie". (otherwise the Strang steps of the other integrators)
+    :param strang_steps: The number of Strang steps of the integrator.
+    :param length: The maximal number of timesteps. (the length of the returned buffers)
+    :param return_states: Set to true if the state of every timestep should be returned.
+    """
+
+    # Info: SplitOperator imports this module, so the step is imported when a loop is created.
+    from Simulator_Core.SplitOperator import split_operator_step
+
+    key = (lie, strang_steps, length, return_states)
+    if key in jitted_loops:
+        return jitted_loops[key]
+
+    def advance(state, potential, steps, operators):
+        phases = JaxStepPhases(jnp, operators)
+
+        def body(n, carry):
+            state, potential, energies, states = carry
+            state, potential, density = split_operator_step(phases, state, potential, operators["time_step_size"],
+                                                            operators["oprs_k"], operators["weights"], lie)
+            energies = energies.at[n].set(jnp.sum(density, dtype=jnp.float64))
+            if return_states:
+                states = states.at[n].set(state)
+            return state, potential, energies, states
+
+        energies = jnp.zeros(length, dtype=jnp.float64)
+        states = jnp.zeros((length,) + state.shape, dtype=state.dtype) if return_states else None
+
+        return jax.lax.fori_loop(0, steps, body, (state, potential, energies, states))
+
+    jitted_loops[key] = jax.jit(advance)
+
+    return jitted_loops[key]
+
+
+class JaxLoop:
+
+    def __init__(self):
+        """
+        Split operator loop compiled with jax. (XLA on the CPU) Every chunk of timesteps is carried out by one call of
+        a jitted loop, so there is no Python code between the steps of a chunk. The FFT backend and the position
+        kernel of the grid parameters are not used.
+        """
+
+        try:
+            import jax
+            import jax.numpy as jnp
+        except ImportError:
+            raise ImportError("The engine \"jax\" requires the package jax.")
+
+        self.name = "jax"
+        self.jax = jax
+        self.jnp = jnp
+        self.advance = None
+        self.operators = None
+        self.length = 0
+
+    def compile(self, weights, oprs_k, poisson, v_ext, gravity, time_step_size, mask, integrator, length,
+                return_states):
+        """
+        Selects the jitted loop of the integrator and moves the operators to jax. (The loop itself is only compiled
+        by the first run with the shape and dtype of the states, see jitted_loop.)
+
+        :param weights: The weights of the Strang steps of the integrator.
+        :param oprs_k: The momentum operators of the time step size. (one for every Strang step)
+        :param poisson: The Poisson kernel for the half spectrum of the real FFT of the density.
+        :param v_ext: The static external potential.
+        :param gravity: The "gravity" of the system.
+        :param time_step_size: The time step size.
+        :param mask: The mask of the absorbing layers for the time step size. (None for a periodic grid)
+        :param integrator: The integrator of the grid parameters.
+        :param length: The maximal number of timesteps of a chunk. (see chunk_length)
+        :param return_states: Set to true if a chunk should hand back the state of every timestep.
+        """
+
+        jax = self.jax
+        jnp = self.jnp
+        dtype_real = v_ext.dtype
+
+        # Info: The weights and the time step size are float64 like the Python floats of the numpy loop, so the
+        #       merged position steps of split_operator_step are the same numbers.
+        with jax.enable_x64(True):
+            self.operators = {"oprs_k": jnp.asarray(np.stack(oprs_k)),
+                              "poisson": jnp.asarray(poisson),
+                              "v_ext": jnp.asarray(v_ext),
+                              "mask": None if mask is None else jnp.asarray(mask),
+                              "gravity": jnp.asarray(gravity, dtype=dtype_real),
+                              "weights": jnp.asarray(weights, dtype=jnp.float64),
+                              "time_step_size": jnp.asarray(time_step_size, dtype=jnp.float64)}
+
+        self.advance = jitted_loop(jax, jnp, integrator == "lie", len(weights), length, return_states)
+        self.length = length
+
+    def run(self, state, potential, steps):
+        """
+        Advances a state by a number of timesteps. Returns the potential after the last step, the handed back states
+        (every state or only the last one, see chunk_length) and the energies of every step. (as numpy arrays)
+
+        :param state: The wave function at the start.
+        :param potential: The potential buffer. (belongs to the state)
+        :param steps: The number of timesteps. (at most the length of the chunks)
+        """
+
+        if steps > self.length:
+            raise ValueError("A chunk of the compiled loop has at most " + str(self.length) + " timesteps.")
+
+        with self.jax.enable_x64(True):
+            state, potential, energies, states = self.advance(self.jnp.asarray(state), self.jnp.asarray(potential),
+                                                              steps, self.operators)
+
+            states = np.asarray(state)[np.newaxis] if states is None else np.asarray(states)[:steps]
+
+            return np.asarray(potential), states, np.asarray(energies)[:steps]
@@ -0,0 +1,109 @@
+import numpy as np
+
+
+def diagnostics_dtype(dimension):
+    """
+    Returns the structured data type of one diagnostics sample.
+
+    :param dimension: The dimension of the simulation. (1, 2 or 3)
+    """
+
+    return np.dtype([("time_step", np.int64), ("time", float), ("norm", float), ("absorbed_norm", float),
+                     ("kinetic_energy", float), ("gravitational_energy", float), ("external_energy", float),
+                     ("total_energy", float), ("momentum", float, (dimension,)),
+                     ("center_of_mass", float, (dimension,))])
+
+
+def empty_diagnostics(grid_parameters, dimension):
+    """
+    Returns the array for the diagnostics of a run. (one sample every diagnostics_interval-th timestep)
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param dimension: The dimension of the simulation. (1, 2 or 3)
+    """
+
+    if grid_parameters.diagnostics_interval <= 0:
+        return np.zeros(0, dtype=diagnostics_dtype(dimension))
+
+    sample_count = (grid_parameters.time_steps - 1) // grid_parameters.diagnostics_interval + 1
+
+    return np.zeros(sample_count, dtype=diagnostics_dtype(dimension))
+
+
+class Diagnostics:
+
+    def __init__(self, grid, wave_numbers, positions, v_ext, gravity, fft):
+        """
+        Records the physical diagnostics of a run into grid.diagnostics. The energies are summed over the grid
+        points like the norm in grid.energy (multiply by the volume of a cell for the integrals), the momentum and
+        the center of mass are expectation values. The absorbed norm is the norm lost since the first timestep.
+        (removed by the absorbing layers, otherwise only rounding errors)
+
+        The kinetic energy and the momentum are calculated from the spectrum of the state, the potential energies
+        and the center of mass from the density and the potential buffer of the simulation. If the simulation hands
+        over the spectrum it already calculated, a sample does not need any additional FFT.
+
+        :param grid: The grid of the run.
+        :param wave_numbers: The wave numbers of every axis (x, y, z) broadcast to the shape of the state.
+        :param positions: The positions of every axis (x, y, z) broadcast to the shape of the state.
+        :param v_ext: The static external potential.
+        :param gravity: The "gravity" of the system.
+        :param fft: The FFT backend of the simulation. (for samples without a spectrum)
+        """
+
+        self.grid = grid
+        self.interval = grid.grid_parameters.diagnostics_interval
+        self.wave_numbers = [np.asarray(k, dtype=float) for k in wave_numbers]
+        self.positions = [np.asarray(x, dtype=float) for x in positions]
+        self.kinetic = 0.5 * sum(np.square(k) for k in self.wave_numbers)
+        self.v_ext = v_ext
+        self.gravity = gravity
+        self.fft = fft
+
+    def due(self, time_step):
+        """
+        Returns true if the diagnostics of a timestep have to be recorded.
+
+        :param time_step: The timestep.
+        """
+
+        return self.interval > 0 and time_step % self.interval == 0
+
+    def record(self, time_step, state, density, potential, spectrum=None):
+        """
+        Records the diagnostics of the state of a timestep.
+
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep.
+        :param density: The density buffer. (belongs to the state)
+        :param potential: The potential buffer. (belongs to the state)
+        :param spectrum: The (unnormalized) FFT of the state, if it is already available.
+        """
+
+        if spectrum is None:
+            spectrum = self.fft.fft(state)
+
+        # Info: By Parseval's theorem the sum over the spectrum is the sum over the grid times the number of points.
+        power = np.square(np.abs(spectrum))
+        power_sum = np.sum(power, dtype=float)
+        norm = np.sum(density, dtype=float)
+
+        # Info: The k=0 mode of the potential only is a global phase of the state, so its mean is left out.
+        #       The self-interaction is counted once, hence the 1/2.
+        v = potential - np.mean(potential, dtype=float)
+
+        sample = self.grid.diagnostics[time_step // self.interval]
+        sample["time_step"] = time_step
+        sample["time"] = self.grid.time[time_step]
+        sample["norm"] = norm
+        sample["absorbed_norm"] = self.grid.energy[0] - norm
+        sample["kinetic_energy"] = np.sum(self.kinetic * power, dtype=float) / power.size
+        sample["gravitational_energy"] = 0.5 * self.gravity * np.sum(v * density, dtype=float)
+        sample["external_energy"] = np.sum(self.v_ext * density, dtype=float)
+        sample["total_energy"] = (sample["kinetic_energy"] + sample["gravitational_energy"] +
+                                  sample["external_energy"])
+
+        # the expectation values are normalized by the norm (the momentum with the power of the spectrum)
+        sample["momentum"] = [np.sum(k * power, dtype=float) / power_sum for k in self.wave_numbers]
+        sample["center_of_mass"] = [np.sum(x * density, dtype=float) / norm for x in self.positions]
+
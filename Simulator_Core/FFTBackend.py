@@ -0,0 +1,233 @@
+import numpy as np
+import os
+import pickle
+
+
+class NumpyFFTBackend:
+
+    def __init__(self, shape, dtype=np.complex128, workers=1, batch_shape=()):
+        """
+        FFT backend using numpy.fft. (single threaded)
+
+        :param shape: The shape of the transformed arrays. (the FFT is taken over every axis)
+        :param dtype: The complex data type of the transformed arrays.
+        :param workers: Not used by this backend.
+        :param batch_shape: Not used by this backend. (leading axes of the arrays are transformed separately)
+        """
+
+        self.axes = tuple(range(-len(shape), 0))
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+    def fft(self, a):
+        """
+        Returns the forward FFT of an array.
+
+        :param a: The array which should be transformed.
+        """
+
+        return np.fft.fftn(a, axes=self.axes)
+
+    def ifft(self, a):
+        """
+        Returns the inverse FFT of an array.
+
+        :param a: The array which should be transformed.
+        """
+
+        return np.fft.ifftn(a, axes=self.axes)
+
+    def rfft(self, a):
+        """
+        Returns the half spectrum of the forward FFT of a real array.
+
+        :param a: The real array which should be transformed.
+        """
+
+        return np.fft.rfftn(a, axes=self.axes)
+
+    def irfft(self, a):
+        """
+        Returns the real inverse FFT of a half spectrum.
+
+        :param a: The half spectrum which should be transformed.
+        """
+
+        return np.fft.irfftn(a, s=self.shape, axes=self.axes)
+
+
+class ScipyFFTBackend:
+
+    def __init__(self, shape, dtype=np.complex128, workers=-1, batch_shape=()):
+        """
+        FFT backend using scipy.fft with multiple workers.
+
+        :param shape: The shape of the transformed arrays. (the FFT is taken over every axis)
+        :param dtype: The complex data type of the transformed arrays.
+        :param workers: The number of threads used for one FFT. (-1 uses every core)
+        :param batch_shape: Not used by this backend. (leading axes of the arrays are transformed separately)
+        """
+
+        import scipy.fft
+
+        self.scipy_fft = scipy.fft
+        self.axes = tuple(range(-len(shape), 0))
+        self.shape = tuple(shape)
+        self.dtype = dtype
+        self.workers = workers
+
+    def fft(self, a):
+        """
+        Returns the forward FFT of an array.
+
+        :param a: The array which should be transformed.
+        """
+
+        return self.scipy_fft.fftn(a, axes=self.axes, workers=self.workers)
+
+    def ifft(self, a):
+        """
+        Returns the inverse FFT of an array.
+
+        :param a: The array which should be transformed.
+        """
+
+        return self.scipy_fft.ifftn(a, axes=self.axes, workers=self.workers)
+
+    def rfft(self, a):
+        """
+        Returns the half spectrum of the forward FFT of a real array.
+
+        :param a: The real array which should be transformed.
+        """
+
+        return self.scipy_fft.rfftn(a, axes=self.axes, workers=self.workers)
+
+    def irfft(self, a):
+        """
+        Returns the real inverse FFT of a half spectrum.
+
+        :param a: The half spectrum which should be transformed.
+        """
+
+        return self.scipy_fft.irfftn(a, s=self.shape, axes=self.axes, workers=self.workers)
+
+
+class PyFFTWBackend:
+
+    def __init__(self, shape, dtype=np.complex128, workers=-1, wisdom_file="", batch_shape=()):
+        """
+        FFT backend using pre-planned, in-place pyFFTW transforms on one aligned buffer.
+        (The real transforms use an aligned real buffer and an aligned half spectrum buffer.)
+        The returned arrays are these buffers, so they are overwritten by the next transform.
+
+        :param shape: The shape of the transformed arrays. (the FFT is taken over every axis)
+        :param dtype: The complex data type of the transformed arrays.
+        :param workers: The number of threads used for one FFT. (-1 uses every core)
+        :param wisdom_file: File in which the FFTW wisdom is cached between runs. (empty for no caching)
+        :param batch_shape: Leading axes of the buffers. (every entry is transformed separately)
+        """
+
+        try:
+            import pyfftw
+        except ImportError:
+            raise ImportError("The FFT backend \"pyfftw\" requires the package pyFFTW.")
+
+        if workers == -1:
+            workers = os.cpu_count()
+
+        self.axes = tuple(range(-len(shape), 0))
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+        if wisdom_file and os.path.exists(wisdom_file):
+            with open(wisdom_file, "rb") as file:
+                pyfftw.import_wisdom(pickle.load(file))
+
+        shape = tuple(batch_shape) + tuple(shape)
+
+        self.buffer = pyfftw.empty_aligned(shape, dtype=dtype)
+        self.forward_plan = pyfftw.FFTW(self.buffer, self.buffer, axes=self.axes, direction="FFTW_FORWARD",
+                                        flags=("FFTW_MEASURE",), threads=workers)
+        self.inverse_plan = pyfftw.FFTW(self.buffer, self.buffer, axes=self.axes, direction="FFTW_BACKWARD",
+                                        flags=("FFTW_MEASURE",), threads=workers)
+
+        self.real_buffer = pyfftw.empty_aligned(shape, dtype=np.finfo(dtype).dtype)
+        self.half_buffer = pyfftw.empty_aligned(tuple(shape[:-1]) + (shape[-1] // 2 + 1,), dtype=dtype)
+        self.real_forward_plan = pyfftw.FFTW(self.real_buffer, self.half_buffer, axes=self.axes,
+                                             direction="FFTW_FORWARD", flags=("FFTW_MEASURE",), threads=workers)
+        self.real_inverse_plan = pyfftw.FFTW(self.half_buffer, self.real_buffer, axes=self.axes,
+                                             direction="FFTW_BACKWARD", flags=("FFTW_MEASURE",), threads=workers)
+
+        if wisdom_file:
+            with open(wisdom_file + ".tmp", "wb") as file:
+                pickle.dump(pyfftw.export_wisdom(), file)
+            os.replace(wisdom_file + ".tmp", wisdom_file)
+
+    def fft(self, a):
+        """
+        Returns the forward FFT of an array. (the result is the internal buffer)
+
+        :param a: The array which should be transformed.
+        """
+
+        if a is not self.buffer:
+            self.buffer[...] = a
+
+        return self.forward_plan()
+
+    def ifft(self, a):
+        """
+        Returns the inverse FFT of an array. (the result is the internal buffer)
+
+        :param a: The array which should be transformed.
+        """
+
+        if a is not self.buffer:
+            self.buffer[...] = a
+
+        return self.inverse_plan()
+
+    def rfft(self, a):
+        """
+        Returns the half spectrum of the forward FFT of a real array. (the result is the internal half buffer)
+
+        :param a: The real array which should be transformed.
+        """
+
+        if a is not self.real_buffer:
+            self.real_buffer[...] = a
+
+        return self.real_forward_plan()
+
+    def irfft(self, a):
+        """
+        Returns the real inverse FFT of a half spectrum. (the result is the internal real buffer)
+
+        :param a: The half spectrum which should be transformed.
+        """
+
+        if a is not self.half_buffer:
+            self.half_buffer[...] = a
+
+        return self.real_inverse_plan()
+
+
+def create_fft_backend(grid_parameters, shape, dtype=np.complex128, batch_shape=()):
+    """
+    Creates the FFT backend which is selected in the grid parameters.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param shape: The shape of the transformed arrays.
+    :param dtype: The complex data type of the transformed arrays.
+    :param batch_shape: Leading axes of the arrays which are not transformed. (e.g. the members of an ensemble)
+    """
+
+    if grid_parameters.fft_backend == "numpy":
+        return NumpyFFTBackend(shape, dtype, batch_shape=batch_shape)
+    elif grid_parameters.fft_backend == "scipy":
+        return ScipyFFTBackend(shape, dtype, grid_parameters.fft_workers, batch_shape)
+    elif grid_parameters.fft_backend == "pyfftw":
+        return PyFFTWBackend(shape, dtype, grid_parameters.fft_workers, grid_parameters.fft_wisdom_file, batch_shape)
+
+    raise ValueError("Unknown FFT backend: " + str(grid_parameters.fft_backend))
@@ -0,0 +1,164 @@
+import numpy as np
+import collections
+import concurrent.futures
+import os
+import warnings
+
+
+def init_worker():
+    """
+    Selects the non-interactive Agg backend of matplotlib in a worker process. (before anything is drawn)
+    """
+
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+
+
+def render_frame(draw, arguments, dpi):
+    """
+    Draws one frame and returns it as an RGB image. (executed by the workers)
+
+    :param draw: Module level function which draws the frame onto the current pyplot figure.
+    :param arguments: The arguments of the draw function. (plain arrays and strings)
+    :param dpi: The resolution of the frame.
+    """
+
+    import matplotlib.pyplot as plt
+
+    # Info: The frame gets its own figure, so it is not drawn onto a figure which is still open.
+    #       (e.g. inherited from the parent process)
+    figure = plt.figure()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        draw(*arguments)
+
+    if plt.gcf() is not figure:
+        plt.close(figure)
+        figure = plt.gcf()
+    figure.set_dpi(dpi)
+    figure.canvas.draw()
+    frame = np.array(np.asarray(figure.canvas.buffer_rgba())[..., :3])
+    plt.close(figure)
+
+    return frame
+
+
+class FrameRenderer:
+
+    def __init__(self, path, fps=10, processes=None, dpi=100):
+        """
+        Renders frames in a pool of processes and streams them in order into a gif or an mp4 file. (without writing
+        every frame as a picture first)
+
+        :param path: The file of the animation. (".gif" or ".mp4", which needs the package imageio-ffmpeg)
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+        :param dpi: The resolution of the frames.
+        """
+
+        import imageio.v2 as imageio
+
+        self.dpi = dpi
+        self.path = path
+        self.frames = 0
+
+        if path.endswith(".gif"):
+            self.writer = imageio.get_writer(path, mode="I")
+        else:
+            self.writer = imageio.get_writer(path, fps=fps)
+
+        self.executor = None
+        if processes is None:
+            # a single process would only add the overhead of sending the frames
+            processes = os.cpu_count() or 1
+            processes = processes if processes > 1 else 0
+        if processes > 0:
+            self.executor = concurrent.futures.ProcessPoolExecutor(processes, initializer=init_worker)
+
+        # Info: Only a few frames are rendered ahead, so the queued data stays small.
+        self.pending = collections.deque()
+        self.max_pending = 2 * max(1, processes)
+
+    def submit(self, draw, arguments):
+        """
+        Renders a frame and writes every finished frame into the file. Blocks only if too many frames are pending.
+
+        :param draw: Module level function which draws the frame onto the current pyplot figure.
+        :param arguments: The arguments of the draw function. (plain arrays and strings, no views of the states)
+        """
+
+        if self.executor is None:
+            self.writer.append_data(render_frame(draw, arguments, self.dpi))
+            self.frames += 1
+            return
+
+        self.pending.append(self.executor.submit(render_frame, draw, arguments, self.dpi))
+
+        while len(self.pending) > self.max_pending or (self.pending and self.pending[0].done()):
+            self.writer.append_data(self.pending.popleft().result())
+            self.frames += 1
+
+    def close(self):
+        """
+        Waits for the remaining frames and closes the file.
+        """
+
+        while self.pending:
+            self.writer.append_data(self.pending.popleft().result())
+            self.frames += 1
+
+        self.writer.close()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+
+class AnimationSink:
+
+    def __init__(self, path, frame, stride=1, fps=10, processes=None, dpi=100, sink=None):
+        """
+        Sink which renders the states into an animation while the simulation is still running.
+        (e.g. grid.sink = AnimationSink("simulation.mp4", grid.frame, stride=5))
+
+        :param path: The file of the animation. (".gif" or ".mp4")
+        :param frame: Function which returns the draw function and its arguments for a state. (see Grid.frame)
+        :param stride: Only every stride-th state which reaches the sink is rendered.
+        :param fps: The frames per second of an mp4 file.
+        :param processes: The number of rendering processes. (None uses every core, 0 renders in this process)
+        :param dpi: The resolution of the frames.
+        :param sink: Another sink which receives every state as well. (optional, e.g. a snapshot store)
+        """
+
+        self.frame = frame
+        self.stride = stride
+        self.sink = sink
+        self.received = 0
+        self.renderer = FrameRenderer(path, fps, processes, dpi)
+
+    def write(self, time_step, state):
+        """
+        Hands the state to the rendering processes. (and to the other sink)
+
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep.
+        """
+
+        if self.sink is not None:
+            self.sink.write(time_step, state)
+
+        if self.received % self.stride == 0:
+            self.renderer.submit(*self.frame(time_step, state))
+        self.received += 1
+
+    def close(self, energy=None, time=None):
+        """
+        Waits for the remaining frames and closes the animation. (and the other sink)
+
+        :param energy: The energy evolution of the run. (optional, for the other sink)
+        :param time: The simulated time of every timestep of the run. (optional, for the other sink)
+        """
+
+        self.renderer.close()
+        if self.sink is not None:
+            self.sink.close(energy, time)
+
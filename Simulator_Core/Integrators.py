@@ -0,0 +1,39 @@
+def integrator_weights(integrator):
+    """
+    Returns the fractions of the time step size of the Strang steps which make up one step of an integrator.
+
+    "lie":      First order. (momentum step followed by a position step, not a Strang step)
+    "strang":   Second order. (half position step, momentum step, half position step)
+    "yoshida4": Fourth order triple jump of Strang steps. (Yoshida, equivalent to Forest-Ruth)
+    "suzuki4":  Fourth order fractal of five Strang steps. (Suzuki, smaller error constant than "yoshida4")
+
+    :param integrator: The name of the integrator.
+    """
+
+    if integrator == "lie" or integrator == "strang":
+        return [1.0]
+    elif integrator == "yoshida4":
+        w1 = 1 / (2 - 2 ** (1 / 3))
+        return [w1, 1 - 2 * w1, w1]
+    elif integrator == "suzuki4":
+        w1 = 1 / (4 - 4 ** (1 / 3))
+        return [w1, w1, 1 - 4 * w1, w1, w1]
+
+    raise ValueError("Unknown integrator: " + str(integrator))
+
+
+def integrator_order(integrator):
+    """
+    Returns the order of the global error of an integrator.
+
+    :param integrator: The name of the integrator.
+    """
+
+    if integrator == "lie":
+        return 1
+    elif integrator == "strang":
+        return 2
+    elif integrator == "yoshida4" or integrator == "suzuki4":
+        return 4
+
+    raise ValueError("Unknown integrator: " + str(integrator))
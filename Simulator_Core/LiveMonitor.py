@@ -0,0 +1,237 @@
+import numpy as np
+import math
+import sys
+
+from multiprocessing import shared_memory
+
+
+# The header in front of the frame in the shared memory.
+# Info: sequence is odd while a frame is written (seqlock), frames counts every published frame.
+HEADER = np.dtype([("sequence", np.int64), ("frames", np.int64), ("finished", np.int64), ("time_step", np.int64),
+                   ("time", float), ("norm", float), ("diagnostics_time_step", np.int64),
+                   ("kinetic_energy", float), ("gravitational_energy", float), ("total_energy", float),
+                   ("shape", np.int64, (2,))])
+
+
+def downsample(density, max_points):
+    """
+    Averages blocks of neighbouring grid points, so no axis has more than max_points points. (The last points of an
+    axis are left out if its length is no multiple of the block size.)
+
+    :param density: The (projected) squared wave function.
+    :param max_points: The maximal number of points per axis.
+    """
+
+    for axis, points in enumerate(density.shape):
+        factor = math.ceil(points / max_points)
+        if factor > 1:
+            blocks = points // factor
+            density = np.take(density, range(blocks * factor), axis=axis)
+            shape = density.shape[:axis] + (blocks, factor) + density.shape[axis + 1:]
+            density = density.reshape(shape).mean(axis=axis + 1)
+
+    return density
+
+
+def attach(name):
+    """
+    Attaches to the shared memory of a monitor without taking over its clean up.
+
+    :param name: The name of the shared memory.
+    """
+
+    try:
+        return shared_memory.SharedMemory(name, track=False)
+    except TypeError:
+        # Info: Before Python 3.13 the resource tracker would remove the shared memory when the viewer exits.
+        from multiprocessing import resource_tracker
+        memory = shared_memory.SharedMemory(name)
+        resource_tracker.unregister(memory._name, "shared_memory")
+        return memory
+
+
+class LiveMonitor:
+
+    def __init__(self, grid, interval=10, max_points=128, axis=2, name=None):
+        """
+        Publishes a downsampled |u|^2 frame and the latest diagnostics of every interval-th state of a running
+        simulation into shared memory. (e.g. grid.monitor = LiveMonitor(grid, 10), then run view(monitor.name) in
+        another process)
+
+        The simulation never waits for the viewer: every frame overwrites the previous one, so the viewer only sees
+        the newest frame and frames it was too slow for are dropped.
+
+        :param grid: The grid of the run.
+        :param interval: Every interval-th timestep is published.
+        :param max_points: The maximal number of points per axis of a frame.
+        :param axis: The axis along which a 3D state is summed up. (0 = x, 1 = y, 2 = z)
+        :param name: The name of the shared memory. (default: a random name, see the attribute name)
+        """
+
+        self.grid = grid
+        self.interval = interval
+        self.max_points = max_points
+        self.axis = axis
+
+        shape = self.project(np.zeros(grid.grid.shape[1:])).shape
+
+        self.memory = shared_memory.SharedMemory(name, create=True,
+                                                 size=HEADER.itemsize + int(np.prod(shape)) * 4)
+        self.name = self.memory.name
+        self.header = np.ndarray((), dtype=HEADER, buffer=self.memory.buf)
+        self.frame = np.ndarray(shape, dtype=np.float32, buffer=self.memory.buf, offset=HEADER.itemsize)
+
+        self.header[...] = 0
+        self.header["shape"] = shape if len(shape) == 2 else (shape[0], 0)
+        self.header["diagnostics_time_step"] = -1
+
+        print("Live monitor: python -m Simulator_Core.LiveMonitor " + self.name)
+
+    def project(self, density):
+        """
+        Returns the downsampled frame of a squared wave function. (3D states are summed up along the axis)
+
+        :param density: The squared wave function.
+        """
+
+        if density.ndim == 3:
+            density = np.sum(density, axis=self.axis)
+
+        return downsample(density, self.max_points)
+
+    def publish(self, time_step, state):
+        """
+        Writes the frame of a state into the shared memory if the timestep is due. (called by Grid.set_state)
+
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep.
+        """
+
+        if self.interval <= 0 or time_step % self.interval != 0:
+            return
+
+        density = np.square(np.abs(state))
+        frame = self.project(density)
+
+        header = self.header
+        header["sequence"] += 1
+        self.frame[...] = frame
+        header["time_step"] = time_step
+        header["time"] = self.grid.time[time_step]
+        header["norm"] = np.sum(density, dtype=float)
+
+        # the latest recorded diagnostics sample (the sample of the timestep itself is recorded with the next step)
+        diagnostics = self.grid.diagnostics
+        if len(diagnostics) > 0:
+            interval = self.grid.grid_parameters.diagnostics_interval
+            n = min(time_step // interval, len(diagnostics) - 1)
+            if n > 0 and diagnostics[n]["time_step"] != n * interval:
+                n -= 1
+            header["diagnostics_time_step"] = diagnostics[n]["time_step"]
+            for name in ["kinetic_energy", "gravitational_energy", "total_energy"]:
+                header[name] = diagnostics[n][name]
+
+        header["frames"] += 1
+        header["sequence"] += 1
+
+    def close(self):
+        """
+        Tells the viewer that the run has finished and removes the shared memory.
+        """
+
+        self.header["finished"] = 1
+        del self.header, self.frame
+        self.memory.close()
+        self.memory.unlink()
+
+
+def read_frame(header, frame, last_sequence):
+    """
+    Copies the newest frame out of the shared memory. Returns None if there is no new (consistent) frame.
+
+    :param header: The header in the shared memory.
+    :param frame: The frame in the shared memory.
+    :param last_sequence: The sequence number of the last frame which was read.
+    """
+
+    sequence = int(header["sequence"])
+    if sequence % 2 == 1 or sequence == last_sequence:
+        return None
+
+    sample = header.copy()
+    image = frame.copy()
+
+    # the frame was overwritten while it was copied
+    if int(header["sequence"]) != sequence:
+        return None
+
+    return sample, image
+
+
+def view(name, refresh=0.2):
+    """
+    Shows the frames of a LiveMonitor while the simulation is running, together with the norm and the total energy.
+
+    :param name: The name of the shared memory of the monitor.
+    :param refresh: The time between two updates of the window in seconds.
+    """
+
+    import matplotlib.pyplot as plt
+
+    memory = attach(name)
+    header = np.ndarray((), dtype=HEADER, buffer=memory.buf)
+    shape = tuple(int(n) for n in header["shape"] if n > 0)
+    frame = np.ndarray(shape, dtype=np.float32, buffer=memory.buf, offset=HEADER.itemsize)
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    ax3 = ax2.twinx()
+    times, norms, energies = [], [], []
+    sequence = 0
+    plot = None
+
+    while plt.fignum_exists(fig.number):
+        result = read_frame(header, frame, sequence)
+
+        if result is not None:
+            sample, image = result
+            sequence = int(sample["sequence"])
+
+            if plot is None:
+                plot = ax1.plot(image, color="teal")[0] if image.ndim == 1 else \
+                    ax1.imshow(image, cmap='viridis', interpolation='nearest', origin='lower')
+            elif image.ndim == 1:
+                plot.set_ydata(image)
+                ax1.relim()
+                ax1.autoscale_view()
+            else:
+                plot.set_data(image)
+                plot.set_clim(image.min(), image.max())
+
+            ax1.set_title("time-step: " + str(int(sample["time_step"])) + " time: " +
+                          str(round(float(sample["time"]), 3)) + "\nframes: " + str(int(sample["frames"])))
+
+            times.append(float(sample["time"]))
+            norms.append(float(sample["norm"]))
+            energies.append(float(sample["total_energy"]) if sample["diagnostics_time_step"] >= 0 else np.nan)
+
+            ax2.clear()
+            ax3.clear()
+            ax2.plot(times, norms, color="teal")
+            ax3.plot(times, energies, color="darkorange")
+            ax2.set_xlabel("time")
+            ax2.set_ylabel("norm")
+            ax3.set_ylabel("total energy")
+
+        elif header["finished"]:
+            print("The run has finished.")
+            break
+
+        plt.pause(refresh)
+
+    del header, frame
+    memory.close()
+    plt.show()
+
+
+if __name__ == "__main__":
+    view(sys.argv[1])
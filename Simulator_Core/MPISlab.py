@@ -0,0 +1,292 @@
+import numpy as np
+
+from Simulator_Core.Integrators import integrator_weights
+from Simulator_Core.OperatorCache import axis_wave_numbers, momentum_propagators, poisson_kernel, squared_wave_numbers
+from Simulator_Core.PositionKernel import create_position_kernel
+from Simulator_Core.Precision import complex_dtype, real_dtype
+from Simulator_Core.SnapshotStore import state_shape
+from Simulator_Core.SplitOperator import StepPhases, split_operator_step
+
+
+def default_comm():
+    """
+    Returns the world communicator of mpi4py.
+    """
+
+    try:
+        from mpi4py import MPI
+    except ImportError:
+        raise ImportError("The MPI slab decomposition requires the package mpi4py.")
+
+    return MPI.COMM_WORLD
+
+
+class SlabFFTBackend:
+
+    def __init__(self, shape, dtype=np.complex128, comm=None):
+        """
+        Distributed FFT of an array which is split into slabs along the first axis. (one slab per rank)
+        The FFT is taken over the local axes, the slabs are transposed with one all-to-all exchange, so the second
+        axis is split, and then the FFT is taken over the first axis. The spectrum therefore stays transposed:
+        every rank holds all entries of the first axis and a block of the second axis. (inverse in reverse order)
+
+        :param shape: The global shape of the transformed arrays. (the first two axes have to be divisible by the ranks)
+        :param dtype: The complex data type of the transformed arrays.
+        :param comm: The MPI communicator. (default COMM_WORLD)
+        """
+
+        self.comm = comm if comm is not None else default_comm()
+        self.ranks = self.comm.Get_size()
+        self.rank = self.comm.Get_rank()
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+        if len(self.shape) < 2 or self.shape[0] % self.ranks != 0 or self.shape[1] % self.ranks != 0:
+            raise ValueError("The first two axes of the grid " + str(self.shape) + " have to be divisible by the " +
+                             str(self.ranks) + " ranks.")
+
+        self.slab_size = self.shape[0] // self.ranks
+        self.block_size = self.shape[1] // self.ranks
+        self.rest = self.shape[2:]
+
+        # the part of the global array (position space) and of the global spectrum which belongs to this rank
+        self.local_slice = (slice(self.rank * self.slab_size, (self.rank + 1) * self.slab_size),)
+        self.spectral_slice = (slice(None), slice(self.rank * self.block_size, (self.rank + 1) * self.block_size))
+        self.local_shape = (self.slab_size,) + self.shape[1:]
+        self.spectral_shape = (self.shape[0], self.block_size) + self.rest
+
+        # preallocated buffers of the all-to-all exchange
+        self.send_buffer = np.empty((self.ranks, self.slab_size, self.block_size) + self.rest, dtype=dtype)
+        self.receive_buffer = np.empty_like(self.send_buffer)
+
+    def fft(self, a):
+        """
+        Returns the local part of the forward FFT of a distributed array. (transposed layout)
+
+        :param a: The local slab of the array.
+        """
+
+        b = np.fft.fftn(a, axes=tuple(range(1, len(self.shape))))
+
+        # Info: Block p of the second axis is sent to rank p, which puts the slabs of all ranks after each other.
+        np.copyto(self.send_buffer, b.reshape((self.slab_size, self.ranks, self.block_size) + self.rest).swapaxes(0, 1),
+                  casting="same_kind")
+        self.comm.Alltoall(self.send_buffer, self.receive_buffer)
+
+        return np.fft.fft(self.receive_buffer.reshape(self.spectral_shape), axis=0)
+
+    def ifft(self, a):
+        """
+        Returns the local slab of the inverse FFT of a distributed spectrum. (transposed layout)
+
+        :param a: The local part of the spectrum.
+        """
+
+        b = np.fft.ifft(a, axis=0)
+
+        # Info: The entries of the first axis which belong to the slab of rank p are sent back to rank p.
+        np.copyto(self.send_buffer, b.reshape(self.send_buffer.shape), casting="same_kind")
+        self.comm.Alltoall(self.send_buffer, self.receive_buffer)
+        b = self.receive_buffer.swapaxes(0, 1).reshape(self.local_shape)
+
+        return np.fft.ifftn(b, axes=tuple(range(1, len(self.shape))))
+
+    def rfft(self, a):
+        """
+        Returns the local part of the forward FFT of a distributed real array. (full spectrum, transposed layout)
+
+        :param a: The local slab of the real array.
+        """
+
+        return self.fft(a)
+
+    def irfft(self, a):
+        """
+        Returns the local slab of the real inverse FFT of a distributed spectrum. (full spectrum, transposed layout)
+
+        :param a: The local part of the spectrum.
+        """
+
+        return self.ifft(a).real
+
+
+class MPISimulation:
+
+    def __init__(self, grid, grid_parameters, gravity, potential=None, comm=None):
+        """
+        Class that carries out the 2D or 3D simulation on several MPI ranks. The grid is split into slabs along the
+        first axis of the states, every rank only keeps its slab. The states are only gathered on rank 0 every
+        snapshot_interval-th timestep and for the last timestep. (run with e.g. mpirun -n 4)
+
+        :param grid: The grid of rank 0. (history mode "ring" with a history_length of 1, None on the other ranks)
+        :param grid_parameters: The parameters of the grid. (2D or 3D dataclass, the same on every rank)
+        :param gravity: The "gravity" of the system. (How much the waves attract one another.)
+        :param potential: The potential function used for the simulation. (default 0)
+        :param comm: The MPI communicator. (default COMM_WORLD)
+        """
+
+        self.grid = grid
+        self.grid_parameters = grid_parameters
+        self.gravity = gravity
+        self.potential = potential
+        self.shape = state_shape(grid_parameters)
+        self.energy = np.zeros(grid_parameters.time_steps)
+
+        if len(self.shape) not in (2, 3):
+            raise ValueError("The MPI slab decomposition needs a 2D or 3D grid.")
+        # Info: The features of SplitOperatorSimulation which the slab loop does not have are rejected instead of
+        #       being ignored. (The slabs are transformed with numpy and their operators are not cached.)
+        if grid_parameters.adaptive:
+            raise ValueError("The MPI slab decomposition does not support adaptive time steps.")
+        if grid_parameters.checkpoint_interval > 0:
+            raise ValueError("The MPI slab decomposition does not support checkpoints.")
+        if grid_parameters.fft_backend != "numpy":
+            raise ValueError("The MPI slab decomposition only supports the FFT backend \"numpy\".")
+        if grid_parameters.operator_cache_dir:
+            raise ValueError("The MPI slab decomposition does not support the operator cache.")
+        if grid_parameters.diagnostics_interval > 0:
+            raise ValueError("The MPI slab decomposition does not support diagnostics.")
+        if grid_parameters.profile:
+            raise ValueError("The MPI slab decomposition does not support profiling.")
+        if grid_parameters.absorbing_width > 0:
+            raise ValueError("The MPI slab decomposition does not support absorbing boundaries.")
+        if grid_parameters.engine != "numpy":
+            raise ValueError("The MPI slab decomposition only supports the engine \"numpy\".")
+
+        # Info: MPI is only initialized for supported parameters. (mpi4py initializes it on import)
+        self.comm = comm if comm is not None else default_comm()
+
+        if self.comm.Get_rank() == 0:
+            if grid.grid_parameters.history_mode != "ring" or grid.history_length != 1:
+                raise ValueError("The grid of rank 0 needs the history mode \"ring\" with a history_length of 1.")
+
+        # Info: The axes of the grid are broadcast, so every rank uses exactly the same coordinates.
+        axes = None
+        if self.comm.Get_rank() == 0:
+            axes = [grid.x_axis.real, grid.y_axis.real] + ([grid.z_axis.real] if len(self.shape) == 3 else [])
+        self.axes = self.comm.bcast(axes, root=0)
+
+        self.fft = SlabFFTBackend(self.shape, complex_dtype(grid_parameters), self.comm)
+        self.state = np.zeros(self.fft.local_shape, dtype=complex_dtype(grid_parameters))
+
+    def local_coordinates(self):
+        """
+        Returns the coordinates of the grid points of the local slab. (the same layout as the serial grids)
+        """
+
+        if len(self.shape) == 2:
+            # Info: The 2D grid uses meshgrid(x, y), so the first axis of the states belongs to y.
+            return np.meshgrid(self.axes[0], self.axes[1][self.fft.local_slice[0]])
+
+        return np.meshgrid(self.axes[0][self.fft.local_slice[0]], self.axes[1], self.axes[2], indexing="ij")
+
+    def set_init_function(self, func):
+        """
+        Sets the initial function on the grid of rank 0 and scatters it to the slabs of every rank.
+
+        :param func: The initial function.
+        """
+
+        send = None
+        if self.comm.Get_rank() == 0:
+            self.grid.set_init_function(func)
+            send = np.ascontiguousarray(self.grid.get_state(0), dtype=self.state.dtype)
+
+        self.comm.Scatter(send, self.state, root=0)
+
+    def gather(self, time_step):
+        """
+        Gathers the slabs of every rank into the grid of rank 0.
+
+        :param time_step: The timestep of the state.
+        """
+
+        # Info: The 3D grid receives the slabs directly into its state buffer. (no global copy)
+        receive = None
+        if self.comm.Get_rank() == 0:
+            if hasattr(self.grid, "state_buffer"):
+                receive = self.grid.state_buffer(time_step)
+            else:
+                receive = np.empty(self.shape, dtype=self.state.dtype)
+
+        self.comm.Gather(self.state, receive, root=0)
+
+        if self.comm.Get_rank() == 0:
+            self.grid.set_state(time_step, receive)
+            self.grid.energy[:time_step + 1] = self.energy[:time_step + 1]
+
+    def squared_wave_numbers(self):
+        """
+        Returns |k|^2 for the local part of the spectrum. (the block of the operator tables of the serial simulations)
+        """
+
+        ks = axis_wave_numbers([len(axis) for axis in self.axes], [float(axis[-1]) for axis in self.axes])
+
+        # Info: The spectrum is split along the second axis of the states, which is x in 2D (meshgrid(x, y)) and y
+        #       in 3D. Only the local block is built, so no rank needs the tables of the whole grid.
+        block_axis = 0 if len(self.shape) == 2 else 1
+        ks[block_axis] = ks[block_axis][self.fft.spectral_slice[1]]
+
+        return squared_wave_numbers(ks, "xy" if len(self.shape) == 2 else "ij")
+
+    def start_split_operator(self):
+        """
+        Starts the simulation of the Schrödinger Poison equation using the split operator method on every rank.
+        """
+
+        grid_parameters = self.grid_parameters
+        dt = grid_parameters.time_step_size
+        dtype = complex_dtype(grid_parameters)
+        dtype_real = real_dtype(grid_parameters)
+
+        # define operators (which are actually vectors, local part of the spectrum)
+        # -------------------------------------------------------------
+        k_squared = self.squared_wave_numbers()
+
+        # one momentum operator for every Strang step of the integrator
+        weights = integrator_weights(grid_parameters.integrator)
+        oprs_k = momentum_propagators(k_squared, weights, dt, dtype)
+
+        # Poisson kernel for the full spectrum of the density
+        # Info: The k=0 mode only adds a (huge) constant to the potential, which is a global phase of the state.
+        #       It is left out where the serial simulations leave it out. (3D and single precision, only rank 0 has it)
+        # ------------------------
+        poisson = poisson_kernel(k_squared).astype(dtype_real)
+        if len(self.shape) == 3 or dtype_real != np.float64:
+            poisson[k_squared == 0] = 0
+
+        # static external potential of the local slab (evaluated only once)
+        # ------------------------
+        v_ext = np.zeros(self.fft.local_shape, dtype=dtype_real)
+        if self.potential is not None:
+            v_ext[...] = np.real(self.potential(*self.local_coordinates()))
+
+        kernel = create_position_kernel(grid_parameters)
+
+        # preallocated buffers for the density and the potential of the local slab
+        # ------------------------
+        density = np.empty(self.fft.local_shape, dtype=dtype_real)
+        potential = np.empty(self.fft.local_shape, dtype=dtype_real)
+
+        # the phases of the distributed step (see split_operator_step)
+        # Info: The slab backend returns the full spectrum for rfft, which matches the full Poisson kernel.
+        # ------------------------
+        phases = StepPhases(self.fft, kernel, poisson, v_ext, self.gravity, density, potential)
+        lie = grid_parameters.integrator == "lie"
+
+        # set the first energy (sum over every rank)
+        # ------------------------
+        phases.poisson(phases.density(self.state))
+        self.energy[0] = self.comm.allreduce(np.sum(density, dtype=float))
+
+        # iterate
+        # Info: The local slab is advanced in place.
+        # ------------------------
+        for i in range(0, grid_parameters.time_steps - 1):
+
+            split_operator_step(phases, self.state, potential, dt, oprs_k, weights, lie, self.state)
+
+            self.energy[i + 1] = self.comm.allreduce(np.sum(density, dtype=float))
+
+            if (i + 1) % grid_parameters.snapshot_interval == 0 or i + 1 == grid_parameters.time_steps - 1:
+                self.gather(i + 1)
@@ -0,0 +1,228 @@
+import numpy as np
+import functools
+import hashlib
+import json
+import math
+import os
+import shutil
+
+from Simulator_Core.Integrators import integrator_weights
+from Simulator_Core.Precision import complex_dtype, real_dtype
+
+
+# The number of operator tables kept in memory. (one 256^3 table needs about 1 GB for a fourth order integrator)
+CACHE_SIZE = 8
+
+
+@functools.lru_cache(maxsize=64)
+def grid_axis(space_steps, space_step_size, even=None):
+    """
+    Returns the coordinates of the grid points of one axis. (centered around 0, read-only and cached)
+
+    :param space_steps: The number of grid points.
+    :param space_step_size: The distance between two grid points.
+    :param even: Set if the offset of an even number of grid points should be used. (default: space_steps is even)
+    """
+
+    if even is None:
+        even = (space_steps % 2) == 0
+
+    offset = -1 * int(space_steps / 2) * space_step_size
+    if even:
+        offset = offset + (space_step_size / 2)
+
+    axis = offset + np.arange(space_steps) * space_step_size
+    axis.setflags(write=False)
+
+    return axis
+
+
+def axis_wave_numbers(space_steps, axis_ends):
+    """
+    Returns the wave numbers of every axis (x, y, z) in the order of the FFT.
+
+    :param space_steps: The number of grid points of every axis.
+    :param axis_ends: The last coordinate of every axis.
+    """
+
+    # Info: From k = (2*pi)/L | The 2 vanishes since the grid is divided in half.
+    return [np.fft.fftfreq(steps) * (steps / 2) * math.pi / end for steps, end in zip(space_steps, axis_ends)]
+
+
+def squared_wave_numbers(wave_numbers, indexing):
+    """
+    Returns |k|^2 of the spectrum. (or of a block of the spectrum, if the wave numbers of an axis are a block)
+
+    :param wave_numbers: The wave numbers of every axis (x, y, z).
+    :param indexing: The indexing of the meshgrid of the axes. ("xy" or "ij")
+    """
+
+    return sum(np.square(k) for k in np.meshgrid(*wave_numbers, indexing=indexing, sparse=True))
+
+
+def poisson_kernel(k_squared):
+    """
+    Returns the Poisson kernel -1/|k|^2 for the (full) spectrum of the density.
+    Since a division by 0 is not allowed, |k| = 0.0001 is used for the k=0 mode. (only the kernel is regularized,
+    the momentum operators use the exact |k|^2)
+
+    :param k_squared: |k|^2 of the spectrum. (or of a block of the spectrum)
+    """
+
+    k = np.sqrt(k_squared)
+    k[k_squared == 0] = 0.0001
+
+    return -1 / np.power(k, 2)
+
+
+def momentum_propagators(k_squared, weights, time_step_size, dtype):
+    """
+    Returns the momentum operators exp(-i/2 |k|^2 weight dt) of every Strang step of an integrator.
+
+    :param k_squared: |k|^2 of the spectrum. (or of a block of the spectrum)
+    :param weights: The weights of the Strang steps of the integrator.
+    :param time_step_size: The time step size of one step of the integrator.
+    :param dtype: The complex data type of the momentum operators.
+    """
+
+    return [np.exp(-0.5 * 1j * k_squared * weight * time_step_size).astype(dtype) for weight in weights]
+
+
+class OperatorTables:
+
+    def __init__(self, space_steps, axis_ends, indexing, time_step_size, integrator, dtype, dtype_real,
+                 drop_zero_mode, arrays=None):
+        """
+        The operators of the split operator method of one grid. (read-only, see operator_tables)
+
+        :param space_steps: The number of grid points of every axis (x, y, z).
+        :param axis_ends: The last coordinate of every axis (x, y, z). (defines the wave numbers)
+        :param indexing: The indexing of the meshgrid of the axes. ("xy" or "ij")
+        :param time_step_size: The time step size of the momentum operators.
+        :param integrator: The integrator of the momentum operators.
+        :param dtype: The complex data type of the momentum operators.
+        :param dtype_real: The real data type of the Poisson kernel.
+        :param drop_zero_mode: Set to true if the k=0 mode of the Poisson kernel should be left out.
+        :param arrays: The arrays of the tables loaded from the disk. (optional, see build)
+        """
+
+        self.dtype = np.dtype(dtype)
+        self.weights = integrator_weights(integrator)
+
+        if arrays is None:
+            arrays = self.build(space_steps, axis_ends, indexing, time_step_size, np.dtype(dtype_real), drop_zero_mode)
+
+        for array in arrays.values():
+            array.setflags(write=False)
+
+        self.arrays = arrays
+        self.axis_wave_numbers = [arrays["wave_numbers_" + str(n)] for n in range(len(axis_ends))]
+        self.wave_numbers = np.meshgrid(*self.axis_wave_numbers, indexing=indexing, sparse=True)
+        self.k_squared = arrays["k_squared"]
+        self.poisson = arrays["poisson"]
+        self.oprs_k = list(arrays["momentum_operators"])
+        self.k_max = math.sqrt(np.max(self.k_squared))
+
+    def build(self, space_steps, axis_ends, indexing, time_step_size, dtype_real, drop_zero_mode):
+        """
+        Calculates the arrays of the tables. (see __init__)
+        """
+
+        ks = axis_wave_numbers(space_steps, axis_ends)
+        k_squared = squared_wave_numbers(ks, indexing)
+
+        # Poisson kernel for the half spectrum of the real FFT of the density
+        # Info: |k| is symmetric, so the half spectrum is the first half of the last axis.
+        #       The k=0 mode only adds a (huge) constant to the potential, which is a global phase of the state.
+        # ------------------------
+        poisson = poisson_kernel(k_squared)
+        poisson = poisson[..., :k_squared.shape[-1] // 2 + 1].astype(dtype_real)
+        if drop_zero_mode:
+            poisson.flat[0] = 0
+
+        arrays = {"k_squared": k_squared, "poisson": poisson,
+                  "momentum_operators": np.array(self.propagators(k_squared, time_step_size, self.dtype))}
+        for n, k_axis in enumerate(ks):
+            arrays["wave_numbers_" + str(n)] = k_axis
+
+        return arrays
+
+    def propagators(self, k_squared, time_step_size, dtype):
+        """
+        Returns the momentum operators of one step of the integrator. (see momentum_operators)
+        """
+
+        return momentum_propagators(k_squared, self.weights, time_step_size, dtype)
+
+    def momentum_operators(self, time_step_size):
+        """
+        Returns the momentum operators of one step of the integrator for any time step size. (not cached)
+
+        :param time_step_size: The time step size of the step.
+        """
+
+        return self.propagators(self.k_squared, time_step_size, self.dtype)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def load_operator_tables(space_steps, spacings, axis_ends, indexing, time_step_size, integrator, dtype, dtype_real,
+                         drop_zero_mode, cache_dir):
+    """
+    Returns the operator tables of a key from the disk cache or calculates them. (cached in memory, see
+    operator_tables)
+    """
+
+    arguments = (space_steps, axis_ends, indexing, time_step_size, integrator, dtype, dtype_real, drop_zero_mode)
+
+    if not cache_dir:
+        return OperatorTables(*arguments)
+
+    key = json.dumps([space_steps, spacings, axis_ends, indexing, time_step_size, integrator, dtype, dtype_real,
+                      drop_zero_mode])
+    path = os.path.join(cache_dir, "operators_" + hashlib.sha1(key.encode()).hexdigest()[:16])
+
+    if os.path.exists(path):
+        return OperatorTables(*arguments, arrays={name[:-len(".npy")]: np.load(os.path.join(path, name))
+                                                  for name in os.listdir(path) if name.endswith(".npy")})
+
+    tables = OperatorTables(*arguments)
+
+    # Info: The tables are written into a temporary directory, which is then renamed. (safe for parallel sweeps)
+    tmp = path + ".tmp" + str(os.getpid())
+    os.makedirs(tmp, exist_ok=True)
+    for name, array in tables.arrays.items():
+        np.save(os.path.join(tmp, name + ".npy"), array)
+    with open(os.path.join(tmp, "key.json"), "w") as file:
+        file.write(key)
+
+    try:
+        os.replace(tmp, path)
+    except OSError:
+        # another process stored the same tables first
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    return tables
+
+
+def operator_tables(grid_parameters, axes, indexing="ij", drop_zero_mode=False):
+    """
+    Returns the (read-only) operator tables of a grid: the wave numbers, |k|^2, the Poisson kernel and the momentum
+    operators of the time step size. Tables are cached in memory (LRU, CACHE_SIZE tables) and in the
+    operator_cache_dir of the grid parameters (if set), keyed by the number of grid points, the spacings and the
+    extent of the axes, the time step size, the integrator and the precision.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param axes: The coordinates of every axis (x, y, z) of the grid.
+    :param indexing: The indexing of the states. ("xy" for the 2D grid, whose first axis is the y-axis)
+    :param drop_zero_mode: Set to true if the k=0 mode of the Poisson kernel should be left out.
+    """
+
+    axes = [np.real(axis) for axis in axes]
+    space_steps = tuple(len(axis) for axis in axes)
+    spacings = tuple(float(axis[1] - axis[0]) if len(axis) > 1 else 0.0 for axis in axes)
+    axis_ends = tuple(float(axis[-1]) for axis in axes)
+
+    return load_operator_tables(space_steps, spacings, axis_ends, indexing, float(grid_parameters.time_step_size),
+                                grid_parameters.integrator, complex_dtype(grid_parameters).name,
+                                real_dtype(grid_parameters).name, bool(drop_zero_mode),
+                                grid_parameters.operator_cache_dir)
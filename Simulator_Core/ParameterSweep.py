@@ -0,0 +1,306 @@
+import numpy as np
+import concurrent.futures
+import dataclasses
+import itertools
+import json
+import csv
+import os
+import sys
+import time
+import traceback
+
+
+def sweep_points(variations):
+    """
+    Returns every combination of the variations as a list of dictionaries. (cartesian product)
+
+    Every key is either a field of the grid parameters or one of "gravity", "initial_function" and
+    "potential_function". Functions have to be defined on module level, so they can be sent to the workers.
+
+    :param variations: Dictionary with a list of values for every varied parameter.
+    """
+
+    names = list(variations)
+
+    return [dict(zip(names, values)) for values in itertools.product(*(variations[name] for name in names))]
+
+
+def describe(value):
+    """
+    Returns a json serializable description of a value of a sweep point. (functions are described by their name)
+
+    :param value: The value of the sweep point.
+    """
+
+    if callable(value):
+        return getattr(value, "__name__", repr(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (tuple, list)):
+        return [describe(item) for item in value]
+
+    return value
+
+
+def describe_parameters(base_parameters, point):
+    """
+    Returns the json serializable description of every parameter of a sweep point: the fields, the initial function
+    and the potential function of the base parameters, replaced by the varied parameters of the point. (see describe)
+
+    :param base_parameters: The grid parameters which are not varied. (dataclass)
+    :param point: Dictionary with the varied parameters of the point.
+    """
+
+    parameters = {field.name: describe(getattr(base_parameters, field.name))
+                  for field in dataclasses.fields(base_parameters)}
+    parameters["initial_function"] = describe(base_parameters.initial_function)
+    parameters["potential_function"] = describe(base_parameters.potential_function)
+    parameters.update({name: describe(value) for name, value in point.items()})
+
+    return parameters
+
+
+class SelectedSnapshotSink:
+
+    def __init__(self, time_steps):
+        """
+        Sink which keeps a copy of the states of the selected timesteps.
+
+        :param time_steps: The selected timesteps. (have to be multiples of the snapshot_interval)
+        """
+
+        self.time_steps = set(time_steps)
+        self.snapshots = {}
+
+    def write(self, time_step, state):
+        """
+        Keeps the state if the timestep is selected.
+
+        :param time_step: The timestep of the state.
+        :param state: The wave function at the timestep.
+        """
+
+        if time_step in self.time_steps:
+            self.snapshots["time_step_" + str(time_step)] = np.array(state)
+
+
+def write_json(path, data):
+    """
+    Writes a dictionary atomically into a json file.
+
+    :param path: The path of the json file.
+    :param data: The dictionary.
+    """
+
+    with open(path + ".tmp", "w") as file:
+        json.dump(data, file, indent=4)
+    os.replace(path + ".tmp", path)
+
+
+def limit_threads(threads):
+    """
+    Limits the threads of every library of a worker process, so the workers do not oversubscribe the cores.
+
+    :param threads: The number of threads of one worker.
+    """
+
+    for variable in ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS", "NUMEXPR_NUM_THREADS",
+                     "NUMBA_NUM_THREADS"]:
+        os.environ[variable] = str(threads)
+
+    # Info: With the "fork" start method the libraries might already be imported by the parent process.
+    if "numexpr" in sys.modules:
+        sys.modules["numexpr"].set_num_threads(threads)
+    if "numba" in sys.modules:
+        sys.modules["numba"].set_num_threads(min(threads, sys.modules["numba"].config.NUMBA_NUM_THREADS))
+
+
+def run_point(base_parameters, point, path, snapshot_time_steps, threads):
+    """
+    Runs the simulation of one sweep point and writes its results into a directory. (executed by the workers)
+
+    The directory contains result.json (the point, every parameter, the status and a short summary), energy.npy,
+    time.npy, snapshots.npz with the selected snapshots and diagnostics.npy. (if a diagnostics_interval is set)
+
+    :param base_parameters: The grid parameters which are not varied. (dataclass)
+    :param point: Dictionary with the varied parameters of this point.
+    :param path: The directory of the point.
+    :param snapshot_time_steps: The timesteps of which the states are written to the disk.
+    :param threads: The number of FFT threads of the simulation.
+    """
+
+    if not os.path.exists(path):
+        os.makedirs(path)
+
+    result = {"point": {name: describe(value) for name, value in point.items()},
+              "parameters": describe_parameters(base_parameters, point), "status": "running"}
+    start = time.perf_counter()
+
+    try:
+        fields = {field.name for field in dataclasses.fields(base_parameters)}
+        overrides = {name: value for name, value in point.items() if name in fields}
+        unknown = set(point) - fields - {"gravity", "initial_function", "potential_function"}
+        if unknown:
+            raise ValueError("Unknown sweep parameters: " + ", ".join(sorted(unknown)))
+
+        # Info: Only the energy and the selected snapshots are kept, so the grid does not need the whole history.
+        grid_parameters = dataclasses.replace(base_parameters, **overrides)
+        grid_parameters = dataclasses.replace(grid_parameters, history_mode="ring", history_length=1,
+                                              fft_workers=threads)
+
+        initial_function = point.get("initial_function", grid_parameters.initial_function)
+        potential_function = point.get("potential_function", grid_parameters.potential_function)
+        sink = SelectedSnapshotSink(snapshot_time_steps)
+
+        if hasattr(grid_parameters, "space_steps"):
+            from Simulator_1D.Grid import Grid
+            from Simulator_1D.Simulation import Simulation
+
+            grid = Grid(grid_parameters, sink)
+            simulation = Simulation(grid, potential_function, point.get("gravity", 5))
+        elif hasattr(grid_parameters, "space_steps_Z"):
+            from Simulator_3D.Grid import Grid
+            from Simulator_3D.Simulation import Simulation
+
+            grid = Grid(grid_parameters, sink)
+            simulation = Simulation(grid, point.get("gravity", grid_parameters.input_gravity), potential_function)
+        else:
+            from Simulator_2D.Grid import Grid
+            from Simulator_2D.Simulation import Simulation
+
+            grid = Grid(grid_parameters, sink)
+            simulation = Simulation(grid, point.get("gravity", grid_parameters.input_gravity), potential_function)
+
+        simulation.set_init_function(initial_function)
+        simulation.start_split_operator()
+
+        np.save(os.path.join(path, "energy.npy"), grid.energy)
+        np.save(os.path.join(path, "time.npy"), grid.time)
+        np.savez(os.path.join(path, "snapshots.npz"), **sink.snapshots)
+        if len(grid.diagnostics) > 0:
+            np.save(os.path.join(path, "diagnostics.npy"), grid.diagnostics)
+            result["final_total_energy"] = float(grid.diagnostics["total_energy"][-1])
+
+        result["status"] = "done"
+        result["final_energy"] = float(grid.energy[-1])
+        result["final_time"] = float(grid.time[-1])
+    except Exception as error:
+        result["status"] = "failed"
+        result["error"] = repr(error)
+        result["traceback"] = traceback.format_exc()
+
+    result["wall_clock_time"] = time.perf_counter() - start
+    write_json(os.path.join(path, "result.json"), result)
+
+    return result
+
+
+def point_path(output_dir, index):
+    """
+    Returns the directory of one sweep point.
+
+    :param output_dir: The directory of the sweep.
+    :param index: The index of the sweep point.
+    """
+
+    return os.path.join(output_dir, "point_" + str(index).zfill(4))
+
+
+def run_sweep(base_parameters, variations, output_dir, max_workers=None, threads_per_worker=1,
+              snapshot_time_steps=(), resume=True):
+    """
+    Runs every combination of the variations in a pool of processes and writes a summary of the sweep.
+    Points which are already done with the same parameters are skipped if resume is set, failed or missing points
+    and points whose parameters (base or varied) have changed are run again.
+
+    :param base_parameters: The grid parameters which are not varied. (1D, 2D or 3D dataclass)
+    :param variations: Dictionary with a list of values for every varied parameter. (see sweep_points)
+    :param output_dir: The directory in which the results of the sweep are written.
+    :param max_workers: The number of worker processes. (None uses every core / threads_per_worker)
+    :param threads_per_worker: The number of threads (FFT, numexpr, numba) of one worker.
+    :param snapshot_time_steps: The timesteps of which the states are written to the disk.
+    :param resume: Set to true if points which are already done should be skipped.
+    """
+
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    if max_workers is None:
+        max_workers = max(1, (os.cpu_count() or 1) // threads_per_worker)
+
+    points = sweep_points(variations)
+    results = [None] * len(points)
+
+    pending = []
+    for index, point in enumerate(points):
+        result_path = os.path.join(point_path(output_dir, index), "result.json")
+        if resume and os.path.exists(result_path):
+            with open(result_path) as file:
+                result = json.load(file)
+            # Info: The results are stored by the index of the point, which changes its meaning with the variations.
+            if result["status"] == "done" and result.get("parameters") == describe_parameters(base_parameters, point):
+                results[index] = result
+                continue
+        pending.append(index)
+
+    print("Sweep: " + str(len(points)) + " points, " + str(len(points) - len(pending)) + " already done.")
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=limit_threads,
+                                                initargs=(threads_per_worker,)) as executor:
+        futures = {executor.submit(run_point, base_parameters, points[index], point_path(output_dir, index),
+                                   tuple(snapshot_time_steps), threads_per_worker): index for index in pending}
+
+        for n, future in enumerate(concurrent.futures.as_completed(futures)):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as error:
+                # Info: Errors of the simulation are caught by the worker, this is e.g. a crashed worker process.
+                results[index] = {"point": {name: describe(value) for name, value in points[index].items()},
+                                  "status": "failed", "error": repr(error)}
+            print("Finished point " + str(index) + ": " + results[index]["status"] +
+                  " (" + str(n + 1) + "/" + str(len(pending)) + ")")
+
+    write_summary(os.path.join(output_dir, "summary.csv"), results)
+    print_summary(results)
+
+    return results
+
+
+def write_summary(path, results):
+    """
+    Writes one row for every sweep point into a csv file.
+
+    :param path: The path of the csv file.
+    :param results: The results of the sweep points.
+    """
+
+    names = list(results[0]["point"]) if results else []
+    columns = ["index"] + names + ["status", "final_energy", "final_time", "wall_clock_time", "error"]
+
+    with open(path + ".tmp", "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for index, result in enumerate(results):
+            writer.writerow([index] + [result["point"].get(name) for name in names] +
+                            [result.get(column, "") for column in columns[len(names) + 1:]])
+    os.replace(path + ".tmp", path)
+
+
+def print_summary(results):
+    """
+    Prints a table with one row for every sweep point.
+
+    :param results: The results of the sweep points.
+    """
+
+    names = list(results[0]["point"]) if results else []
+    print(" ".join(["index".ljust(6)] + [name[:16].ljust(16) for name in names] +
+                   ["status".ljust(8), "final energy".ljust(14), "wall clock [s]"]))
+
+    for index, result in enumerate(results):
+        final_energy = result.get("final_energy")
+        print(" ".join([str(index).ljust(6)] + [str(result["point"].get(name))[:16].ljust(16) for name in names] +
+                       [result["status"].ljust(8),
+                        ("" if final_energy is None else format(final_energy, ".6e")).ljust(14),
+                        format(result.get("wall_clock_time", 0), ".3f")]))
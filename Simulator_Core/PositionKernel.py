@@ -0,0 +1,171 @@
+import numpy as np
+
+
+class NumpyPositionKernel:
+
+    def __init__(self):
+        """
+        Kernel for the density and the position step using numpy. (creates temporary arrays)
+        """
+
+        self.name = "numpy"
+
+    @staticmethod
+    def density(state, out):
+        """
+        Calculates the density |u|^2 of a state.
+
+        :param state: The wave function.
+        :param out: Preallocated real array for the result.
+        """
+
+        np.abs(state, out=out)
+        np.square(out, out=out)
+
+        return out
+
+    @staticmethod
+    def position(tmp, v, v_ext, gravity, dt, out):
+        """
+        Applies the position operator exp(-i (gravity * v + v_ext) dt) to a state.
+
+        :param tmp: The wave function after the momentum step.
+        :param v: The potential of the Poisson equation.
+        :param v_ext: The static external potential.
+        :param gravity: The "gravity" of the system.
+        :param dt: The time step size.
+        :param out: Preallocated complex array for the result.
+        """
+
+        np.multiply(tmp, np.exp(-1j * (v * gravity + v_ext) * dt), out=out)
+
+        return out
+
+
+class NumexprPositionKernel:
+
+    def __init__(self):
+        """
+        Kernel for the density and the position step using numexpr. (one pass without temporary arrays)
+        """
+
+        try:
+            import numexpr
+        except ImportError:
+            raise ImportError("The position kernel \"numexpr\" requires the package numexpr.")
+
+        self.name = "numexpr"
+        self.numexpr = numexpr
+
+    def density(self, state, out):
+        """
+        Calculates the density |u|^2 of a state.
+
+        :param state: The wave function.
+        :param out: Preallocated real array for the result.
+        """
+
+        return self.numexpr.evaluate("real(state)**2 + imag(state)**2", local_dict={"state": state}, out=out)
+
+    def position(self, tmp, v, v_ext, gravity, dt, out):
+        """
+        Applies the position operator exp(-i (gravity * v + v_ext) dt) to a state.
+
+        :param tmp: The wave function after the momentum step.
+        :param v: The potential of the Poisson equation.
+        :param v_ext: The static external potential.
+        :param gravity: The "gravity" of the system.
+        :param dt: The time step size.
+        :param out: Preallocated complex array for the result.
+        """
+
+        return self.numexpr.evaluate("tmp * exp(-1j * (v * gravity + v_ext) * dt)",
+                                     local_dict={"tmp": tmp, "v": v, "v_ext": v_ext, "gravity": gravity, "dt": dt},
+                                     out=out)
+
+
+# The compiled numba functions are shared by every kernel, so they are only compiled once per process.
+numba_functions = {}
+
+
+class NumbaPositionKernel:
+
+    def __init__(self):
+        """
+        Kernel for the density and the position step using parallel numba loops. (one pass without temporary arrays)
+        """
+
+        try:
+            import numba
+        except ImportError:
+            raise ImportError("The position kernel \"numba\" requires the package numba.")
+
+        self.name = "numba"
+
+        if not numba_functions:
+
+            @numba.njit(parallel=True, cache=True)
+            def density(state, out):
+                state_flat = state.reshape(-1)
+                out_flat = out.reshape(-1)
+                for n in numba.prange(state_flat.size):
+                    out_flat[n] = state_flat[n].real * state_flat[n].real + state_flat[n].imag * state_flat[n].imag
+                return out
+
+            @numba.njit(parallel=True, cache=True)
+            def position(tmp, v, v_ext, gravity, dt, out):
+                tmp_flat = tmp.reshape(-1)
+                v_flat = v.reshape(-1)
+                v_ext_flat = v_ext.reshape(-1)
+                out_flat = out.reshape(-1)
+                for n in numba.prange(tmp_flat.size):
+                    phase = -1 * (v_flat[n] * gravity + v_ext_flat[n]) * dt
+                    out_flat[n] = tmp_flat[n] * complex(np.cos(phase), np.sin(phase))
+                return out
+
+            numba_functions["density"] = density
+            numba_functions["position"] = position
+
+    @staticmethod
+    def density(state, out):
+        """
+        Calculates the density |u|^2 of a state.
+
+        :param state: The wave function.
+        :param out: Preallocated real array for the result. (C-contiguous)
+        """
+
+        return numba_functions["density"](np.ascontiguousarray(state), out)
+
+    @staticmethod
+    def position(tmp, v, v_ext, gravity, dt, out):
+        """
+        Applies the position operator exp(-i (gravity * v + v_ext) dt) to a state.
+
+        :param tmp: The wave function after the momentum step.
+        :param v: The potential of the Poisson equation.
+        :param v_ext: The static external potential.
+        :param gravity: The "gravity" of the system.
+        :param dt: The time step size.
+        :param out: Preallocated complex array for the result. (C-contiguous)
+        """
+
+        return numba_functions["position"](np.ascontiguousarray(tmp), np.ascontiguousarray(v),
+                                           np.ascontiguousarray(v_ext), float(gravity), float(dt), out)
+
+
+def create_position_kernel(grid_parameters):
+    """
+    Creates the position kernel which is selected in the grid parameters.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    if grid_parameters.position_kernel == "numpy":
+        return NumpyPositionKernel()
+    elif grid_parameters.position_kernel == "numexpr":
+        return NumexprPositionKernel()
+    elif grid_parameters.position_kernel == "numba":
+        return NumbaPositionKernel()
+
+    raise ValueError("Unknown position kernel: " + str(grid_parameters.position_kernel))
@@ -0,0 +1,49 @@
+import numpy as np
+
+
+def complex_dtype(grid_parameters):
+    """
+    Returns the complex data type of the states for the precision selected in the grid parameters.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    if grid_parameters.precision == "double":
+        return np.dtype(np.complex128)
+    elif grid_parameters.precision == "single":
+        return np.dtype(np.complex64)
+
+    raise ValueError("Unknown precision: " + str(grid_parameters.precision))
+
+
+def real_dtype(grid_parameters):
+    """
+    Returns the real data type (density, potential) for the precision selected in the grid parameters.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    return np.finfo(complex_dtype(grid_parameters)).dtype
+
+
+def drift_report(energy, reference_energy=None):
+    """
+    Returns the accumulated drift of the norm (the energy trace) of a run as a dictionary.
+    The norm is conserved by the split operator method, so every drift comes from rounding errors.
+    If the energy trace of a double precision run is given, the difference to it is reported as well.
+
+    :param energy: The energy trace of the run.
+    :param reference_energy: The energy trace of the same run in double precision. (optional, same timesteps)
+    """
+
+    energy = np.asarray(energy, dtype=float)
+    drift = np.abs(energy / energy[0] - 1)
+    report = {"max_norm_drift": float(np.max(drift)), "final_norm_drift": float(drift[-1])}
+
+    if reference_energy is not None:
+        reference_energy = np.asarray(reference_energy, dtype=float)
+        difference = np.abs(energy - reference_energy) / abs(reference_energy[0])
+        report["max_reference_difference"] = float(np.max(difference))
+        report["final_reference_difference"] = float(difference[-1])
+
+    return report
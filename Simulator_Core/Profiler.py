@@ -0,0 +1,147 @@
+import copy
+import json
+import os
+import time
+
+
+# The maximal number of timed calls which are kept for the trace file. (the totals always contain every call)
+MAX_EVENTS = 1000000
+
+
+def create_profiler(grid_parameters):
+    """
+    Returns a PhaseProfiler if profiling is enabled in the grid parameters, otherwise None.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    if grid_parameters.profile:
+        return PhaseProfiler()
+
+    return None
+
+
+class PhaseProfiler:
+
+    def __init__(self):
+        """
+        Measures the time spent in every phase of a run. (forward and inverse FFT, Poisson, kinetic, position,
+        density, absorbing, diagnostics, storage and the operators of adaptive steps)
+
+        The phases are timed by wrapping the functions which carry them out (see timed and instrument), so a run
+        without profiling does not contain any timer. Nested phases (e.g. the FFTs of the Poisson solver) are
+        subtracted from the exclusive time of the outer phase.
+        """
+
+        self.calls = {}
+        self.inclusive = {}
+        self.exclusive = {}
+        self.events = []
+        self.stack = []
+        self.start_time = time.perf_counter()
+        self.wall_clock_time = 0.0
+
+    def timed(self, name, function):
+        """
+        Returns a function which times every call of a function as a phase.
+
+        :param name: The name of the phase.
+        :param function: The function which carries out the phase.
+        """
+
+        def timed_function(*args, **kwargs):
+            self.stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                nested = self.stack.pop()
+                if self.stack:
+                    self.stack[-1] += duration
+
+                self.calls[name] = self.calls.get(name, 0) + 1
+                self.inclusive[name] = self.inclusive.get(name, 0.0) + duration
+                self.exclusive[name] = self.exclusive.get(name, 0.0) + duration - nested
+                if len(self.events) < MAX_EVENTS:
+                    self.events.append((name, start, duration))
+
+        return timed_function
+
+    def instrument(self, instance, phases):
+        """
+        Returns a copy of an object whose methods are timed as phases. (the object itself stays unchanged)
+
+        :param instance: The object. (e.g. the FFT backend or the position kernel)
+        :param phases: Dictionary with the name of the phase of every timed method.
+        """
+
+        instrumented = copy.copy(instance)
+        for method, name in phases.items():
+            setattr(instrumented, method, self.timed(name, getattr(instance, method)))
+
+        return instrumented
+
+    def finish(self, path=""):
+        """
+        Stops the wall clock time of the run, prints the report and writes the trace file. (if a path is given)
+        Every time which is not spent in a phase is reported as "other".
+
+        :param path: The json file of the trace. (optional, see write_trace)
+        """
+
+        self.wall_clock_time = time.perf_counter() - self.start_time
+        self.print_report()
+
+        if path:
+            self.write_trace(path)
+
+    def report(self):
+        """
+        Returns the calls, the inclusive and exclusive time in seconds and the share of the wall clock time (in
+        percent, by the exclusive time) of every phase as a dictionary.
+        """
+
+        wall_clock_time = self.wall_clock_time or (time.perf_counter() - self.start_time)
+
+        phases = {}
+        for name in sorted(self.exclusive, key=self.exclusive.get, reverse=True):
+            phases[name] = {"calls": self.calls[name],
+                            "total": self.inclusive[name],
+                            "exclusive": self.exclusive[name],
+                            "percent": 100 * self.exclusive[name] / wall_clock_time}
+
+        other = wall_clock_time - sum(self.exclusive.values())
+        phases["other"] = {"calls": 0, "total": other, "exclusive": other, "percent": 100 * other / wall_clock_time}
+
+        return {"wall_clock_time": wall_clock_time, "phases": phases}
+
+    def print_report(self):
+        """
+        Prints a table with one row for every phase.
+        """
+
+        report = self.report()
+        print("phase".ljust(14) + "calls".rjust(10) + "total [s]".rjust(12) + "exclusive [s]".rjust(15) +
+              "share".rjust(9))
+
+        for name, phase in report["phases"].items():
+            print(name.ljust(14) + str(phase["calls"]).rjust(10) + format(phase["total"], ".4f").rjust(12) +
+                  format(phase["exclusive"], ".4f").rjust(15) + (format(phase["percent"], ".1f") + " %").rjust(9))
+
+        print("wall clock time: " + format(report["wall_clock_time"], ".4f") + " s")
+
+    def write_trace(self, path):
+        """
+        Writes the timed calls into a json file in the Chrome trace event format. (chrome://tracing or Perfetto)
+        The report is stored in the metadata of the file.
+
+        :param path: The json file of the trace.
+        """
+
+        events = [{"name": name, "ph": "X", "ts": (start - self.start_time) * 1e6, "dur": duration * 1e6,
+                   "pid": os.getpid(), "tid": 0} for name, start, duration in self.events]
+
+        with open(path + ".tmp", "w") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms", "otherData": self.report()}, file)
+        os.replace(path + ".tmp", path)
@@ -0,0 +1,267 @@
+import numpy as np
+
+
+def evaluate_on_grid(function, axes, indexing="ij", out=None):
+    """
+    Evaluates an initial or potential function on every grid point.
+
+    Profiles are evaluated on the sparse grid (one array per axis), so the factors of separable profiles are only
+    calculated once per axis and the full grid is only touched by the final product, which is written directly into
+    out. Other functions get the full meshgrid of the real coordinates and their result is copied into out.
+
+    :param function: The function. (a Profile or a function of the coordinates)
+    :param axes: The coordinates of every axis (x, y, z) of the grid.
+    :param indexing: The indexing of the states. ("xy" for the 2D grid, whose first axis is the y-axis)
+    :param out: Preallocated array for the result. (optional, e.g. the state buffer of the grid)
+    """
+
+    coordinates = np.meshgrid(*[np.real(axis) for axis in axes], indexing=indexing,
+                              sparse=isinstance(function, Profile))
+
+    if isinstance(function, Profile):
+        return function(*coordinates, out=out)
+
+    value = function(*coordinates)
+
+    if out is None:
+        return value
+
+    np.copyto(out, value)
+
+    return out
+
+
+class Profile:
+
+    def __init__(self, center):
+        """
+        Base class of the profiles. A profile is called with the coordinates (x, y, z) like the functions of the grid
+        parameters and only uses as many coordinates as its center has. (further arguments like u are ignored)
+
+        :param center: The center of the profile. (one coordinate per dimension)
+        """
+
+        self.center = tuple(center)
+
+    def __call__(self, *coordinates, out=None):
+        return self.evaluate([np.real(x) for x in coordinates[:len(self.center)]], out)
+
+    def __add__(self, other):
+        return ProfileSum(self, other)
+
+    def __repr__(self):
+        parameters = ", ".join(name + "=" + repr(value) for name, value in vars(self).items())
+        return type(self).__name__ + "(" + parameters + ")"
+
+    def evaluate(self, coordinates, out=None):
+        """
+        Returns the profile at the coordinates. (broadcastable arrays, e.g. a sparse meshgrid)
+        Separable profiles write their product (or sum) of the axes directly into out, the others only write their
+        last operation into out.
+
+        :param coordinates: The real coordinates of every axis.
+        :param out: Preallocated array of the full grid for the result. (optional, e.g. the state buffer)
+        """
+
+        raise NotImplementedError
+
+    def radius_squared(self, coordinates, out=None):
+        """
+        Returns the squared distance of the coordinates to the center.
+
+        :param coordinates: The real coordinates of every axis.
+        :param out: Preallocated array of the full grid for the result. (optional)
+        """
+
+        squares = [np.square(x - c) for x, c in zip(coordinates, self.center)]
+
+        # Info: With sparse coordinates only the last sum has the size of the grid.
+        value = 0
+        for square in squares[:-1]:
+            value = value + square
+
+        return np.add(value, squares[-1], out=out)
+
+
+class ProfileSum(Profile):
+
+    def __init__(self, *profiles):
+        """
+        The sum of several profiles. (e.g. Gaussian((-4, -4)) + Gaussian((4, 4)))
+
+        :param profiles: The profiles.
+        """
+
+        super().__init__(max((profile.center for profile in profiles), key=len))
+        self.profiles = profiles
+
+    def __add__(self, other):
+        return ProfileSum(*self.profiles, other)
+
+    def __repr__(self):
+        return " + ".join(repr(profile) for profile in self.profiles)
+
+    def evaluate(self, coordinates, out=None):
+        value = self.profiles[0].evaluate(coordinates[:len(self.profiles[0].center)], out)
+        for profile in self.profiles[1:]:
+            if out is None:
+                value = value + profile.evaluate(coordinates[:len(profile.center)])
+            else:
+                np.add(out, profile.evaluate(coordinates[:len(profile.center)]), out=out)
+
+        return value
+
+
+class Gaussian(Profile):
+
+    def __init__(self, center, width=1.0, momentum=None, amplitude=1.0):
+        """
+        Gaussian wave packet amplitude * exp(-|x - center|^2 / (2 width^2)) * exp(i momentum . x). (separable)
+
+        :param center: The center of the packet. (one coordinate per dimension)
+        :param width: The standard deviation of the packet.
+        :param momentum: The wave vector of the phase. (optional, one component per dimension)
+        :param amplitude: The amplitude at the center.
+        """
+
+        super().__init__(center)
+        self.width = width
+        self.momentum = tuple(momentum) if momentum is not None else (0,) * len(self.center)
+        self.amplitude = amplitude
+
+    def evaluate(self, coordinates, out=None):
+        factors = []
+        for x, c, k in zip(coordinates, self.center, self.momentum):
+            factor = np.exp(-np.square(x - c) / (2 * self.width ** 2))
+            if k != 0:
+                factor = factor * np.exp(1j * k * x)
+            factors.append(factor)
+
+        # Info: With sparse coordinates only the last product has the size of the grid.
+        value = self.amplitude
+        for factor in factors[:-1]:
+            value = value * factor
+
+        return np.multiply(value, factors[-1], out=out)
+
+
+class Soliton(Profile):
+
+    def __init__(self, center, core_radius=1.0, amplitude=1.0):
+        """
+        Ground state (soliton) of a self-gravitating scalar field: amplitude * (1 + 0.091 (r / core_radius)^2)^-4,
+        so the density falls to half of its central value at the core radius.
+
+        :param center: The center of the soliton. (one coordinate per dimension)
+        :param core_radius: The core radius.
+        :param amplitude: The amplitude at the center.
+        """
+
+        super().__init__(center)
+        self.core_radius = core_radius
+        self.amplitude = amplitude
+
+    def evaluate(self, coordinates, out=None):
+        return np.multiply(self.amplitude, (1 + 0.091 * self.radius_squared(coordinates) / self.core_radius ** 2) ** -4,
+                           out=out)
+
+
+class RandomField(Profile):
+
+    def __init__(self, dimension, correlation_length=1.0, amplitude=1.0, seed=0):
+        """
+        Complex Gaussian random field with a Gaussian correlation of the given length. (white noise filtered in
+        Fourier space, the root mean square of the field is the amplitude)
+
+        :param dimension: The dimension of the grid.
+        :param correlation_length: The correlation length of the field.
+        :param amplitude: The root mean square of the field.
+        :param seed: The seed of the random numbers. (the same seed gives the same field)
+        """
+
+        super().__init__((0,) * dimension)
+        self.correlation_length = correlation_length
+        self.amplitude = amplitude
+        self.seed = seed
+
+    def evaluate(self, coordinates, out=None):
+        shape = np.broadcast_shapes(*[np.shape(x) for x in coordinates])
+        rng = np.random.default_rng(self.seed)
+        noise = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+
+        # wave numbers of the axis along which every coordinate changes (works for sparse and full meshgrids)
+        k_squared = 0
+        for x in coordinates:
+            x = np.broadcast_to(x, shape)
+            for axis in range(len(shape)):
+                if shape[axis] > 1 and np.take(x, 1, axis=axis).flat[0] != np.take(x, 0, axis=axis).flat[0]:
+                    spacing = abs(np.take(x, 1, axis=axis).flat[0] - np.take(x, 0, axis=axis).flat[0])
+                    k = 2 * np.pi * np.fft.fftfreq(shape[axis], spacing)
+                    k_squared = k_squared + np.square(k).reshape([-1 if n == axis else 1 for n in range(len(shape))])
+                    break
+
+        field = np.fft.ifftn(np.fft.fftn(noise) * np.exp(-k_squared * self.correlation_length ** 2 / 4))
+
+        return np.divide(self.amplitude * field, np.sqrt(np.mean(np.square(np.abs(field)))), out=out)
+
+
+class Harmonic(Profile):
+
+    def __init__(self, center, strength=1.0):
+        """
+        Harmonic potential 0.5 * strength * |x - center|^2. (separable)
+
+        :param center: The center of the potential. (one coordinate per dimension)
+        :param strength: The strength (squared angular frequency) of the potential.
+        """
+
+        super().__init__(center)
+        self.strength = strength
+
+    def evaluate(self, coordinates, out=None):
+        if out is None:
+            return 0.5 * self.strength * self.radius_squared(coordinates)
+
+        return np.multiply(self.radius_squared(coordinates, out), 0.5 * self.strength, out=out)
+
+
+class Plummer(Profile):
+
+    def __init__(self, center, mass=1.0, scale=1.0):
+        """
+        Potential of a Plummer sphere -mass / sqrt(r^2 + scale^2).
+
+        :param center: The center of the sphere. (one coordinate per dimension)
+        :param mass: The mass of the sphere.
+        :param scale: The scale length of the core.
+        """
+
+        super().__init__(center)
+        self.mass = mass
+        self.scale = scale
+
+    def evaluate(self, coordinates, out=None):
+        return np.divide(-self.mass, np.sqrt(self.radius_squared(coordinates) + self.scale ** 2), out=out)
+
+
+class NFW(Profile):
+
+    def __init__(self, center, amplitude=1.0, scale=1.0):
+        """
+        Potential of a Navarro-Frenk-White halo -amplitude * ln(1 + r / scale) / (r / scale). (-amplitude at r = 0)
+
+        :param center: The center of the halo. (one coordinate per dimension)
+        :param amplitude: The depth of the potential.
+        :param scale: The scale radius of the halo.
+        """
+
+        super().__init__(center)
+        self.amplitude = amplitude
+        self.scale = scale
+
+    def evaluate(self, coordinates, out=None):
+        s = np.sqrt(self.radius_squared(coordinates)) / self.scale
+
+        # Info: ln(1 + s) / s tends to 1 for s -> 0.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.multiply(-self.amplitude, np.where(s > 0, np.log1p(s) / s, 1.0), out=out)
@@ -0,0 +1,153 @@
+import numpy as np
+
+
+def plot_values(states, square=True):
+    """
+    Returns the squared wave function (or its real part) of stored states or of recorded densities.
+
+    :param states: The stored states or records. (complex wave functions or real |u|^2)
+    :param square: Set to true if the squared wave function should be returned, otherwise the real part.
+    """
+
+    if not np.iscomplexobj(states):
+        if not square:
+            raise ValueError("Only the squared wave function was recorded. (record_density)")
+        return states
+
+    return np.square(np.abs(states)) if square else states.real
+
+
+class Recorder:
+
+    def __init__(self, grid_parameters, axes, indexing="ij", dtype=np.complex128):
+        """
+        Records every record_interval-th state of a run in reduced form for the history mode "recorded": cropped to
+        the record_region, reduced by the record_stride along every axis (every n-th grid point, or the mean of blocks
+        of n grid points with record_binning) and optionally only as |u|^2 in float32. (record_density)
+        The simulation still evolves the full state, only the records are reduced.
+
+        Binning needs record_density, since the mean of the wave function would show |<u>|^2 instead of <|u|^2>.
+
+        :param grid_parameters: The parameters of the simulated grid. (dataclass)
+        :param axes: The coordinates of every axis (x, y, z) of the grid.
+        :param indexing: The indexing of the states. ("xy" for the 2D grid, whose first axis is the y-axis)
+        :param dtype: The data type of the states. (records of the wave function keep it)
+        """
+
+        self.interval = grid_parameters.record_interval
+        self.stride = grid_parameters.record_stride
+        self.binning = grid_parameters.record_binning
+        self.density = grid_parameters.record_density
+        self.first_time_step = 0  # the records before it are not known (a run resumed without them)
+        self.last_time_step = -1
+
+        if self.interval < 1 or self.stride < 1:
+            raise ValueError("The record_interval and the record_stride have to be at least 1.")
+        if self.binning and not self.density:
+            raise ValueError("The record_binning requires the record_density. (the mean of |u|^2 is recorded)")
+
+        region = grid_parameters.record_region
+        if len(region) not in (0, len(axes)):
+            raise ValueError("The record_region needs one (min, max) pair per axis.")
+
+        # Crop and reduce the coordinates of every axis (x, y, z) the same way as the states.
+        # ---------------------------------------------------------------
+        self.slices = []
+        self.axes = []
+        for n, axis in enumerate(axes):
+            axis = np.real(axis)
+
+            if region:
+                inside = np.nonzero((axis >= region[n][0]) & (axis <= region[n][1]))[0]
+                if len(inside) == 0:
+                    raise ValueError("The record_region contains no grid point of axis " + str(n) + ".")
+                start, stop = inside[0], inside[-1] + 1
+            else:
+                start, stop = 0, len(axis)
+
+            if self.binning:
+                stop = start + (stop - start) // self.stride * self.stride
+                if stop == start:
+                    raise ValueError("The record_region is smaller than one bin of axis " + str(n) + ".")
+                self.slices.append(slice(start, stop))
+                self.axes.append(axis[start:stop].reshape(-1, self.stride).mean(axis=1))
+            else:
+                self.slices.append(slice(start, stop, self.stride))
+                self.axes.append(axis[start:stop:self.stride])
+
+        # Info: The first axis of the states of the 2D grid belongs to y.
+        if indexing == "xy" and len(axes) > 1:
+            self.slices[0], self.slices[1] = self.slices[1], self.slices[0]
+        self.slices = tuple(self.slices)
+
+        shape = tuple(len(self.axes[n]) for n in range(len(axes)))
+        if indexing == "xy" and len(axes) > 1:
+            shape = (shape[1], shape[0]) + shape[2:]
+        # ---------------------------------------------------------------
+
+        count = (grid_parameters.time_steps - 1) // self.interval + 1
+        self.records = np.zeros((count,) + shape, dtype=np.float32 if self.density else dtype)
+
+    def record(self, time_step, state):
+        """
+        Stores the reduced state of a timestep. (called by Grid.set_state for every record_interval-th timestep)
+
+        :param time_step: The timestep of the state. (has to be a multiple of the record_interval)
+        :param state: The wave function at the timestep.
+        """
+
+        # Info: The crop and the stride are views of the state, so only the reduced points are copied.
+        values = state[self.slices]
+        if self.density:
+            values = np.square(np.abs(values))
+
+        # the mean of the density of blocks of record_stride grid points
+        if self.binning:
+            shape = []
+            for points in values.shape:
+                shape += [points // self.stride, self.stride]
+            values = values.reshape(shape).mean(axis=tuple(range(1, len(shape), 2)))
+
+        self.records[time_step // self.interval] = values
+        self.last_time_step = time_step
+
+    def time_steps(self):
+        """
+        Returns the range of timesteps which have been recorded. (without the timesteps of a resumed run whose
+        records were not restored, see restore)
+        """
+
+        first = -(-self.first_time_step // self.interval) * self.interval
+
+        return range(first, self.last_time_step + 1, self.interval)
+
+    def restore(self, records, first_time_step, time_step):
+        """
+        Restores the records of an interrupted run up to the timestep of its checkpoint.
+
+        :param records: The records of the checkpoint. (None if they were recorded differently, then only the
+                        timesteps from the checkpoint on are recorded)
+        :param first_time_step: The first timestep of the records of the checkpoint.
+        :param time_step: The timestep of the checkpoint.
+        """
+
+        if records is None or records.shape[1:] != self.records.shape[1:]:
+            self.first_time_step = time_step
+        else:
+            count = min(len(records), len(self.records))
+            self.records[:count] = records[:count]
+            self.first_time_step = first_time_step
+
+        self.last_time_step = time_step
+
+    def get_record(self, time_step):
+        """
+        Returns the record of a timestep.
+
+        :param time_step: The timestep of the record. (has to be recorded)
+        """
+
+        if time_step not in self.time_steps():
+            raise ValueError("Time-step " + str(time_step) + " has not been recorded.")
+
+        return self.records[time_step // self.interval]
@@ -0,0 +1,223 @@
+import numpy as np
+import dataclasses
+import json
+import os
+
+
+class NpySnapshotWriter:
+
+    def __init__(self, path, grid_parameters, dtype=np.complex128, resume=False):
+        """
+        Sink which streams the snapshots of a simulation into a memory-mapped .npy file.
+
+        :param path: The directory in which the run is stored.
+        :param grid_parameters: The parameters of the simulated grid. (dataclass)
+        :param dtype: The data type of the stored states.
+        :param resume: Set to true if the snapshots of a run which is resumed from a checkpoint should be kept.
+        """
+
+        self.path = path
+        self.grid_parameters = grid_parameters
+        self.last_time_step = -1
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        snapshot_count = (self.grid_parameters.time_steps - 1) // self.grid_parameters.snapshot_interval + 1
+        snapshot_path = os.path.join(self.path, "snapshots.npy")
+
+        if resume and os.path.exists(snapshot_path):
+            self.snapshots = np.lib.format.open_memmap(snapshot_path, mode="r+")
+            if self.snapshots.shape != (snapshot_count,) + state_shape(grid_parameters):
+                raise ValueError("The stored snapshots belong to a run with another size.")
+        else:
+            self.snapshots = np.lib.format.open_memmap(snapshot_path, mode="w+", dtype=dtype,
+                                                       shape=(snapshot_count,) + state_shape(grid_parameters))
+
+    def write(self, time_step, state):
+        """
+        Writes the state of one timestep into the store.
+
+        :param time_step: The timestep of the state. (has to be a multiple of the snapshot_interval)
+        :param state: The wave function at the timestep.
+        """
+
+        self.snapshots[time_step // self.grid_parameters.snapshot_interval] = state
+        self.last_time_step = time_step
+
+    def close(self, energy=None, time=None):
+        """
+        Flushes the snapshots to the disk and writes the metadata of the run.
+
+        :param energy: The energy evolution of the run. (optional)
+        :param time: The simulated time of every timestep of the run. (optional)
+        """
+
+        self.snapshots.flush()
+        del self.snapshots
+
+        if energy is not None:
+            np.save(os.path.join(self.path, "energy.npy"), energy)
+
+        if time is not None:
+            np.save(os.path.join(self.path, "time.npy"), time)
+
+        write_metadata(os.path.join(self.path, "metadata.json"), self.grid_parameters, self.last_time_step)
+
+
+class HDF5SnapshotWriter:
+
+    def __init__(self, path, grid_parameters, dtype=np.complex128, compression="gzip", resume=False):
+        """
+        Sink which streams the snapshots of a simulation into a chunked (one chunk per timestep) HDF5 file.
+
+        :param path: The HDF5 file in which the run is stored.
+        :param grid_parameters: The parameters of the simulated grid. (dataclass)
+        :param dtype: The data type of the stored states.
+        :param compression: The compression filter of h5py. (None for no compression)
+        :param resume: Set to true if the snapshots of a run which is resumed from a checkpoint should be kept.
+        """
+
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("The HDF5 snapshot store requires the package h5py.")
+
+        self.grid_parameters = grid_parameters
+        self.last_time_step = -1
+
+        snapshot_count = (self.grid_parameters.time_steps - 1) // self.grid_parameters.snapshot_interval + 1
+        if resume and os.path.exists(path):
+            self.file = h5py.File(path, "a")
+            self.snapshots = self.file["snapshots"]
+            if self.snapshots.shape != (snapshot_count,) + state_shape(grid_parameters):
+                raise ValueError("The stored snapshots belong to a run with another size.")
+        else:
+            self.file = h5py.File(path, "w")
+            self.snapshots = self.file.create_dataset("snapshots",
+                                                      shape=(snapshot_count,) + state_shape(grid_parameters),
+                                                      dtype=dtype, chunks=(1,) + state_shape(grid_parameters),
+                                                      compression=compression)
+
+    def write(self, time_step, state):
+        """
+        Writes the state of one timestep into the store.
+
+        :param time_step: The timestep of the state. (has to be a multiple of the snapshot_interval)
+        :param state: The wave function at the timestep.
+        """
+
+        self.snapshots[time_step // self.grid_parameters.snapshot_interval] = state
+        self.last_time_step = time_step
+
+    def close(self, energy=None, time=None):
+        """
+        Writes the metadata of the run and closes the file.
+
+        :param energy: The energy evolution of the run. (optional)
+        :param time: The simulated time of every timestep of the run. (optional)
+        """
+
+        # Info: A resumed run replaces the energy and time of the interrupted run.
+        for name, data in [("energy", energy), ("time", time)]:
+            if data is not None:
+                if name in self.file:
+                    del self.file[name]
+                self.file.create_dataset(name, data=data)
+
+        self.file.attrs["metadata"] = json.dumps(metadata(self.grid_parameters, self.last_time_step))
+        self.file.close()
+
+
+def state_shape(grid_parameters):
+    """
+    Returns the spatial shape of one state of the grid.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    if hasattr(grid_parameters, "space_steps"):
+        return (grid_parameters.space_steps,)
+    if hasattr(grid_parameters, "space_steps_Z"):
+        return grid_parameters.space_steps_X, grid_parameters.space_steps_Y, grid_parameters.space_steps_Z
+
+    return grid_parameters.space_steps_X, grid_parameters.space_steps_Y
+
+
+def metadata(grid_parameters, last_time_step):
+    """
+    Returns the metadata of a run as a dictionary.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param last_time_step: The last timestep which was written into the store.
+    """
+
+    return {"dimension": len(state_shape(grid_parameters)),
+            "last_time_step": last_time_step,
+            "grid_parameters": dataclasses.asdict(grid_parameters)}
+
+
+def write_metadata(path, grid_parameters, last_time_step):
+    """
+    Writes the metadata of a run atomically into a json file.
+
+    :param path: The path of the json file.
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    :param last_time_step: The last timestep which was written into the store.
+    """
+
+    with open(path + ".tmp", "w") as file:
+        json.dump(metadata(grid_parameters, last_time_step), file, indent=4)
+    os.replace(path + ".tmp", path)
+
+
+def load_snapshots(path):
+    """
+    Loads a stored run lazily (without reading every timestep) into a grid which can be used for plotting.
+
+    :param path: The directory of a .npy store or the file of a HDF5 store.
+    """
+
+    if os.path.isdir(path):
+        with open(os.path.join(path, "metadata.json")) as file:
+            meta = json.load(file)
+        snapshots = np.load(os.path.join(path, "snapshots.npy"), mmap_mode="r")
+        energy_path = os.path.join(path, "energy.npy")
+        energy = np.load(energy_path) if os.path.exists(energy_path) else None
+        time_path = os.path.join(path, "time.npy")
+        time = np.load(time_path) if os.path.exists(time_path) else None
+    else:
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError("The HDF5 snapshot store requires the package h5py.")
+
+        file = h5py.File(path, "r")
+        meta = json.loads(file.attrs["metadata"])
+        snapshots = file["snapshots"]
+        energy = file["energy"][()] if "energy" in file else None
+        time = file["time"][()] if "time" in file else None
+
+    if meta["dimension"] == 1:
+        from Simulator_1D.GridParameters import GridParameters
+        from Simulator_1D.Grid import Grid
+    elif meta["dimension"] == 2:
+        from Simulator_2D.GridParameters import GridParameters
+        from Simulator_2D.Grid import Grid
+    else:
+        from Simulator_3D.GridParameters import GridParameters
+        from Simulator_3D.Grid import Grid
+
+    grid_parameters = GridParameters(**meta["grid_parameters"])
+    grid_parameters.history_mode = "snapshots"
+
+    grid = Grid(grid_parameters, snapshots=snapshots)
+    grid.current_time_step = meta["last_time_step"]
+
+    if energy is not None:
+        grid.energy = energy
+
+    if time is not None:
+        grid.time = time
+
+    return grid
@@ -0,0 +1,499 @@
+import numpy as np
+
+from Simulator_Core.AbsorbingBoundary import create_absorbing_boundary
+from Simulator_Core.AdaptiveStepping import cfl_time_step_size, next_time_step_size, step_doubling_error
+from Simulator_Core.Checkpoint import checkpoint_due, load_checkpoint, restore_checkpoint, write_checkpoint
+from Simulator_Core.CompiledLoop import chunk_end, chunk_length, create_compiled_loop
+from Simulator_Core.Diagnostics import Diagnostics
+from Simulator_Core.FFTBackend import create_fft_backend
+from Simulator_Core.Integrators import integrator_order
+from Simulator_Core.OperatorCache import operator_tables
+from Simulator_Core.PositionKernel import create_position_kernel
+from Simulator_Core.Precision import complex_dtype, drift_report, real_dtype
+from Simulator_Core.Profiler import create_profiler
+from Simulator_Core.Profiles import evaluate_on_grid
+
+
+def split_operator_step(phases, state, potential, time_step_size, oprs_k, weights, lie, out=None, record=None):
+    """
+    Carries out one step of the integrator with the phases of an engine and returns the state, the potential and
+    the density after the step. This is the only implementation of the step: the serial, ensemble and MPI loops use
+    the numpy phases (see StepPhases), the compiled loop the jax phases. (see CompiledLoop.JaxStepPhases)
+
+    :param phases: The phases of the engine. (forward_fft, kinetic, inverse_fft, absorb, position, density, poisson)
+    :param state: The wave function at the start of the step.
+    :param potential: The potential of the Poisson equation. (belongs to the state)
+    :param time_step_size: The time step size of the step.
+    :param oprs_k: The momentum operators for the time step size. (one for every Strang step)
+    :param weights: The weights of the Strang steps of the integrator.
+    :param lie: Set to true for the integrator "lie". (otherwise the Strang steps of the other integrators)
+    :param out: Preallocated complex array for the result. (may be the state itself, not used by jax)
+    :param record: Function which is called with the spectrum of the state (or None) before the state changes.
+    """
+
+    if lie:
+
+        # Momentum (FFT -> Momentum -> IFFT)
+        # ------------------------
+        tmp = phases.forward_fft(state)
+        if record is not None:
+            record(tmp)
+        tmp = phases.inverse_fft(phases.kinetic(tmp, oprs_k[0]))
+        tmp = phases.absorb(tmp, time_step_size)
+
+        # Position
+        # ------------------------
+        state = phases.position(tmp, potential, time_step_size, out)
+        density = phases.density(state)
+
+        return state, phases.poisson(density), density
+
+    # Strang steps (half position -> momentum -> half position)
+    # Info: The position step does not change the density, so the potential after the momentum step is
+    #       used for the second half and for the first half of the next Strang step. (no extra FFTs)
+    #       Both halves are merged into one position step of their summed weights.
+    #       The absorbing mask is applied once per step, after the last momentum step. (the weights of the
+    #       fourth order integrators can be negative, where a mask of the weight would amplify the layers)
+    # ------------------------
+    if record is not None:
+        record(None)
+
+    state = phases.position(state, potential, 0.5 * weights[0] * time_step_size, out)
+    for n, (weight, opr_k) in enumerate(zip(weights, oprs_k)):
+
+        tmp = phases.inverse_fft(phases.kinetic(phases.forward_fft(state), opr_k))
+        if n == len(weights) - 1:
+            tmp = phases.absorb(tmp, time_step_size)
+
+        density = phases.density(tmp)
+        potential = phases.poisson(density)
+
+        next_weight = weights[n + 1] if n + 1 < len(weights) else 0.0
+        state = phases.position(tmp, potential, 0.5 * (weight + next_weight) * time_step_size, out)
+
+    return state, potential, density
+
+
+class StepPhases:
+
+    def __init__(self, fft, kernel, poisson, v_ext, gravity, density, potential, absorbing=None):
+        """
+        The phases of a step with numpy arrays. (see split_operator_step) The FFTs are carried out by an FFT backend
+        (e.g. the batched backend of an ensemble or the slab backend of MPI), the position step and the density by a
+        position kernel. The density and the potential are written into preallocated buffers.
+
+        :param fft: The FFT backend.
+        :param kernel: The position kernel.
+        :param poisson: The Poisson kernel for the spectrum of fft.rfft.
+        :param v_ext: The static external potential.
+        :param gravity: The "gravity" of the system. (1 if it is folded into the Poisson kernel)
+        :param density: The density buffer.
+        :param potential: The potential buffer.
+        :param absorbing: The absorbing layers. (None for a periodic grid)
+        """
+
+        self.fft = fft
+        self.kernel = kernel
+        self.poisson_kernel = poisson
+        self.v_ext = v_ext
+        self.gravity = gravity
+        self.density_buffer = density
+        self.potential_buffer = potential
+        self.absorbing = absorbing
+
+    def forward_fft(self, state):
+        """
+        Returns the spectrum of a state.
+        """
+
+        return self.fft.fft(state)
+
+    def inverse_fft(self, spectrum):
+        """
+        Returns the state of a spectrum.
+        """
+
+        return self.fft.ifft(spectrum)
+
+    def kinetic(self, spectrum, opr_k):
+        """
+        Applies a momentum operator to the spectrum of the state. (in place)
+        """
+
+        spectrum *= opr_k
+
+        return spectrum
+
+    def absorb(self, state, time_step_size):
+        """
+        Applies the mask of the absorbing layers for the time step size to a state. (in place, if there are layers)
+        """
+
+        if self.absorbing is not None:
+            self.absorbing.apply(state, time_step_size)
+
+        return state
+
+    def position(self, state, potential, time_step_size, out):
+        """
+        Applies the position operator of the potential and the time step size to a state. (written into out)
+        """
+
+        return self.kernel.position(state, potential, self.v_ext, self.gravity, time_step_size, out)
+
+    def density(self, state):
+        """
+        Calculates the density |u|^2 of a state into the density buffer.
+        """
+
+        return self.kernel.density(state, self.density_buffer)
+
+    def poisson(self, density):
+        """
+        Solves the Poisson equation for the density buffer. (real FFT -> Poisson -> real IFFT)
+        """
+
+        v = self.fft.rfft(density)
+        v *= self.poisson_kernel
+        np.copyto(self.potential_buffer, self.fft.irfft(v), casting="same_kind")
+
+        return self.potential_buffer
+
+
+class SplitOperatorSimulation:
+
+    # The indexing of the states. ("xy" for the 2D grid, whose first axis is the y-axis)
+    indexing = "ij"
+    # Set to true if the k=0 mode of the Poisson kernel is also left out in double precision.
+    drop_zero_mode = False
+
+    def __init__(self, grid, gravity, potential=lambda *coordinates: 0):
+        """
+        The split operator method for states of any dimension. (1D, 2D and 3D) The Simulation classes of the
+        simulators only describe their grid (axes, spacings and indexing) and add the plots.
+
+        :param grid: The grid on which the simulation is carried out.
+        :param gravity: The "gravity" of the system. (How much the waves attract one another.)
+        :param potential: The potential function used for the simulation. (default 0)
+        """
+
+        self.grid = grid
+        self.potential = potential
+        self.gravity = gravity
+        self.profiler = None  # PhaseProfiler of the last run (only if profile is set)
+
+    def axes(self):
+        """
+        Returns the coordinates of every axis (x, y, z) of the grid.
+        """
+
+        raise NotImplementedError
+
+    def spacings(self):
+        """
+        Returns the space step sizes in the order of the axes of the states.
+        """
+
+        raise NotImplementedError
+
+    def set_init_function(self, func):
+        """
+        Sets the initial function of the system.
+
+        :param func: The function to which the initial function should be set to. (wrapper function)
+        """
+
+        self.grid.set_init_function(func)
+
+    def drift_report(self, reference=None):
+        """
+        Returns the accumulated drift of the norm of the run. (wrapper function)
+
+        :param reference: The grid of the same run in double precision. (optional)
+        """
+
+        return drift_report(self.grid.energy, None if reference is None else reference.energy)
+
+    def resume_from(self, checkpoint):
+        """
+        Continues an interrupted run from a checkpoint. The results are identical to the ones of an uninterrupted run.
+        (The grid, the gravity and the potential function have to be the same as in the interrupted run.)
+
+        :param checkpoint: The .npz file of the checkpoint. (or a checkpoint loaded with load_checkpoint)
+        """
+
+        if isinstance(checkpoint, str):
+            checkpoint = load_checkpoint(checkpoint)
+
+        restore_checkpoint(self.grid, checkpoint, self.gravity)
+        self.start_split_operator(checkpoint)
+
+    def start_split_operator(self, checkpoint=None):
+        """
+        Starts the simulation of the Schrödinger Poison equation using the split operator method.
+        Every step is written directly into the state buffer of the grid, so in the "ring" mode with a
+        history_length of 1 the whole simulation works on a single state.
+
+        :param checkpoint: The restored checkpoint from which the run is continued. (see resume_from)
+        """
+
+        grid_parameters = self.grid.grid_parameters
+        dt = grid_parameters.time_step_size
+        dtype = complex_dtype(grid_parameters)
+        dtype_real = real_dtype(grid_parameters)
+
+        # define operators (which are actually vectors)
+        # Info: The wave numbers, the Poisson kernel (for the half spectrum of the real FFT of the density) and one
+        #       momentum operator for every Strang step of the integrator are cached for the grid parameters.
+        #       The k=0 mode of the Poisson kernel only adds a (huge) constant to the potential, which is a global
+        #       phase of the state. In single precision it would swallow the rest of the potential, so it is left out.
+        # -------------------------------------------------------------
+        axes = self.axes()
+        tables = operator_tables(grid_parameters, axes, self.indexing,
+                                 drop_zero_mode=self.drop_zero_mode or dtype_real != np.float64)
+        weights = tables.weights
+        momentum_operators = tables.momentum_operators
+        oprs_k = tables.oprs_k
+        poisson = tables.poisson
+        wave_numbers = tables.wave_numbers
+        k_max = tables.k_max
+
+        # static external potential (evaluated only once)
+        # ------------------------
+        shape = self.grid.grid.shape[1:]
+        v_ext = np.ascontiguousarray(np.broadcast_to(np.real(evaluate_on_grid(self.potential, axes, self.indexing)),
+                                                     shape), dtype=dtype_real)
+
+        # FFT backend and position kernel selected in the grid parameters
+        # ------------------------
+        fft = create_fft_backend(grid_parameters, shape, dtype)
+        kernel = create_position_kernel(grid_parameters)
+
+        # absorbing layers at the edges of the grid (optional, replace the periodic boundary)
+        # ------------------------
+        absorbing = create_absorbing_boundary(grid_parameters, axes, self.indexing, dtype_real)
+
+        # compiled loop of the engine (optional, replaces the Python loop over the timesteps)
+        # ------------------------
+        compiled_loop = create_compiled_loop(grid_parameters)
+        if compiled_loop is not None:
+            mask = absorbing.mask(dt) if absorbing is not None else None
+            compiled_loop.compile(weights, oprs_k, poisson, v_ext, self.gravity, dt, mask, grid_parameters.integrator,
+                                  *chunk_length(self.grid))
+
+        # diagnostics (energies, momentum and center of mass) of every diagnostics_interval-th state
+        # ------------------------
+        coordinates = np.meshgrid(*[np.real(axis) for axis in axes], indexing=self.indexing)
+        diagnostics = Diagnostics(self.grid, wave_numbers, coordinates, v_ext, self.gravity, fft)
+
+        # preallocated buffers for the density and the potential
+        # Info: The density and the potential always belong to the current state.
+        # ------------------------
+        density = np.empty(shape, dtype=dtype_real)
+        potential = np.empty(shape, dtype=dtype_real)
+
+        def store(time_step, state):
+            """
+            Stores the state of a timestep and its energy. (the density buffer belongs to the state)
+            """
+
+            self.grid.energy[time_step] = np.sum(density, dtype=float)
+            self.grid.set_state(time_step, state)
+
+        def step(state, time_step_size, oprs_k, out, record_time_step=None):
+            """
+            Carries out one step of the integrator. (the density and the potential buffer then belong to out)
+
+            :param state: The wave function at the start of the step.
+            :param time_step_size: The time step size of the step.
+            :param oprs_k: The momentum operators for the time step size.
+            :param out: Preallocated complex array for the result. (may be the state itself)
+            :param record_time_step: The timestep of the state, if its diagnostics should be recorded. (optional)
+            """
+
+            record = None
+            if record_time_step is not None:
+                def record(spectrum):
+                    diagnostics.record(record_time_step, state, density, potential, spectrum)
+
+            return split_operator_step(phases, state, potential, time_step_size, oprs_k, weights,
+                                       grid_parameters.integrator == "lie", out, record)[0]
+
+        # per-phase timers (only if profiling is enabled, otherwise no function is wrapped)
+        # Info: The functions above look up these names when they are called, so they use the timed versions.
+        #       The phases of the step use the timed FFT backend and position kernel.
+        # ------------------------
+        profiler = create_profiler(grid_parameters)
+        self.profiler = profiler
+        if profiler is not None:
+            fft = profiler.instrument(fft, {"fft": "forward_fft", "ifft": "inverse_fft",
+                                            "rfft": "forward_fft", "irfft": "inverse_fft"})
+            kernel = profiler.instrument(kernel, {"position": "position", "density": "density"})
+            if absorbing is not None:
+                absorbing = profiler.instrument(absorbing, {"apply": "absorbing"})
+            diagnostics.fft = fft
+            diagnostics = profiler.instrument(diagnostics, {"record": "diagnostics"})
+            store = profiler.timed("storage", store)
+            momentum_operators = profiler.timed("operators", momentum_operators)
+            if compiled_loop is not None:
+                compiled_loop = profiler.instrument(compiled_loop, {"run": "compiled_loop"})
+
+        # the phases of the step (with the timed FFT backend, position kernel and absorbing layers)
+        # ------------------------
+        phases = StepPhases(fft, kernel, poisson, v_ext, self.gravity, density, potential, absorbing)
+        if profiler is not None:
+            phases = profiler.instrument(phases, {"poisson": "poisson", "kinetic": "kinetic"})
+
+        # set the first energy (or continue with the potential and time step size of the checkpoint)
+        # ------------------------
+        first_time_step = 0
+        if checkpoint is None:
+            phases.poisson(phases.density(self.grid.get_state(0)))
+            self.grid.energy[0] = np.sum(density, dtype=float)
+        else:
+            first_time_step = checkpoint["time_step"]
+            dt = checkpoint["time_step_size"]
+            np.copyto(potential, checkpoint["potential"])
+            kernel.density(self.grid.get_state(first_time_step), density)
+
+        if grid_parameters.adaptive:
+            self.adaptive_split_operator(step, store, momentum_operators, potential, density, v_ext, k_max, dt,
+                                         diagnostics, first_time_step)
+            if profiler is not None:
+                profiler.finish(grid_parameters.profile_file)
+            return
+
+        if compiled_loop is not None:
+            self.compiled_split_operator(compiled_loop, kernel, potential, density, dt, diagnostics, first_time_step)
+            if profiler is not None:
+                profiler.finish(grid_parameters.profile_file)
+            return
+
+        # iterate
+        # Info: The state is written directly into the buffer of the next timestep. (no copy of the state)
+        # ------------------------
+        for i in range(first_time_step, grid_parameters.time_steps - 1):
+
+            state_next = step(self.grid.get_state(i), dt, oprs_k, self.grid.state_buffer(i + 1),
+                              i if diagnostics.due(i) else None)
+
+            store(i + 1, state_next)
+
+            if checkpoint_due(grid_parameters, i + 1):
+                write_checkpoint(self.grid, i + 1, potential, dt, self.gravity)
+
+        last_time_step = grid_parameters.time_steps - 1
+        if diagnostics.due(last_time_step):
+            diagnostics.record(last_time_step, self.grid.get_state(last_time_step), density, potential)
+
+        if profiler is not None:
+            profiler.finish(grid_parameters.profile_file)
+
+    def adaptive_split_operator(self, step, store, momentum_operators, potential, density, v_ext, k_max, dt,
+                                diagnostics, first_time_step=0):
+        """
+        Iterates the split operator method with an adaptive time step size. (only for internal use)
+        Every step of dt is compared with two steps of dt/2, which are kept if the difference is small enough.
+        The time step size is also limited by a CFL-style bound of the position step.
+        (Needs two additional states, since the state has to be kept until the step is accepted.)
+
+        :param step: Function which carries out one step of the integrator.
+        :param store: Function which stores the state of a timestep and its energy.
+        :param momentum_operators: Function which returns the momentum operators for a time step size.
+        :param potential: The potential buffer. (belongs to the current state)
+        :param density: The density buffer. (belongs to the current state)
+        :param v_ext: The static external potential.
+        :param k_max: The largest wave number of the grid.
+        :param dt: The first time step size.
+        :param diagnostics: The diagnostics of the run. (recorded with an additional FFT)
+        :param first_time_step: The timestep at which the iteration starts. (the timestep of a checkpoint)
+        """
+
+        grid_parameters = self.grid.grid_parameters
+        order = integrator_order(grid_parameters.integrator)
+        spacings = self.spacings()
+
+        potential_start = np.empty_like(potential)
+        state_coarse = np.empty(potential.shape, dtype=self.grid.dtype)
+        state_next = np.empty(potential.shape, dtype=self.grid.dtype)
+
+        i = first_time_step
+        if diagnostics.due(i):
+            diagnostics.record(i, self.grid.get_state(i), density, potential)
+
+        while i < grid_parameters.time_steps - 1:
+
+            state = self.grid.get_state(i)
+
+            cfl = cfl_time_step_size(self.gravity * potential + v_ext, spacings, k_max, grid_parameters.cfl_number)
+            dt = max(grid_parameters.min_time_step_size, min(dt, cfl, grid_parameters.max_time_step_size))
+
+            # one full step and two half steps from the same state
+            # ------------------------
+            np.copyto(potential_start, potential)
+            step(state, dt, momentum_operators(dt), state_coarse)
+            np.copyto(potential, potential_start)
+
+            oprs_k = momentum_operators(0.5 * dt)
+            step(state, 0.5 * dt, oprs_k, state_next)
+            step(state_next, 0.5 * dt, oprs_k, state_next)
+
+            error = step_doubling_error(state_coarse, state_next, order)
+            accepted = error <= grid_parameters.tolerance or dt <= grid_parameters.min_time_step_size
+
+            if accepted:
+                # Info: The time is set first, so a sink already sees the time of the state.
+                self.grid.time[i + 1] = self.grid.time[i] + dt
+                store(i + 1, state_next)
+                i += 1
+
+                if diagnostics.due(i):
+                    diagnostics.record(i, self.grid.get_state(i), density, potential)
+            else:
+                np.copyto(potential, potential_start)
+
+            dt = next_time_step_size(dt, error, grid_parameters.tolerance, order)
+
+            if accepted and checkpoint_due(grid_parameters, i):
+                write_checkpoint(self.grid, i, potential, dt, self.gravity)
+
+    def compiled_split_operator(self, compiled_loop, kernel, potential, density, dt, diagnostics, first_time_step=0):
+        """
+        Iterates the split operator method with the compiled loop of the engine. (only for internal use)
+        The timesteps are advanced in chunks, which end at every checkpoint and diagnostics timestep, so both are
+        written in between the chunks exactly like in the Python loop. (see chunk_end)
+
+        :param compiled_loop: The compiled loop. (see create_compiled_loop)
+        :param kernel: The position kernel. (calculates the density of the state after a chunk)
+        :param potential: The potential buffer. (belongs to the current state)
+        :param density: The density buffer. (belongs to the current state)
+        :param dt: The time step size.
+        :param diagnostics: The diagnostics of the run. (recorded with an additional FFT)
+        :param first_time_step: The timestep at which the iteration starts. (the timestep of a checkpoint)
+        """
+
+        grid_parameters = self.grid.grid_parameters
+        length, _ = chunk_length(self.grid)
+
+        i = first_time_step
+        while i < grid_parameters.time_steps - 1:
+
+            if diagnostics.due(i):
+                diagnostics.record(i, self.grid.get_state(i), density, potential)
+
+            end = chunk_end(self.grid, i, length)
+            potential[...], states, energies = compiled_loop.run(self.grid.get_state(i), potential, end - i)
+
+            # Info: The chunk hands back the states of its last timesteps. (every one or only the last one)
+            self.grid.energy[i + 1:end + 1] = energies
+            for n, state in enumerate(states):
+                self.grid.set_state(end - len(states) + 1 + n, state)
+
+            i = end
+            kernel.density(self.grid.get_state(i), density)
+
+            if checkpoint_due(grid_parameters, i):
+                write_checkpoint(self.grid, i, potential, dt, self.gravity)
+
+        if diagnostics.due(i):
+            diagnostics.record(i, self.grid.get_state(i), density, potential)
@@ -0,0 +1,55 @@
+import matplotlib.pyplot as plt
+import os
+
+
+def save_or_show(file_name, close=True):
+    """
+    Saves the current figure into the directory ./pictures or shows it.
+
+    :param file_name: The file of the picture in ./pictures. (empty to show the figure)
+    :param close: Set to true if the figure should also be closed after it was shown.
+    """
+
+    if file_name:
+
+        if not os.path.exists("./pictures"):
+            os.makedirs("./pictures")
+
+        plt.savefig("./pictures/" + file_name, dpi=300)
+        plt.close()
+    else:
+        plt.show()
+        if close:
+            plt.close()
+
+
+def plot_energy_evolution(grid, save=False, log=False):
+    """
+    Plots the energy evolution of the system. (the norm sum(|u|^2) if no diagnostics were recorded)
+
+    :param grid: The grid of the run. (1D, 2D or 3D)
+    :param save: Set true if the plot should be saved instead of shown.
+    :param log: Set true if the log should be taken for the y-axis.
+    """
+
+    if len(grid.diagnostics) > 0:
+        for name in ["kinetic_energy", "gravitational_energy", "external_energy", "total_energy"]:
+            plt.plot(grid.diagnostics["time"], grid.diagnostics[name], label=name.replace("_", " "))
+        if log:
+            plt.yscale("symlog")  # the potential energies are negative
+        plt.legend()
+        plt.ylabel("energy")
+        plt.title("Energy Evolution")
+    else:
+        if log:
+            plt.plot(grid.time, grid.energy)
+            plt.yscale("log")
+        else:
+            plt.ylim([-3, 3])  # kind of
+            plt.plot(grid.time, grid.energy)
+        plt.ylabel("norm")
+        plt.title("Norm Evolution")
+
+    plt.xlabel("time")
+
+    save_or_show("energy.png" if save else "", close=False)
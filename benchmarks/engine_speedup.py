@@ -0,0 +1,74 @@
+import numpy as np
+import argparse
+import time
+
+from Simulator_1D.GridParameters import GridParameters as GridParameters1D
+from Simulator_1D.Grid import Grid as Grid1D
+from Simulator_1D.Simulation import Simulation as Simulation1D
+from Simulator_2D.GridParameters import GridParameters as GridParameters2D
+from Simulator_2D.Grid import Grid as Grid2D
+from Simulator_2D.Simulation import Simulation as Simulation2D
+
+# Wall clock time of the engine "jax" (compiled loop) versus the engine "numpy". (Python loop)
+# The first jax run includes the compilation, the following runs reuse the compiled loop.
+# Run from the root of the repository: python -m benchmarks.engine_speedup --dimension 1
+
+
+def run(engine, arguments):
+    """
+    Runs the simulation with one engine and returns the grid and the wall clock time.
+
+    :param engine: "numpy" or "jax".
+    :param arguments: The parsed command line arguments.
+    """
+
+    if arguments.dimension == 1:
+        grid_parameters = GridParameters1D(time_steps=arguments.time_steps, space_steps=arguments.space_steps,
+                                           history_mode="ring", integrator=arguments.integrator, engine=engine)
+        grid = Grid1D(grid_parameters)
+        simulation = Simulation1D(grid)
+    else:
+        grid_parameters = GridParameters2D(time_steps=arguments.time_steps, space_steps_X=arguments.space_steps,
+                                           space_steps_Y=arguments.space_steps, history_mode="ring",
+                                           integrator=arguments.integrator, engine=engine)
+        grid = Grid2D(grid_parameters)
+        simulation = Simulation2D(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+
+    simulation.set_init_function(grid_parameters.initial_function)
+
+    start = time.perf_counter()
+    simulation.start_split_operator()
+
+    return grid, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled jax loop versus the numpy loop.")
+    parser.add_argument("--dimension", type=int, default=1, choices=[1, 2])
+    parser.add_argument("--time-steps", type=int, default=2000)
+    parser.add_argument("--space-steps", type=int, default=500)
+    parser.add_argument("--integrator", default="lie")
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    numpy_times = []
+    for _ in range(arguments.repeats):
+        reference, elapsed = run("numpy", arguments)
+        numpy_times.append(elapsed)
+
+    jax_times = []
+    for _ in range(arguments.repeats + 1):
+        grid, elapsed = run("jax", arguments)
+        jax_times.append(elapsed)
+
+    last = arguments.time_steps - 1
+    difference = np.max(np.abs(grid.get_state(last) - reference.get_state(last)))
+
+    print(f"numpy:            {min(numpy_times):.3f} s")
+    print(f"jax (first run):  {jax_times[0]:.3f} s  (including the compilation)")
+    print(f"jax:              {min(jax_times[1:]):.3f} s  ({min(numpy_times) / min(jax_times[1:]):.2f}x)")
+    print(f"max |u_jax - u_numpy| at the last timestep: {difference:.3e}")
+
+
+if __name__ == "__main__":
+    main()
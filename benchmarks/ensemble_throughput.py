@@ -0,0 +1,65 @@
+import numpy as np
+import argparse
+import time
+
+from Simulator_2D.GridParameters import GridParameters
+from Simulator_2D.Grid import Grid
+from Simulator_2D.Simulation import Simulation
+from Simulator_2D.EnsembleSimulation import EnsembleSimulation
+
+# Wall clock time of a gravity sweep run member by member and as one batched ensemble.
+# Run from the root of the repository: python -m benchmarks.ensemble_throughput
+
+
+def grid_parameters(arguments):
+    """
+    Returns the grid parameters of every member of the sweep.
+
+    :param arguments: The parsed command line arguments.
+    """
+
+    return GridParameters(time_steps=arguments.time_steps, space_steps_X=arguments.space_steps,
+                          space_steps_Y=arguments.space_steps, history_mode="ring", integrator=arguments.integrator)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Loop over single runs versus one batched ensemble run.")
+    parser.add_argument("--members", type=int, default=64)
+    parser.add_argument("--time-steps", type=int, default=101)
+    parser.add_argument("--space-steps", type=int, default=32)
+    parser.add_argument("--integrator", default="strang")
+    arguments = parser.parse_args()
+
+    gravities = np.linspace(1, 20, arguments.members)
+
+    start = time.perf_counter()
+    single_grids = []
+    for gravity in gravities:
+        parameters = grid_parameters(arguments)
+        grid = Grid(parameters)
+        simulation = Simulation(grid, gravity, parameters.potential_function)
+        simulation.set_init_function(parameters.initial_function)
+        simulation.start_split_operator()
+        single_grids.append(grid)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parameters = grid_parameters(arguments)
+    ensemble_grids = [Grid(parameters) for _ in gravities]
+    ensemble = EnsembleSimulation(ensemble_grids, gravities, parameters.potential_function)
+    ensemble.set_init_functions(parameters.initial_function)
+    ensemble.start_split_operator()
+    ensemble_time = time.perf_counter() - start
+
+    last = arguments.time_steps - 1
+    difference = max(np.max(np.abs(single.get_state(last) - member.get_state(last)))
+                     for single, member in zip(single_grids, ensemble_grids))
+
+    print(f"members: {arguments.members}  grid: {arguments.space_steps}^2  steps: {last}")
+    print(f"loop over single runs: {loop_time:.3f} s")
+    print(f"batched ensemble:      {ensemble_time:.3f} s  ({loop_time / ensemble_time:.1f}x)")
+    print(f"largest difference of the final states: {difference:.3e}")
+
+
+if __name__ == "__main__":
+    main()
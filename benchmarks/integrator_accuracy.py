@@ -0,0 +1,59 @@
+import numpy as np
+import argparse
+import time
+
+from Simulator_2D.GridParameters import GridParameters
+from Simulator_2D.Grid import Grid
+from Simulator_2D.Simulation import Simulation
+
+# Accuracy versus wall clock time of the integrators on the default two Gaussian initial condition.
+# Run from the root of the repository: python -m benchmarks.integrator_accuracy
+
+
+def run(integrator, time_step_size, end_time, space_steps):
+    """
+    Runs the 2D simulation until end_time and returns the final density and the wall clock time.
+
+    :param integrator: The name of the integrator.
+    :param time_step_size: The time step size.
+    :param end_time: The simulated time.
+    :param space_steps: The number of grid points per axis.
+    """
+
+    grid_parameters = GridParameters(time_steps=int(round(end_time / time_step_size)) + 1,
+                                     time_step_size=time_step_size, space_steps_X=space_steps,
+                                     space_steps_Y=space_steps, history_mode="ring", integrator=integrator)
+    grid = Grid(grid_parameters)
+
+    simulation = Simulation(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+    simulation.set_init_function(grid_parameters.initial_function)
+
+    start = time.perf_counter()
+    simulation.start_split_operator()
+    wall_clock_time = time.perf_counter() - start
+
+    # Info: The density is compared since the huge k=0 Poisson mode only adds a global phase.
+    return np.square(np.abs(grid.get_state(grid_parameters.time_steps - 1))), wall_clock_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accuracy versus wall clock time of the integrators.")
+    parser.add_argument("--end-time", type=float, default=5.0)
+    parser.add_argument("--space-steps", type=int, default=190)
+    parser.add_argument("--time-step-sizes", type=float, nargs="+", default=[0.5, 0.25, 0.1, 0.05])
+    parser.add_argument("--integrators", nargs="+", default=["lie", "strang", "yoshida4", "suzuki4"])
+    arguments = parser.parse_args()
+
+    reference, _ = run("suzuki4", min(arguments.time_step_sizes) / 8, arguments.end_time, arguments.space_steps)
+
+    print("integrator  dt        steps  wall clock [s]  relative L2 error of the density")
+    for integrator in arguments.integrators:
+        for time_step_size in arguments.time_step_sizes:
+            density, wall_clock_time = run(integrator, time_step_size, arguments.end_time, arguments.space_steps)
+            error = np.linalg.norm(density - reference) / np.linalg.norm(reference)
+            steps = int(round(arguments.end_time / time_step_size))
+            print(f"{integrator:<11} {time_step_size:<9} {steps:<6} {wall_clock_time:<15.3f} {error:.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import numpy as np
+import argparse
+import time
+
+from mpi4py import MPI
+
+from Simulator_Core.MPISlab import MPISimulation
+
+# Compares the MPI slab decomposition with the serial simulation on rank 0.
+# Run from the root of the repository: mpirun -n 4 python -m benchmarks.mpi_consistency --dimension 3
+
+
+def modules(dimension):
+    """
+    Returns the GridParameters, Grid and Simulation classes of a dimension.
+
+    :param dimension: 2 or 3.
+    """
+
+    if dimension == 2:
+        from Simulator_2D.GridParameters import GridParameters
+        from Simulator_2D.Grid import Grid
+        from Simulator_2D.Simulation import Simulation
+    else:
+        from Simulator_3D.GridParameters import GridParameters
+        from Simulator_3D.Grid import Grid
+        from Simulator_3D.Simulation import Simulation
+
+    return GridParameters, Grid, Simulation
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MPI slab decomposition versus the serial simulation.")
+    parser.add_argument("--dimension", type=int, default=2, choices=[2, 3])
+    parser.add_argument("--space-steps", type=int, default=64)
+    parser.add_argument("--time-steps", type=int, default=101)
+    parser.add_argument("--integrator", default="strang")
+    parser.add_argument("--precision", default="double")
+    arguments = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    GridParameters, Grid, Simulation = modules(arguments.dimension)
+
+    space_steps = {"space_steps_X": arguments.space_steps, "space_steps_Y": arguments.space_steps}
+    if arguments.dimension == 3:
+        space_steps["space_steps_Z"] = arguments.space_steps
+
+    grid_parameters = GridParameters(time_steps=arguments.time_steps, history_mode="ring", history_length=1,
+                                     snapshot_interval=arguments.time_steps, integrator=arguments.integrator,
+                                     precision=arguments.precision, **space_steps)
+
+    grid = Grid(grid_parameters) if comm.Get_rank() == 0 else None
+    simulation = MPISimulation(grid, grid_parameters, grid_parameters.input_gravity,
+                               grid_parameters.potential_function, comm)
+    simulation.set_init_function(grid_parameters.initial_function)
+
+    comm.Barrier()
+    start = time.perf_counter()
+    simulation.start_split_operator()
+    comm.Barrier()
+    mpi_time = time.perf_counter() - start
+
+    if comm.Get_rank() == 0:
+        serial_grid = Grid(grid_parameters)
+        serial = Simulation(serial_grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+        serial.set_init_function(grid_parameters.initial_function)
+
+        start = time.perf_counter()
+        serial.start_split_operator()
+        serial_time = time.perf_counter() - start
+
+        last = arguments.time_steps - 1
+        mpi_density = np.square(np.abs(grid.get_state(last)))
+        serial_density = np.square(np.abs(serial_grid.get_state(last)))
+
+        print(f"ranks: {comm.Get_size()}  grid: {arguments.space_steps}^{arguments.dimension}  steps: {last}")
+        print(f"serial: {serial_time:.3f} s  mpi: {mpi_time:.3f} s")
+        print(f"largest difference of the final density: {np.max(np.abs(mpi_density - serial_density)):.3e}")
+        print(f"largest difference of the energy trace:  {np.max(np.abs(simulation.energy - serial_grid.energy)):.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import numpy as np
+import argparse
+import time
+
+from Simulator_2D.GridParameters import GridParameters
+from Simulator_2D.Grid import Grid
+from Simulator_2D.Simulation import Simulation
+
+# Wall clock time and accumulated drift of a single precision run versus the same run in double precision.
+# Run from the root of the repository: python -m benchmarks.precision_drift
+
+
+def run(precision, arguments):
+    """
+    Runs the 2D simulation in one precision and returns the simulation and the wall clock time.
+
+    :param precision: "double" or "single".
+    :param arguments: The parsed command line arguments.
+    """
+
+    grid_parameters = GridParameters(time_steps=arguments.time_steps, space_steps_X=arguments.space_steps,
+                                     space_steps_Y=arguments.space_steps, history_mode="ring",
+                                     integrator=arguments.integrator, fft_backend=arguments.fft_backend,
+                                     precision=precision)
+    grid = Grid(grid_parameters)
+
+    simulation = Simulation(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+    simulation.set_init_function(grid_parameters.initial_function)
+
+    start = time.perf_counter()
+    simulation.start_split_operator()
+
+    return simulation, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single versus double precision of the 2D simulation.")
+    parser.add_argument("--time-steps", type=int, default=501)
+    parser.add_argument("--space-steps", type=int, default=190)
+    parser.add_argument("--integrator", default="strang")
+    parser.add_argument("--fft-backend", default="scipy")
+    arguments = parser.parse_args()
+
+    reference, double_time = run("double", arguments)
+    single, single_time = run("single", arguments)
+
+    last = arguments.time_steps - 1
+    reference_density = np.square(np.abs(reference.grid.get_state(last)))
+    single_density = np.square(np.abs(single.grid.get_state(last)))
+    density_error = np.linalg.norm(single_density - reference_density) / np.linalg.norm(reference_density)
+
+    print(f"double: {double_time:.3f} s  single: {single_time:.3f} s  ({double_time / single_time:.2f}x)")
+    for name, value in single.drift_report(reference.grid).items():
+        print(f"{name:<28} {value:.3e}")
+    print(f"{'final relative density error':<28} {density_error:.3e}")
+
+
+if __name__ == "__main__":
+    main()
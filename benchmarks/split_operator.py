@@ -0,0 +1,251 @@
+import numpy as np
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from Simulator_Core.OperatorCache import load_operator_tables
+from Simulator_Core.ParameterSweep import sweep_points, write_json
+
+
+# The cases of the default benchmark. (every combination is timed, see benchmark_cases)
+DEFAULT_VARIATIONS = {"dimension": [1, 2],
+                      "space_steps": [64, 128, 256, 512, 1024, 2048],
+                      "time_steps": [11, 51],
+                      "precision": ["double", "single"],
+                      "fft_backend": ["numpy", "scipy", "pyfftw"]}
+
+
+def benchmark_cases(variations=None):
+    """
+    Returns every combination of the variations as a list of dictionaries. (cartesian product)
+
+    The keys are "dimension" (1 or 2), "space_steps" (grid points per axis) and fields of the grid parameters,
+    e.g. "time_steps", "precision", "fft_backend", "integrator" or "position_kernel".
+
+    :param variations: Dictionary with a list of values for every varied parameter. (default: DEFAULT_VARIATIONS)
+    """
+
+    return sweep_points(DEFAULT_VARIATIONS if variations is None else variations)
+
+
+def case_parameters(case):
+    """
+    Returns the grid parameters of a benchmark case. The extent of the grid stays the one of the default parameters,
+    so only the resolution changes with the number of grid points. Only the current state is kept in memory.
+
+    :param case: Dictionary with the parameters of the case. (see benchmark_cases)
+    """
+
+    overrides = {name: value for name, value in case.items() if name not in ["dimension", "space_steps"]}
+    overrides.update(history_mode="ring", history_length=1)
+
+    if case["dimension"] == 1:
+        from Simulator_1D.GridParameters import GridParameters
+
+        default = GridParameters()
+        extent = default.space_steps * default.space_step_size
+        return GridParameters(space_steps=case["space_steps"], space_step_size=extent / case["space_steps"],
+                              **overrides)
+    if case["dimension"] == 2:
+        from Simulator_2D.GridParameters import GridParameters
+
+        default = GridParameters()
+        extent_x = default.space_steps_X * default.space_step_size_X
+        extent_y = default.space_steps_Y * default.space_step_size_Y
+        return GridParameters(space_steps_X=case["space_steps"], space_step_size_X=extent_x / case["space_steps"],
+                              space_steps_Y=case["space_steps"], space_step_size_Y=extent_y / case["space_steps"],
+                              **overrides)
+
+    raise ValueError("Unknown benchmark dimension: " + str(case["dimension"]))
+
+
+def run_simulation(grid_parameters):
+    """
+    Sets up a simulation and returns the wall clock time of start_split_operator in seconds.
+
+    :param grid_parameters: The parameters of the simulated grid. (dataclass)
+    """
+
+    if hasattr(grid_parameters, "space_steps"):
+        from Simulator_1D.Grid import Grid
+        from Simulator_1D.Simulation import Simulation
+
+        grid = Grid(grid_parameters)
+        simulation = Simulation(grid, grid_parameters.potential_function)
+    else:
+        from Simulator_2D.Grid import Grid
+        from Simulator_2D.Simulation import Simulation
+
+        grid = Grid(grid_parameters)
+        simulation = Simulation(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+
+    simulation.set_init_function(grid_parameters.initial_function)
+
+    start = time.perf_counter()
+    simulation.start_split_operator()
+
+    return time.perf_counter() - start
+
+
+def run_case(case, repeats=3):
+    """
+    Times start_split_operator for one benchmark case and returns the result as a dictionary.
+
+    The first two runs are not timed. The first one imports the modules and plans the FFTs, the second one measures
+    the peak memory with tracemalloc (which tracks the numpy arrays) including the operator tables. The following
+    runs are timed with the cached operator tables, the best of them is reported.
+
+    :param case: Dictionary with the parameters of the case. (see benchmark_cases)
+    :param repeats: The number of timed runs.
+    """
+
+    result = {"case": dict(case), "status": "running"}
+
+    try:
+        grid_parameters = case_parameters(case)
+        points = case["space_steps"] ** case["dimension"]
+        steps = grid_parameters.time_steps - 1
+
+        run_simulation(grid_parameters)
+        load_operator_tables.cache_clear()
+
+        tracemalloc.start()
+        try:
+            run_simulation(grid_parameters)
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        times = [run_simulation(grid_parameters) for _ in range(repeats)]
+
+        result["status"] = "done"
+        result["times"] = times
+        result["best_time"] = min(times)
+        result["median_time"] = statistics.median(times)
+        result["steps_per_second"] = steps / min(times)
+        result["ns_per_point_step"] = min(times) * 1e9 / (points * steps)
+    except ImportError as error:
+        # Info: e.g. the FFT backend "pyfftw" is not installed.
+        result["status"] = "skipped"
+        result["error"] = repr(error)
+    except Exception as error:
+        result["status"] = "failed"
+        result["error"] = repr(error)
+
+    return result
+
+
+def environment():
+    """
+    Returns a description of the machine and the software versions the benchmark is run with.
+    """
+
+    try:
+        revision = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                  cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        revision = ""
+
+    return {"date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "revision": revision,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count()}
+
+
+def case_key(case):
+    """
+    Returns a string which identifies a benchmark case. (to compare the same cases of two benchmarks)
+
+    :param case: Dictionary with the parameters of the case.
+    """
+
+    return json.dumps(case, sort_keys=True)
+
+
+def run_benchmark(path="benchmark.json", variations=None, repeats=3):
+    """
+    Runs every benchmark case one after another and writes the results into a json file.
+
+    :param path: The json file of the results.
+    :param variations: Dictionary with a list of values for every varied parameter. (see benchmark_cases)
+    :param repeats: The number of timed runs of every case.
+    """
+
+    cases = benchmark_cases(variations)
+    results = {"environment": environment(), "repeats": repeats, "results": []}
+
+    for n, case in enumerate(cases):
+        result = run_case(case, repeats)
+        results["results"].append(result)
+        print("Finished case (" + str(n + 1) + "/" + str(len(cases)) + "): " + format_result(result))
+
+        # Info: The file is rewritten after every case, so a long benchmark can be inspected while it is running.
+        write_json(path, results)
+
+    return results
+
+
+def format_result(result):
+    """
+    Returns one line describing the result of a benchmark case.
+
+    :param result: The result of the case. (see run_case)
+    """
+
+    description = " ".join(name + "=" + str(value) for name, value in result["case"].items())
+    if result["status"] != "done":
+        return description + " " + result["status"] + " " + result.get("error", "")
+
+    return (description + " | " + format(result["steps_per_second"], ".1f") + " steps/s, " +
+            format(result["ns_per_point_step"], ".2f") + " ns/point/step, " +
+            format(result["peak_memory_bytes"] / 2 ** 20, ".1f") + " MiB")
+
+
+def compare_benchmarks(baseline_path, path, threshold=0.1):
+    """
+    Compares the best times of the cases two benchmarks have in common and prints them.
+    Returns the cases which got slower by more than the threshold. (relative)
+
+    :param baseline_path: The json file of the older benchmark.
+    :param path: The json file of the newer benchmark.
+    :param threshold: The allowed relative increase of the best time.
+    """
+
+    with open(baseline_path) as file:
+        baseline = {case_key(result["case"]): result for result in json.load(file)["results"]
+                    if result["status"] == "done"}
+    with open(path) as file:
+        results = [result for result in json.load(file)["results"] if result["status"] == "done"]
+
+    regressions = []
+    for result in results:
+        old = baseline.get(case_key(result["case"]))
+        if old is None:
+            continue
+
+        ratio = result["best_time"] / old["best_time"]
+        print(" ".join(name + "=" + str(value) for name, value in result["case"].items()) + " | " +
+              format(ratio, ".2f") + "x" + ("  REGRESSION" if ratio > 1 + threshold else ""))
+
+        if ratio > 1 + threshold:
+            regressions.append({"case": result["case"], "ratio": ratio})
+
+    return regressions
+
+
+if __name__ == "__main__":
+    # Run from the root of the repository: python -m benchmarks.split_operator [results.json] [baseline.json]
+    output_path = sys.argv[1] if len(sys.argv) > 1 else "benchmark.json"
+    run_benchmark(output_path)
+
+    if len(sys.argv) > 2:
+        sys.exit(1 if compare_benchmarks(sys.argv[2], output_path) else 0)
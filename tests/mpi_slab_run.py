@@ -0,0 +1,34 @@
+import numpy as np
+import argparse
+
+from mpi4py import MPI
+
+from Simulator_Core.MPISlab import MPISimulation
+from tests.test_mpi_slab import parameters
+
+# Runs the MPI slab decomposition of tests/test_mpi_slab.py and saves the result of rank 0.
+# Run from the root of the repository: mpirun -n 2 python -m tests.mpi_slab_run result.npz --dimension 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MPI slab decomposition of the MPI consistency test.")
+    parser.add_argument("path")
+    parser.add_argument("--dimension", type=int, default=2, choices=[2, 3])
+    arguments = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    grid_parameters, Grid, _ = parameters(arguments.dimension)
+
+    grid = Grid(grid_parameters) if comm.Get_rank() == 0 else None
+    simulation = MPISimulation(grid, grid_parameters, grid_parameters.input_gravity,
+                               grid_parameters.potential_function, comm)
+    simulation.set_init_function(grid_parameters.initial_function)
+    simulation.start_split_operator()
+
+    if comm.Get_rank() == 0:
+        np.savez(arguments.path, state=grid.get_state(grid_parameters.time_steps - 1), energy=simulation.energy,
+                 ranks=comm.Get_size())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from Simulator_1D.GridParameters import GridParameters as GridParameters1D
+from Simulator_1D.Grid import Grid as Grid1D
+from Simulator_1D.Simulation import Simulation as Simulation1D
+from Simulator_2D.GridParameters import GridParameters as GridParameters2D
+from Simulator_2D.Grid import Grid as Grid2D
+from Simulator_2D.Simulation import Simulation as Simulation2D
+from Simulator_3D.GridParameters import GridParameters as GridParameters3D
+from Simulator_3D.Grid import Grid as Grid3D
+from Simulator_3D.Simulation import Simulation as Simulation3D
+
+# Small grids of the tests, so a run only takes a fraction of a second. (overridden by the keyword arguments)
+SMALL_GRIDS = {1: {"time_steps": 41, "time_step_size": 0.1, "space_steps": 128, "space_step_size": 0.2},
+               2: {"time_steps": 21, "time_step_size": 0.1, "space_steps_X": 48, "space_step_size_X": 0.5,
+                   "space_steps_Y": 48, "space_step_size_Y": 0.5},
+               3: {"time_steps": 11, "time_step_size": 0.1, "space_steps_X": 24, "space_step_size_X": 0.8,
+                   "space_steps_Y": 24, "space_step_size_Y": 0.8, "space_steps_Z": 24, "space_step_size_Z": 0.8}}
+
+
+def grid_parameters(dimension, **parameters):
+    """
+    Returns the grid parameters of a small grid.
+
+    :param dimension: 1, 2 or 3.
+    :param parameters: Grid parameters which replace the ones of the small grid.
+    """
+
+    GridParameters = {1: GridParameters1D, 2: GridParameters2D, 3: GridParameters3D}[dimension]
+
+    return GridParameters(**dict(SMALL_GRIDS[dimension], **parameters))
+
+
+def create_simulation(dimension, grid_parameters, sink=None):
+    """
+    Returns the grid and the simulation of the grid parameters with the initial function already set.
+
+    :param dimension: 1, 2 or 3.
+    :param grid_parameters: The parameters of the grid. (see grid_parameters)
+    :param sink: The sink of the grid.
+    """
+
+    if dimension == 1:
+        grid = Grid1D(grid_parameters, sink)
+        simulation = Simulation1D(grid)
+    elif dimension == 2:
+        grid = Grid2D(grid_parameters, sink)
+        simulation = Simulation2D(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+    else:
+        grid = Grid3D(grid_parameters, sink)
+        simulation = Simulation3D(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+
+    simulation.set_init_function(grid_parameters.initial_function)
+
+    return grid, simulation
+
+
+def run(dimension, sink=None, **parameters):
+    """
+    Runs a simulation on a small grid and returns its grid and the simulation.
+
+    :param dimension: 1, 2 or 3.
+    :param sink: The sink of the grid.
+    :param parameters: Grid parameters which replace the ones of the small grid.
+    """
+
+    grid, simulation = create_simulation(dimension, grid_parameters(dimension, **parameters), sink)
+    simulation.start_split_operator()
+
+    return grid, simulation
@@ -0,0 +1,57 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.AbsorbingBoundary import AbsorbingBoundary, layer_depth
+from Simulator_Core.OperatorCache import grid_axis
+from Simulator_Core.Profiles import Gaussian
+from tests.simulations import create_simulation, grid_parameters
+
+
+def outgoing_packet(dimension, **parameters):
+    """
+    Runs a packet which moves into the lower edge of every axis and returns the grid.
+
+    :param dimension: 1 or 2.
+    :param parameters: Further grid parameters.
+    """
+
+    grid, simulation = create_simulation(dimension, grid_parameters(dimension, time_steps=81, **parameters))
+    grid.set_init_function(Gaussian((-6,) * dimension, momentum=(-8,) * dimension))
+    simulation.start_split_operator()
+
+    return grid
+
+
+@pytest.mark.parametrize("integrator", ["lie", "strang", "yoshida4", "suzuki4"])
+def test_layers_only_remove_matter(integrator):
+    grid = outgoing_packet(1, integrator=integrator, absorbing_width=3.0, absorbing_strength=5.0,
+                           diagnostics_interval=10)
+
+    # Info: The negative weights of the fourth order integrators must not amplify the state in the layers.
+    assert np.max(np.diff(grid.energy)) < 1e-12
+    assert grid.energy[-1] < 1e-3
+    np.testing.assert_allclose(grid.diagnostics["absorbed_norm"], 1 - grid.diagnostics["norm"], atol=1e-12)
+
+
+def test_periodic_grid_keeps_the_norm():
+    grid = outgoing_packet(2, integrator="strang")
+    np.testing.assert_allclose(grid.energy, 1.0, rtol=1e-12)
+
+    grid = outgoing_packet(2, integrator="strang", absorbing_width=3.0, absorbing_strength=5.0)
+    assert np.max(np.diff(grid.energy)) < 1e-12 and grid.energy[-1] < 0.8
+
+
+def test_mask():
+    axis = grid_axis(20, 0.5)
+    np.testing.assert_allclose(layer_depth(axis, 1.0)[[0, 1, 2, 10, 17, 18, 19]], [1.0, 0.5, 0, 0, 0, 0.5, 1.0])
+
+    boundary = AbsorbingBoundary([axis, axis], 1.0, 2.0, indexing="xy")
+    mask = boundary.mask(0.1)
+    assert mask.shape == (20, 20) and boundary.mask(0.1) is mask
+    assert mask[10, 10] == 1
+    assert mask[10, 0] == pytest.approx(np.exp(-0.2)) and mask[0, 0] == pytest.approx(np.exp(-0.4))
+    assert np.all((mask > 0) & (mask <= 1))
+
+    with pytest.raises(ValueError):
+        AbsorbingBoundary([axis], 5.0, 1.0)
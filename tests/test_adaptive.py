@@ -0,0 +1,53 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.AdaptiveStepping import cfl_time_step_size, next_time_step_size, step_doubling_error
+from tests.simulations import run
+
+
+def test_next_time_step_size():
+    # the error of the next try is expected at safety * tolerance
+    assert next_time_step_size(0.1, 1e-4, 1e-4, 2) == pytest.approx(0.09)
+    assert next_time_step_size(0.1, 8e-4, 1e-4, 2) == pytest.approx(0.045)
+    # the factor is limited to [min_factor, max_factor]
+    assert next_time_step_size(0.1, 1.0, 1e-4, 2) == pytest.approx(0.02)
+    assert next_time_step_size(0.1, 1e-12, 1e-4, 2) == pytest.approx(0.5)
+    assert next_time_step_size(0.1, 0.0, 1e-4, 2) == pytest.approx(0.5)
+
+
+def test_step_doubling_error():
+    state = np.ones(8, dtype=complex)
+    assert step_doubling_error(state, state, 2) == 0
+    assert step_doubling_error(1.07 * state, state, 2) == pytest.approx(0.07 / 3)
+
+
+def test_cfl_time_step_size():
+    x = np.linspace(-1, 1, 201)
+    # |V| <= 2 after removing the mean and |grad V| = 2
+    assert cfl_time_step_size(2 * x, (x[1] - x[0],), 100.0, 0.5) == pytest.approx(0.25 * np.pi)
+    assert cfl_time_step_size(2 * x, (x[1] - x[0],), 1.0, 0.5) == pytest.approx(0.25)
+    assert cfl_time_step_size(np.full(8, 3.0), (1.0,), 1.0, 0.5) == np.inf
+
+
+@pytest.mark.parametrize("tolerance", [1e-4, 1e-6])
+def test_adaptive_run_meets_tolerance(tolerance):
+    grid, _ = run(1, history_mode="ring", integrator="strang", adaptive=True, tolerance=tolerance,
+                  max_time_step_size=0.3)
+    last = grid.grid_parameters.time_steps - 1
+
+    steps = np.diff(grid.time)
+    assert np.all(steps > 0) and np.all(steps <= 0.3 + 1e-12)
+
+    # fixed steps of a fourth order integrator up to the same simulated time
+    end_time = grid.time[last]
+    time_steps = int(np.ceil(end_time / 0.005))
+    reference, _ = run(1, history_mode="ring", integrator="suzuki4", time_step_size=end_time / time_steps,
+                       time_steps=time_steps + 1)
+
+    density = np.square(np.abs(grid.get_state(last)))
+    reference_density = np.square(np.abs(reference.get_state(time_steps)))
+    error = np.linalg.norm(density - reference_density) / np.linalg.norm(reference_density)
+
+    # Info: The local errors of the steps add up at most linearly.
+    assert error < last * tolerance
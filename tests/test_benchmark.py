@@ -0,0 +1,51 @@
+import json
+
+import pytest
+
+from benchmarks.split_operator import benchmark_cases, case_parameters, compare_benchmarks, run_benchmark
+
+
+def test_cases_keep_the_extent_of_the_grid():
+    cases = benchmark_cases({"dimension": [1, 2], "space_steps": [64, 128]})
+    assert len(cases) == 4
+
+    for case in cases:
+        parameters = case_parameters(case)
+        assert parameters.history_mode == "ring" and parameters.history_length == 1
+        if case["dimension"] == 1:
+            assert parameters.space_steps * parameters.space_step_size == pytest.approx(25.0)
+        else:
+            assert parameters.space_steps_X * parameters.space_step_size_X == pytest.approx(57.0)
+
+    with pytest.raises(ValueError):
+        case_parameters({"dimension": 4, "space_steps": 8})
+
+
+def test_benchmark_writes_every_case(tmp_path):
+    path = str(tmp_path / "benchmark.json")
+    variations = {"dimension": [1, 2], "space_steps": [32], "time_steps": [6], "fft_backend": ["numpy", "fftpack"]}
+    run_benchmark(path, variations, repeats=2)
+
+    with open(path) as file:
+        results = json.load(file)
+
+    assert results["repeats"] == 2 and "numpy" in results["environment"]
+    assert [result["status"] for result in results["results"]] == ["done", "failed", "done", "failed"]
+    for result in results["results"][::2]:
+        assert len(result["times"]) == 2 and result["best_time"] == min(result["times"])
+        assert result["peak_memory_bytes"] > 0
+        assert result["steps_per_second"] == pytest.approx(5 / result["best_time"])
+
+
+def test_compare_finds_regressions(tmp_path):
+    def write(name, times):
+        results = [{"case": {"dimension": 1, "space_steps": steps}, "status": "done", "best_time": time}
+                   for steps, time in times.items()]
+        with open(str(tmp_path / name), "w") as file:
+            json.dump({"results": results}, file)
+        return str(tmp_path / name)
+
+    baseline = write("baseline.json", {64: 1.0, 128: 2.0, 256: 4.0})
+    newer = write("newer.json", {64: 1.05, 128: 3.0, 512: 9.0})
+
+    assert compare_benchmarks(baseline, newer) == [{"case": {"dimension": 1, "space_steps": 128}, "ratio": 1.5}]
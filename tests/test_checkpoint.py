@@ -0,0 +1,67 @@
+import numpy as np
+import os
+
+import pytest
+
+from Simulator_1D.Grid import Grid
+from Simulator_1D.Simulation import Simulation
+from Simulator_Core.Checkpoint import load_checkpoint
+from tests.simulations import create_simulation, grid_parameters, run
+
+
+def interrupted_run(dimension, path, **parameters):
+    """
+    Runs the first 20 timesteps with a checkpoint every 10 timesteps and continues the run from the last checkpoint
+    up to timestep 40 on a new grid. Returns the continued grid.
+
+    :param dimension: 1, 2 or 3.
+    :param path: The checkpoint file.
+    :param parameters: Further grid parameters of both parts of the run.
+    """
+
+    run(dimension, time_steps=21, checkpoint_interval=10, checkpoint_file=path, **parameters)
+
+    grid, simulation = create_simulation(dimension, grid_parameters(dimension, time_steps=41, **parameters))
+    simulation.resume_from(path)
+
+    return grid
+
+
+@pytest.mark.parametrize("dimension, parameters", [(1, {"integrator": "strang"}),
+                                                   (1, {"integrator": "yoshida4", "adaptive": True}),
+                                                   (2, {"integrator": "lie", "diagnostics_interval": 5}),
+                                                   (3, {"integrator": "strang", "time_step_size": 0.05})])
+def test_resumed_run_is_identical(dimension, parameters, tmp_path):
+    path = str(tmp_path / "checkpoint.npz")
+    grid = interrupted_run(dimension, path, history_mode="full", **parameters)
+    reference, _ = run(dimension, time_steps=41, history_mode="full", **parameters)
+
+    assert load_checkpoint(path)["time_step"] == 20
+    assert not os.path.exists(path + ".tmp")
+    for time_step in (0, 20, 21, 40):
+        np.testing.assert_array_equal(grid.get_state(time_step), reference.get_state(time_step))
+    np.testing.assert_array_equal(grid.energy, reference.energy)
+    np.testing.assert_array_equal(grid.time, reference.time)
+    np.testing.assert_array_equal(grid.diagnostics, reference.diagnostics)
+
+
+def test_checkpoint_of_another_simulation_is_rejected(tmp_path):
+    path = str(tmp_path / "checkpoint.npz")
+    run(1, time_steps=21, checkpoint_interval=10, checkpoint_file=path)
+
+    _, simulation = create_simulation(1, grid_parameters(1, space_step_size=0.25))
+    with pytest.raises(ValueError, match="space_step_size"):
+        simulation.resume_from(path)
+
+    simulation = Simulation(Grid(grid_parameters(1)), gravity=1)
+    with pytest.raises(ValueError, match="gravity"):
+        simulation.resume_from(path)
+
+    _, simulation = create_simulation(1, grid_parameters(1, time_steps=11))
+    with pytest.raises(ValueError, match="timestep"):
+        simulation.resume_from(path)
+
+
+def test_checkpoint_requires_a_file():
+    with pytest.raises(ValueError):
+        run(1, checkpoint_interval=10)
@@ -0,0 +1,92 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core import CompiledLoop
+from Simulator_Core.CompiledLoop import CHUNK_STEPS, chunk_end, chunk_length, create_compiled_loop
+from tests.simulations import create_simulation, grid_parameters, run
+from tests.test_history import ListSink
+
+
+@pytest.mark.parametrize("dimension, parameters", [(1, {"integrator": "lie", "history_mode": "full"}),
+                                                   (1, {"integrator": "yoshida4", "absorbing_width": 2.0,
+                                                        "diagnostics_interval": 7}),
+                                                   (2, {"integrator": "strang", "history_mode": "ring",
+                                                        "history_length": 3}),
+                                                   (3, {"integrator": "suzuki4", "history_mode": "recorded",
+                                                        "record_stride": 2})])
+def test_jax_matches_numpy(dimension, parameters):
+    pytest.importorskip("jax")
+    grid, _ = run(dimension, engine="jax", **parameters)
+    reference, _ = run(dimension, **parameters)
+
+    for time_step in reference.stored_time_steps():
+        np.testing.assert_allclose(grid.get_state(time_step), reference.get_state(time_step), atol=1e-8)
+    np.testing.assert_allclose(grid.energy, reference.energy, rtol=1e-10)
+    if reference.recorder is not None:
+        np.testing.assert_allclose(grid.recorder.records, reference.recorder.records, atol=1e-8)
+    for name in ("norm", "total_energy"):
+        np.testing.assert_allclose(grid.diagnostics[name], reference.diagnostics[name], rtol=1e-8)
+
+
+@pytest.mark.parametrize("integrator", ["lie", "strang", "yoshida4", "suzuki4"])
+@pytest.mark.parametrize("absorbing_width", [0.0, 2.0])
+def test_jax_step_matches_numpy_step(integrator, absorbing_width):
+    pytest.importorskip("jax")
+    # Info: The 3D grid leaves out the k=0 mode of the Poisson kernel, whose (huge) constant would be rounded
+    #       differently by the FFTs of jax and numpy. So one step only differs by the rounding of the FFTs.
+    grid, _ = run(3, engine="jax", integrator=integrator, absorbing_width=absorbing_width, time_steps=2)
+    reference, _ = run(3, integrator=integrator, absorbing_width=absorbing_width, time_steps=2)
+
+    state = reference.get_state(1)
+    np.testing.assert_allclose(grid.get_state(1), state, rtol=0, atol=1e-14 * np.abs(state).max())
+    np.testing.assert_allclose(grid.energy, reference.energy, rtol=1e-14)
+
+
+def test_loop_is_compiled_once():
+    pytest.importorskip("jax")
+    run(1, engine="jax", integrator="strang", history_mode="ring")
+    loops = dict(CompiledLoop.jitted_loops)
+    run(1, engine="jax", integrator="strang", history_mode="ring", time_steps=100, time_step_size=0.05)
+
+    assert CompiledLoop.jitted_loops == loops
+
+
+def test_sink_receives_the_states_of_a_chunk():
+    pytest.importorskip("jax")
+    sink, reference_sink = ListSink(), ListSink()
+    run(1, sink=sink, engine="jax", history_mode="ring", snapshot_interval=15)
+    run(1, sink=reference_sink, history_mode="ring", snapshot_interval=15)
+
+    assert sorted(sink.states) == [0, 15, 30]
+    for time_step, state in reference_sink.states.items():
+        np.testing.assert_allclose(sink.states[time_step], state, atol=1e-8)
+
+
+def test_chunks():
+    ring, _ = create_simulation(1, grid_parameters(1, time_steps=201, history_mode="ring", snapshot_interval=10,
+                                                  checkpoint_interval=50, checkpoint_file="unused.npz"))
+    assert chunk_length(ring) == (CHUNK_STEPS, False)
+    # the checkpoints always end a chunk, the states of the sink only if the chunk does not hand back every state
+    assert chunk_end(ring, 0, CHUNK_STEPS) == 50
+    assert chunk_end(ring, 50, CHUNK_STEPS) == 100
+    ring.sink = ListSink()
+    assert chunk_end(ring, 0, CHUNK_STEPS) == 10
+    assert chunk_end(ring, 45, CHUNK_STEPS) == 50
+    assert chunk_end(ring, 195, CHUNK_STEPS) == 200
+
+    full, _ = create_simulation(1, grid_parameters(1, time_steps=201, snapshot_interval=10))
+    full.sink = ListSink()
+    assert chunk_length(full) == (CHUNK_STEPS, True)
+    assert chunk_end(full, 0, CHUNK_STEPS) == 64
+
+    history, _ = create_simulation(1, grid_parameters(1, history_mode="ring", history_length=5))
+    assert chunk_length(history) == (5, True)
+
+
+def test_unsupported_engines():
+    assert create_compiled_loop(grid_parameters(1)) is None
+    with pytest.raises(ValueError):
+        create_compiled_loop(grid_parameters(1, engine="jax", adaptive=True))
+    with pytest.raises(ValueError):
+        create_compiled_loop(grid_parameters(1, engine="cupy"))
@@ -0,0 +1,67 @@
+import numpy as np
+
+import pytest
+
+from Simulator_1D.Grid import Grid
+from Simulator_1D.Simulation import Simulation
+from Simulator_Core.Profiles import Gaussian
+from tests.simulations import grid_parameters, run
+
+
+def diagnostics(dimension, time_step_size):
+    """
+    Returns the diagnostics of a Strang run of the two default Gaussians up to the time 2. (11 samples)
+
+    :param dimension: 1, 2 or 3.
+    :param time_step_size: The time step size.
+    """
+
+    time_steps = int(round(2.0 / time_step_size))
+    grid, _ = run(dimension, history_mode="ring", integrator="strang", time_step_size=time_step_size,
+                  time_steps=time_steps + 1, diagnostics_interval=time_steps // 10)
+
+    return grid.diagnostics
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_total_energy_drift_is_second_order(dimension):
+    coarse = diagnostics(dimension, 0.1)
+    fine = diagnostics(dimension, 0.05)
+
+    def drift(samples):
+        return np.max(np.abs(samples["total_energy"] - samples["total_energy"][0])) / abs(samples["total_energy"][0])
+
+    assert drift(coarse) < 2e-4
+    assert drift(coarse) / drift(fine) == pytest.approx(4, rel=0.1)
+    np.testing.assert_allclose(fine["norm"], 1.0, rtol=1e-12)
+    np.testing.assert_allclose(fine["time"], np.linspace(0, 2, 11))
+
+    # the symmetric Gaussians keep a vanishing momentum and center of mass
+    np.testing.assert_allclose(fine["momentum"], 0, atol=1e-6)
+    np.testing.assert_allclose(fine["center_of_mass"], 0, atol=1e-9)
+
+
+def test_collapse_turns_potential_into_kinetic_energy():
+    samples = diagnostics(1, 0.05)
+
+    assert samples["kinetic_energy"][-1] > 2 * samples["kinetic_energy"][0]
+    assert samples["gravitational_energy"][-1] < samples["gravitational_energy"][0] < 0
+    np.testing.assert_array_equal(samples["external_energy"], 0)
+
+
+def test_free_packet_keeps_its_momentum():
+    parameters = grid_parameters(1, diagnostics_interval=10)
+    grid = Grid(parameters)
+    simulation = Simulation(grid, lambda x=0: 0.01, gravity=0)
+    simulation.set_init_function(Gaussian((-3,), momentum=(1,)))
+    simulation.start_split_operator()
+
+    samples = grid.diagnostics
+    assert samples["momentum"][0, 0] > 0
+    np.testing.assert_allclose(samples["momentum"][:, 0], samples["momentum"][0, 0], rtol=1e-10)
+    np.testing.assert_allclose(samples["total_energy"], samples["total_energy"][0], rtol=1e-10)
+    np.testing.assert_allclose(samples["external_energy"], 0.01, rtol=1e-10)
+
+    # the center of mass moves with a constant velocity
+    np.testing.assert_allclose(np.diff(samples["center_of_mass"][:, 0]), samples["center_of_mass"][1, 0] -
+                               samples["center_of_mass"][0, 0], rtol=1e-3)
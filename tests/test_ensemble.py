@@ -0,0 +1,50 @@
+import numpy as np
+
+import pytest
+
+from Simulator_2D.EnsembleSimulation import EnsembleSimulation
+from Simulator_2D.Grid import Grid
+from Simulator_2D.Simulation import Simulation
+from Simulator_Core.Profiles import Gaussian
+from tests.simulations import grid_parameters
+
+
+@pytest.mark.parametrize("integrator", ["lie", "yoshida4"])
+def test_members_match_single_runs(integrator):
+    gravities = [1.0, 5.0, 20.0]
+    functions = [Gaussian((-3, 0)) + Gaussian((3, 0)), Gaussian((0, 2), width=2.0), Gaussian((1, 1), momentum=(1, 0))]
+    potentials = [lambda x=0, y=0: 0, lambda x=0, y=0: 0.01 * (x ** 2 + y ** 2), lambda x=0, y=0: 0.1 * x]
+
+    parameters = grid_parameters(2, history_mode="ring", history_length=2, integrator=integrator)
+    grids = [Grid(parameters) for _ in gravities]
+    ensemble = EnsembleSimulation(grids, gravities, potentials)
+    ensemble.set_init_functions(functions)
+    ensemble.start_split_operator()
+
+    last = parameters.time_steps - 1
+    for grid, gravity, function, potential in zip(grids, gravities, functions, potentials):
+        single = Grid(parameters)
+        simulation = Simulation(single, gravity, potential)
+        simulation.set_init_function(function)
+        simulation.start_split_operator()
+
+        for time_step in (last - 1, last):
+            np.testing.assert_allclose(grid.get_state(time_step), single.get_state(time_step), atol=1e-10)
+        np.testing.assert_allclose(grid.energy, single.energy, rtol=1e-12)
+
+
+def test_members_need_the_same_size():
+    grids = [Grid(grid_parameters(2)), Grid(grid_parameters(2, space_steps_X=32, space_steps_Y=32))]
+
+    with pytest.raises(ValueError):
+        EnsembleSimulation(grids, 5.0)
+
+
+@pytest.mark.parametrize("parameter, value", [("adaptive", True), ("checkpoint_interval", 5),
+                                              ("diagnostics_interval", 5), ("profile", True),
+                                              ("absorbing_width", 2.0), ("engine", "jax")])
+def test_unsupported_parameters_are_rejected(parameter, value):
+    grids = [Grid(grid_parameters(2)), Grid(grid_parameters(2, **{parameter: value}))]
+
+    with pytest.raises(ValueError):
+        EnsembleSimulation(grids, 5.0)
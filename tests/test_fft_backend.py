@@ -0,0 +1,51 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.FFTBackend import NumpyFFTBackend, create_fft_backend
+from tests.simulations import grid_parameters, run
+
+BACKENDS = ["numpy", "scipy", "pyfftw"]
+
+
+def require(backend):
+    """
+    Skips the test if the package of an FFT backend is not installed.
+
+    :param backend: The name of the FFT backend.
+    """
+
+    if backend != "numpy":
+        pytest.importorskip(backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("shape", [(64,), (16, 24), (8, 12, 10)])
+def test_transforms_match_numpy(backend, shape):
+    require(backend)
+    fft = create_fft_backend(grid_parameters(1, fft_backend=backend, fft_workers=1), shape)
+    reference = NumpyFFTBackend(shape)
+
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+
+    np.testing.assert_allclose(fft.fft(a.copy()), reference.fft(a), atol=1e-10)
+    np.testing.assert_allclose(fft.ifft(a.copy()), reference.ifft(a), atol=1e-12)
+    np.testing.assert_allclose(fft.rfft(a.real.copy()), reference.rfft(a.real), atol=1e-10)
+    half = reference.rfft(a.real)
+    np.testing.assert_allclose(fft.irfft(half.copy()), a.real, atol=1e-12)
+
+
+@pytest.mark.parametrize("backend", BACKENDS[1:])
+def test_simulation_matches_numpy(backend):
+    require(backend)
+    grid, _ = run(2, history_mode="ring", integrator="strang", fft_backend=backend, fft_workers=1)
+    reference, _ = run(2, history_mode="ring", integrator="strang")
+
+    last = grid.grid_parameters.time_steps - 1
+    np.testing.assert_allclose(grid.get_state(last), reference.get_state(last), atol=1e-10)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_fft_backend(grid_parameters(1, fft_backend="fftpack"), (8,))
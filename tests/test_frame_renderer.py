@@ -0,0 +1,60 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.FrameRenderer import AnimationSink
+from tests.simulations import grid_parameters, create_simulation, run
+
+matplotlib = pytest.importorskip("matplotlib")
+imageio = pytest.importorskip("imageio.v2")
+matplotlib.use("Agg")
+
+
+class CountingSink:
+
+    def __init__(self):
+        """
+        Sink which remembers the timesteps it receives and whether it was closed.
+        """
+
+        self.time_steps = []
+        self.closed = False
+
+    def write(self, time_step, state):
+        self.time_steps.append(time_step)
+
+    def close(self, energy=None, time=None):
+        self.closed = True
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_gif_has_one_frame_per_stride(dimension, tmp_path):
+    grid, simulation = run(dimension, history_mode="full")
+    path = str(tmp_path / "simulation.gif")
+    simulation.gif(path=path, stride=5, processes=0)
+
+    frames = imageio.mimread(path)
+    assert len(frames) == len(range(0, grid.grid_parameters.time_steps, 5))
+    assert not np.array_equal(frames[0], frames[-1])
+
+
+def test_process_pool_renders_the_same_frames(tmp_path):
+    _, simulation = run(1, history_mode="full")
+    simulation.gif(path=str(tmp_path / "serial.gif"), stride=10, processes=0)
+    simulation.gif(path=str(tmp_path / "pool.gif"), stride=10, processes=2)
+
+    for serial, pool in zip(imageio.mimread(str(tmp_path / "serial.gif")), imageio.mimread(str(tmp_path / "pool.gif"))):
+        np.testing.assert_array_equal(serial, pool)
+
+
+def test_animation_sink_renders_during_the_run(tmp_path):
+    path = str(tmp_path / "simulation.gif")
+    other = CountingSink()
+    grid, simulation = create_simulation(1, grid_parameters(1, history_mode="ring", snapshot_interval=10))
+    grid.sink = AnimationSink(path, grid.frame, stride=2, processes=0, sink=other)
+    simulation.start_split_operator()
+    grid.sink.close(grid.energy, grid.time)
+
+    # timestep 0 is handed over by set_init_function before the sink is attached
+    assert other.time_steps == [10, 20, 30, 40] and other.closed
+    assert len(imageio.mimread(path)) == 2
@@ -0,0 +1,50 @@
+import numpy as np
+
+import pytest
+
+from tests.simulations import run
+
+
+class ListSink:
+
+    def __init__(self):
+        """
+        Sink which keeps a copy of every state it receives.
+        """
+
+        self.states = {}
+
+    def write(self, time_step, state):
+        self.states[time_step] = state.copy()
+
+
+@pytest.mark.parametrize("dimension", [1, 2])
+def test_ring_matches_full(dimension):
+    full, _ = run(dimension, history_mode="full")
+    ring, _ = run(dimension, history_mode="ring", history_length=3)
+
+    last = full.grid_parameters.time_steps - 1
+    assert list(ring.stored_time_steps()) == [last - 2, last - 1, last]
+    for time_step in ring.stored_time_steps():
+        np.testing.assert_array_equal(ring.get_state(time_step), full.get_state(time_step))
+    np.testing.assert_array_equal(ring.energy, full.energy)
+    assert ring.grid.shape[0] == 3
+
+
+def test_ring_forgets_old_states():
+    ring, _ = run(1, history_mode="ring", history_length=2)
+
+    with pytest.raises(ValueError):
+        ring.get_state(0)
+    with pytest.raises(ValueError):
+        ring.check_full_history()
+
+
+def test_sink_receives_every_snapshot_interval():
+    sink = ListSink()
+    run(1, sink=sink, history_mode="ring", snapshot_interval=10)
+
+    assert sorted(sink.states) == [0, 10, 20, 30, 40]
+    reference, _ = run(1, history_mode="full")
+    for time_step, state in sink.states.items():
+        np.testing.assert_array_equal(state, reference.get_state(time_step))
@@ -0,0 +1,48 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.Integrators import integrator_order, integrator_weights
+from tests.simulations import run
+
+# The simulated time of the convergence test.
+END_TIME = 2.0
+
+
+def final_density(integrator, time_step_size):
+    """
+    Returns the density of a 1D run at END_TIME. (the k=0 Poisson mode only adds a global phase to the state)
+
+    :param integrator: The name of the integrator.
+    :param time_step_size: The time step size.
+    """
+
+    grid, _ = run(1, history_mode="ring", integrator=integrator, time_step_size=time_step_size,
+                  time_steps=int(round(END_TIME / time_step_size)) + 1)
+
+    return np.square(np.abs(grid.get_state(grid.current_time_step)))
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return final_density("suzuki4", 0.01)
+
+
+@pytest.mark.parametrize("integrator", ["lie", "strang", "yoshida4", "suzuki4"])
+def test_convergence_order(integrator, reference):
+    errors = [np.linalg.norm(final_density(integrator, time_step_size) - reference) / np.linalg.norm(reference)
+              for time_step_size in (0.2, 0.1)]
+
+    assert np.log2(errors[0] / errors[1]) == pytest.approx(integrator_order(integrator), abs=0.2)
+
+
+@pytest.mark.parametrize("integrator", ["lie", "strang", "yoshida4", "suzuki4"])
+def test_weights_sum_to_one(integrator):
+    assert sum(integrator_weights(integrator)) == pytest.approx(1.0)
+
+
+def test_unknown_integrator():
+    with pytest.raises(ValueError):
+        integrator_weights("verlet")
+    with pytest.raises(ValueError):
+        integrator_order("verlet")
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def loaded_modules(code):
+    """
+    Runs Python code in a new interpreter and returns the plotting and scipy modules it loaded.
+
+    :param code: The Python code.
+    """
+
+    code += "\nimport sys\nprint(sorted({name.split('.')[0] for name in sys.modules} & {'matplotlib', 'imageio', " \
+            "'scipy', 'mpl_toolkits'}))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+                            timeout=120).stdout
+
+    return output.strip().splitlines()[-1]
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_run_does_not_load_plotting_modules(dimension):
+    code = "from tests.simulations import run\nrun(" + str(dimension) + ", integrator='strang')"
+
+    assert loaded_modules(code) == "[]"
+
+
+def test_plots_load_matplotlib_on_demand(tmp_path, monkeypatch):
+    pytest.importorskip("matplotlib")
+    monkeypatch.setenv("MPLBACKEND", "Agg")
+    code = "from tests.simulations import run\ngrid, _ = run(1)\nimport os\nos.chdir(" + repr(str(tmp_path)) + \
+           ")\ngrid.heatmap(save=True)"
+
+    assert "matplotlib" in loaded_modules(code)
+    assert os.listdir(str(tmp_path / "pictures")) == ["2D-heatmap.png"]
+
+
+def test_scipy_is_only_loaded_by_its_backend():
+    pytest.importorskip("scipy")
+
+    assert loaded_modules("from tests.simulations import run\nrun(2, fft_backend='scipy')") == "['scipy']"
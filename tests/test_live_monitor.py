@@ -0,0 +1,56 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.LiveMonitor import HEADER, LiveMonitor, attach, downsample, read_frame
+from tests.simulations import create_simulation, grid_parameters
+
+
+def test_downsample_averages_blocks():
+    density = np.arange(40, dtype=float).reshape(8, 5)
+
+    np.testing.assert_array_equal(downsample(density, 8), density)
+    # blocks of 2 x 2 points, the last column is left out
+    np.testing.assert_array_equal(downsample(density, 4), [[3, 5], [13, 15], [23, 25], [33, 35]])
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_viewer_reads_the_newest_frame(dimension):
+    grid, simulation = create_simulation(dimension, grid_parameters(dimension, history_mode="ring",
+                                                                    diagnostics_interval=5))
+    monitor = LiveMonitor(grid, interval=10, max_points=16, axis=1)
+    grid.monitor = monitor
+    simulation.start_split_operator()
+
+    # the viewer attaches to the shared memory like another process
+    memory = attach(monitor.name)
+    try:
+        header = np.ndarray((), dtype=HEADER, buffer=memory.buf)
+        shape = tuple(int(n) for n in header["shape"] if n > 0)
+        frame = np.ndarray(shape, dtype=np.float32, buffer=memory.buf, offset=HEADER.itemsize)
+
+        sample, image = read_frame(header, frame, 0)
+        last = grid.grid_parameters.time_steps - 1
+        # timestep 0 is handed over by set_init_function before the monitor is attached
+        assert sample["time_step"] == last and sample["frames"] == last // 10
+        assert sample["norm"] == pytest.approx(1.0)
+        assert sample["diagnostics_time_step"] in (last - 5, last)
+
+        density = np.square(np.abs(grid.get_state(last)))
+        if dimension == 3:
+            density = np.sum(density, axis=1)
+        np.testing.assert_allclose(image, downsample(density, 16), rtol=1e-6)
+        assert max(image.shape) <= 16
+
+        # nothing new, or a frame which is just being written
+        assert read_frame(header, frame, int(sample["sequence"])) is None
+        header["sequence"] += 1
+        assert read_frame(header, frame, 0) is None
+        header["sequence"] -= 1
+        del header, frame
+    finally:
+        memory.close()
+
+    monitor.close()
+    with pytest.raises(FileNotFoundError):
+        attach(monitor.name)
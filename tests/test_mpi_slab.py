@@ -0,0 +1,74 @@
+import numpy as np
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+# The time steps and grid points per axis of the MPI consistency test.
+TIME_STEPS = 11
+SPACE_STEPS = 32
+RANKS = 2
+
+
+def parameters(dimension):
+    """
+    Returns the grid parameters, the Grid and the Simulation class of the MPI consistency test.
+
+    :param dimension: 2 or 3.
+    """
+
+    if dimension == 2:
+        from Simulator_2D.GridParameters import GridParameters
+        from Simulator_2D.Grid import Grid
+        from Simulator_2D.Simulation import Simulation
+    else:
+        from Simulator_3D.GridParameters import GridParameters
+        from Simulator_3D.Grid import Grid
+        from Simulator_3D.Simulation import Simulation
+
+    space_steps = {"space_steps_X": SPACE_STEPS, "space_steps_Y": SPACE_STEPS}
+    if dimension == 3:
+        space_steps["space_steps_Z"] = SPACE_STEPS
+
+    grid_parameters = GridParameters(time_steps=TIME_STEPS, history_mode="ring", integrator="strang", **space_steps)
+
+    return grid_parameters, Grid, Simulation
+
+
+@pytest.mark.parametrize("dimension", [2, 3])
+def test_mpi_matches_serial(dimension, tmp_path):
+    pytest.importorskip("mpi4py")
+    mpirun = shutil.which("mpirun") or shutil.which("mpiexec")
+    if mpirun is None:
+        pytest.skip("mpirun is not installed.")
+
+    # Info: Open MPI refuses to run as root and on fewer cores than ranks without these.
+    env = dict(os.environ, OMPI_ALLOW_RUN_AS_ROOT="1", OMPI_ALLOW_RUN_AS_ROOT_CONFIRM="1",
+               OMPI_MCA_rmaps_base_oversubscribe="1")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH", "")]))
+
+    path = tmp_path / "mpi.npz"
+    subprocess.run([mpirun, "-n", str(RANKS), sys.executable, "-m", "tests.mpi_slab_run", str(path),
+                    "--dimension", str(dimension)], cwd=root, env=env, check=True, timeout=300)
+    result = np.load(path)
+    assert result["ranks"] == RANKS
+
+    grid_parameters, Grid, Simulation = parameters(dimension)
+    grid = Grid(grid_parameters)
+    simulation = Simulation(grid, grid_parameters.input_gravity, grid_parameters.potential_function)
+    simulation.set_init_function(grid_parameters.initial_function)
+    simulation.start_split_operator()
+
+    # Info: The summation order of the distributed FFTs differs, so only rounding errors are allowed.
+    density = np.square(np.abs(grid.get_state(TIME_STEPS - 1)))
+    np.testing.assert_allclose(np.square(np.abs(result["state"])), density, rtol=0, atol=1e-8 * density.max())
+    np.testing.assert_allclose(result["energy"], grid.energy, rtol=1e-12)
+
+    # Info: Both use the same operators, so in 3D (without the k=0 mode of the Poisson kernel) even the phase of the
+    #       state matches. In 2D the (huge) constant of the k=0 mode is rounded differently by the full spectrum.
+    if dimension == 3:
+        state = grid.get_state(TIME_STEPS - 1)
+        np.testing.assert_allclose(result["state"], state, rtol=0, atol=1e-12 * np.abs(state).max())
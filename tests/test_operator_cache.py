@@ -0,0 +1,57 @@
+import numpy as np
+import os
+
+import pytest
+
+from Simulator_Core.OperatorCache import grid_axis, load_operator_tables, operator_tables
+from tests.simulations import grid_parameters, run
+
+
+def test_grid_axis():
+    np.testing.assert_allclose(grid_axis(4, 0.5), [-0.75, -0.25, 0.25, 0.75])
+    np.testing.assert_allclose(grid_axis(5, 0.5), [-1.0, -0.5, 0.0, 0.5, 1.0])
+    np.testing.assert_allclose(grid_axis(5, 0.5, True), [-0.75, -0.25, 0.25, 0.75, 1.25])
+
+    assert grid_axis(4, 0.5) is grid_axis(4, 0.5)
+    with pytest.raises(ValueError):
+        grid_axis(4, 0.5)[0] = 1
+
+
+def test_tables_are_cached_in_memory():
+    axes = [grid_axis(32, 0.3), grid_axis(32, 0.3)]
+    tables = operator_tables(grid_parameters(2, integrator="suzuki4"), axes, "xy")
+
+    assert operator_tables(grid_parameters(2, integrator="suzuki4"), axes, "xy") is tables
+    assert operator_tables(grid_parameters(2, integrator="strang"), axes, "xy") is not tables
+    assert len(tables.oprs_k) == 5
+    with pytest.raises(ValueError):
+        tables.poisson[0, 0] = 1
+
+
+def test_tables_are_cached_on_the_disk(tmp_path):
+    parameters = grid_parameters(2, integrator="yoshida4", operator_cache_dir=str(tmp_path))
+    axes = [grid_axis(24, 0.5), grid_axis(24, 0.5)]
+    tables = operator_tables(parameters, axes, "xy")
+
+    entries = [name for name in os.listdir(str(tmp_path)) if name.startswith("operators_")]
+    assert len(entries) == 1 and not entries[0].endswith(".tmp")
+
+    # a new process only finds the tables on the disk
+    load_operator_tables.cache_clear()
+    loaded = operator_tables(parameters, axes, "xy")
+
+    assert loaded is not tables
+    for name, array in tables.arrays.items():
+        np.testing.assert_array_equal(loaded.arrays[name], array)
+    assert os.listdir(str(tmp_path)) == entries
+
+
+def test_cached_run_is_identical(tmp_path):
+    reference, _ = run(2, history_mode="ring", integrator="strang")
+    load_operator_tables.cache_clear()
+    run(2, history_mode="ring", integrator="strang", operator_cache_dir=str(tmp_path))
+    load_operator_tables.cache_clear()
+    grid, _ = run(2, history_mode="ring", integrator="strang", operator_cache_dir=str(tmp_path))
+
+    last = grid.grid_parameters.time_steps - 1
+    np.testing.assert_array_equal(grid.get_state(last), reference.get_state(last))
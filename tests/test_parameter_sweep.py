@@ -0,0 +1,64 @@
+import numpy as np
+import csv
+import os
+
+import pytest
+
+from Simulator_Core.ParameterSweep import point_path, run_sweep, sweep_points
+from tests.simulations import grid_parameters, run
+
+
+def test_sweep_points_are_the_cartesian_product():
+    points = sweep_points({"gravity": [1, 5], "integrator": ["lie", "strang", "suzuki4"]})
+
+    assert len(points) == 6
+    assert points[0] == {"gravity": 1, "integrator": "lie"}
+    assert points[-1] == {"gravity": 5, "integrator": "suzuki4"}
+
+
+def test_sweep_matches_single_runs(tmp_path):
+    variations = {"gravity": [1, 5], "integrator": ["strang"], "space_step_size": [0.2, 0.25]}
+    results = run_sweep(grid_parameters(1), variations, str(tmp_path), max_workers=1, snapshot_time_steps=[0, 40])
+
+    assert [result["status"] for result in results] == ["done"] * 4
+    with open(os.path.join(str(tmp_path), "summary.csv")) as file:
+        assert len(list(csv.reader(file))) == 5
+
+    # the third point is gravity 5 with a space step size of 0.2 (the default gravity of the 1D simulation)
+    grid, _ = run(1, integrator="strang", space_step_size=0.2)
+    snapshots = np.load(os.path.join(point_path(str(tmp_path), 2), "snapshots.npz"))
+    np.testing.assert_array_equal(snapshots["time_step_40"], grid.get_state(40))
+    np.testing.assert_array_equal(np.load(os.path.join(point_path(str(tmp_path), 2), "energy.npy")), grid.energy)
+    assert results[2]["final_energy"] == grid.energy[-1]
+
+
+def test_sweep_resumes_and_reports_failures(tmp_path):
+    run_sweep(grid_parameters(1), {"gravity": [1]}, str(tmp_path), max_workers=1)
+    result_path = os.path.join(point_path(str(tmp_path), 0), "result.json")
+    modified = os.path.getmtime(result_path)
+
+    results = run_sweep(grid_parameters(1), {"gravity": [1, 2]}, str(tmp_path), max_workers=1)
+    assert os.path.getmtime(result_path) == modified
+    assert [result["status"] for result in results] == ["done", "done"]
+
+    results = run_sweep(grid_parameters(1), {"viscosity": [1]}, str(tmp_path / "failed"), max_workers=1)
+    assert results[0]["status"] == "failed" and "viscosity" in results[0]["error"]
+
+
+def test_sweep_reruns_points_with_changed_parameters(tmp_path):
+    results = run_sweep(grid_parameters(1), {"time_step_size": [0.01]}, str(tmp_path), max_workers=1)
+    assert results[0]["final_time"] == pytest.approx(0.4)
+
+    # the same index with another variation
+    results = run_sweep(grid_parameters(1), {"time_step_size": [0.5]}, str(tmp_path), max_workers=1)
+    assert results[0]["final_time"] == pytest.approx(20)
+    assert results[0]["parameters"]["time_step_size"] == 0.5
+
+    # the same variation with other base parameters
+    results = run_sweep(grid_parameters(1, time_steps=21), {"time_step_size": [0.5]}, str(tmp_path), max_workers=1)
+    assert results[0]["final_time"] == pytest.approx(10)
+
+    result_path = os.path.join(point_path(str(tmp_path), 0), "result.json")
+    modified = os.path.getmtime(result_path)
+    run_sweep(grid_parameters(1, time_steps=21), {"time_step_size": [0.5]}, str(tmp_path), max_workers=1)
+    assert os.path.getmtime(result_path) == modified
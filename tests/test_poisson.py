@@ -0,0 +1,31 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.FFTBackend import NumpyFFTBackend
+from Simulator_Core.OperatorCache import grid_axis, operator_tables
+from tests.simulations import grid_parameters
+
+
+@pytest.mark.parametrize("shape, indexing, drop_zero_mode",
+                         [((64,), "ij", False), ((24, 24), "xy", False), ((12, 15, 9), "ij", True)])
+def test_real_fft_matches_complex_fft(shape, indexing, drop_zero_mode):
+    axes = [grid_axis(steps, 0.4) for steps in shape]
+    tables = operator_tables(grid_parameters(1), axes, indexing, drop_zero_mode)
+
+    # the Poisson kernel of the full spectrum, like the complex FFT solve before the real FFT
+    k_squared = np.array(tables.k_squared, dtype=float)
+    k_squared.flat[0] = 0.0001 ** 2
+    kernel = -1 / k_squared
+    if drop_zero_mode:
+        kernel.flat[0] = 0
+
+    rng = np.random.default_rng(1)
+    density = rng.random(tables.k_squared.shape)
+
+    fft = NumpyFFTBackend(density.shape)
+    potential = fft.irfft(fft.rfft(density) * tables.poisson)
+    reference = np.fft.ifftn(np.fft.fftn(density) * kernel).real
+
+    assert tables.poisson.shape[-1] == density.shape[-1] // 2 + 1
+    np.testing.assert_allclose(potential, reference, rtol=1e-10, atol=1e-10 * np.max(np.abs(reference)))
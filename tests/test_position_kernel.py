@@ -0,0 +1,45 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.PositionKernel import create_position_kernel
+from tests.simulations import grid_parameters, run
+
+KERNELS = ["numpy", "numexpr", "numba"]
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+@pytest.mark.parametrize("dtype", [np.complex128, np.complex64])
+def test_kernel_matches_formula(kernel, dtype):
+    if kernel != "numpy":
+        pytest.importorskip(kernel)
+    kernel = create_position_kernel(grid_parameters(1, position_kernel=kernel))
+    dtype_real = np.finfo(dtype).dtype
+
+    rng = np.random.default_rng(2)
+    state = (rng.standard_normal((16, 12)) + 1j * rng.standard_normal((16, 12))).astype(dtype)
+    v = rng.standard_normal((16, 12)).astype(dtype_real)
+    v_ext = rng.standard_normal((16, 12)).astype(dtype_real)
+    rtol = 1e-12 if dtype == np.complex128 else 1e-5
+
+    density = kernel.density(state, np.empty(state.shape, dtype=dtype_real))
+    np.testing.assert_allclose(density, np.square(np.abs(state)), rtol=rtol)
+
+    out = kernel.position(state, v, v_ext, 5.0, 0.1, np.empty_like(state))
+    np.testing.assert_allclose(out, state * np.exp(-1j * (5.0 * v + v_ext) * 0.1), rtol=rtol, atol=rtol)
+    assert out.dtype == dtype
+
+
+@pytest.mark.parametrize("kernel", KERNELS[1:])
+def test_simulation_matches_numpy(kernel):
+    pytest.importorskip(kernel)
+    grid, _ = run(2, history_mode="ring", integrator="strang", position_kernel=kernel)
+    reference, _ = run(2, history_mode="ring", integrator="strang")
+
+    last = grid.grid_parameters.time_steps - 1
+    np.testing.assert_allclose(grid.get_state(last), reference.get_state(last), atol=1e-10)
+
+
+def test_unknown_kernel():
+    with pytest.raises(ValueError):
+        create_position_kernel(grid_parameters(1, position_kernel="cython"))
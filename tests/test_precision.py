@@ -0,0 +1,39 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.Precision import complex_dtype, drift_report, real_dtype
+from tests.simulations import grid_parameters, run
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_single_precision_follows_double_precision(dimension):
+    grid, simulation = run(dimension, history_mode="ring", integrator="strang", precision="single")
+    reference, _ = run(dimension, history_mode="ring", integrator="strang")
+    last = grid.grid_parameters.time_steps - 1
+
+    assert grid.get_state(last).dtype == np.complex64
+    report = simulation.drift_report(reference)
+    assert report["max_norm_drift"] < 1e-5
+    assert report["max_reference_difference"] < 1e-5
+
+    density = np.square(np.abs(grid.get_state(last)))
+    reference_density = np.square(np.abs(reference.get_state(last)))
+    np.testing.assert_allclose(density, reference_density, atol=1e-5 * reference_density.max())
+
+
+def test_drift_report():
+    report = drift_report([2.0, 2.002, 1.999], [2.0, 2.0, 2.0])
+
+    assert report["max_norm_drift"] == pytest.approx(1e-3)
+    assert report["final_norm_drift"] == pytest.approx(5e-4)
+    assert report["max_reference_difference"] == pytest.approx(1e-3)
+    assert report["final_reference_difference"] == pytest.approx(5e-4)
+
+
+def test_dtypes():
+    assert complex_dtype(grid_parameters(1, precision="single")) == np.complex64
+    assert real_dtype(grid_parameters(1, precision="single")) == np.float32
+    assert real_dtype(grid_parameters(1)) == np.float64
+    with pytest.raises(ValueError):
+        complex_dtype(grid_parameters(1, precision="half"))
@@ -0,0 +1,49 @@
+import numpy as np
+import json
+import time
+
+import pytest
+
+from Simulator_Core.Profiler import PhaseProfiler
+from tests.simulations import run
+
+
+def test_every_phase_is_counted(tmp_path, capsys):
+    path = str(tmp_path / "trace.json")
+    grid, simulation = run(1, integrator="yoshida4", profile=True, profile_file=path, diagnostics_interval=10,
+                           absorbing_width=1.0)
+    reference, _ = run(1, integrator="yoshida4", diagnostics_interval=10, absorbing_width=1.0)
+
+    # 40 steps of three Strang steps with merged position steps (and one Poisson solve for the first state)
+    calls = {name: phase["calls"] for name, phase in simulation.profiler.report()["phases"].items()}
+    assert calls == {"kinetic": 120, "poisson": 121, "density": 121, "position": 160, "absorbing": 40,
+                     "storage": 40, "diagnostics": 5, "forward_fft": 120 + 121 + 5, "inverse_fft": 120 + 121,
+                     "other": 0}
+    assert "wall clock time" in capsys.readouterr().out
+
+    # the timers do not change the results
+    np.testing.assert_array_equal(grid.grid, reference.grid)
+    np.testing.assert_array_equal(grid.diagnostics, reference.diagnostics)
+
+    with open(path) as file:
+        trace = json.load(file)
+    assert len(trace["traceEvents"]) == sum(calls.values())
+    assert trace["otherData"]["phases"].keys() == calls.keys()
+
+
+def test_nested_phases_are_exclusive():
+    profiler = PhaseProfiler()
+    inner = profiler.timed("inner", lambda: time.sleep(0.02))
+    outer = profiler.timed("outer", lambda: (time.sleep(0.01), inner(), inner()))
+    outer()
+
+    report = profiler.report()["phases"]
+    assert report["inner"]["calls"] == 2 and report["outer"]["calls"] == 1
+    assert report["outer"]["total"] >= report["inner"]["total"] >= 0.04
+    assert report["outer"]["exclusive"] == pytest.approx(report["outer"]["total"] - report["inner"]["total"])
+
+
+def test_no_profiler_without_profile():
+    _, simulation = run(1)
+
+    assert simulation.profiler is None
@@ -0,0 +1,90 @@
+import numpy as np
+import tracemalloc
+import warnings
+
+import pytest
+
+from Simulator_1D.Grid import Grid
+from Simulator_1D.Simulation import Simulation
+from Simulator_Core.OperatorCache import grid_axis
+from Simulator_Core.Profiles import NFW, Gaussian, Harmonic, Plummer, RandomField, Soliton, evaluate_on_grid
+from tests.simulations import grid_parameters
+
+PROFILES = [Gaussian((1, -2, 0.5), width=1.5, momentum=(0.5, 0, -1), amplitude=2.0), Soliton((0, 1, 0), 2.0),
+            Harmonic((1, 0, 0), 0.3), Plummer((0, 0, -1), 2.0, 0.5), NFW((0, 0, 0), 3.0, 2.0),
+            RandomField(3, correlation_length=1.5, seed=4), Gaussian((-2, 0, 0)) + Gaussian((2, 0, 0))]
+
+
+@pytest.mark.parametrize("profile", PROFILES, ids=lambda profile: type(profile).__name__)
+def test_sparse_grid_matches_full_grid(profile):
+    axes = [grid_axis(16, 0.5), grid_axis(12, 0.6), grid_axis(10, 0.7)]
+
+    full = profile(*np.meshgrid(*axes, indexing="ij"))
+    np.testing.assert_allclose(evaluate_on_grid(profile, axes), full, rtol=1e-12, atol=1e-12)
+    assert np.all(np.isfinite(full))
+
+
+@pytest.mark.parametrize("profile", PROFILES, ids=lambda profile: type(profile).__name__)
+def test_profiles_write_into_out(profile):
+    axes = [grid_axis(16, 0.5), grid_axis(12, 0.6), grid_axis(10, 0.7)]
+    out = np.empty((16, 12, 10), dtype=complex)
+
+    assert evaluate_on_grid(profile, axes, out=out) is out
+    np.testing.assert_array_equal(out, np.broadcast_to(evaluate_on_grid(profile, axes), out.shape))
+
+
+@pytest.mark.parametrize("profile", [Gaussian((0, 1, 0), momentum=(1, 0, 0)), Harmonic((0, 0, 1))],
+                         ids=lambda profile: type(profile).__name__)
+def test_separable_profiles_do_not_allocate_the_grid(profile):
+    axes = [grid_axis(64, 0.2)] * 3
+    out = np.empty((64, 64, 64), dtype=complex)
+
+    tracemalloc.start()
+    try:
+        evaluate_on_grid(profile, axes, out=out)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # only the factors of the axes and the product of the first two axes (a 64th of the grid)
+    assert peak < out.nbytes / 8
+
+
+def test_gaussian_matches_the_formula():
+    x, y = np.meshgrid(grid_axis(20, 0.4), grid_axis(16, 0.5))
+    expected = 2.0 * np.exp(-((x - 1) ** 2 + (y + 2) ** 2) / (2 * 1.5 ** 2)) * np.exp(1j * 0.5 * x)
+
+    profile = Gaussian((1, -2), width=1.5, momentum=(0.5, 0), amplitude=2.0)
+    np.testing.assert_allclose(evaluate_on_grid(profile, [grid_axis(20, 0.4), grid_axis(16, 0.5)], "xy"), expected)
+    # further arguments like the wave function u of the potentials are ignored
+    np.testing.assert_allclose(profile(x, y, 5.0), expected)
+
+
+def test_nfw_is_finite_at_the_center():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        values = NFW((0,), 3.0, 2.0)(np.array([0.0, 2.0]))
+
+    np.testing.assert_allclose(values, [-3.0, -3.0 * np.log(2)])
+
+
+def test_random_field():
+    axes = [grid_axis(32, 0.5), grid_axis(32, 0.5)]
+    field = evaluate_on_grid(RandomField(2, seed=1, amplitude=2.0), axes)
+
+    assert np.sqrt(np.mean(np.square(np.abs(field)))) == pytest.approx(2.0)
+    np.testing.assert_array_equal(field, evaluate_on_grid(RandomField(2, seed=1, amplitude=2.0), axes))
+    assert not np.allclose(field, evaluate_on_grid(RandomField(2, seed=2, amplitude=2.0), axes))
+
+
+def test_profile_potential_matches_function():
+    grids = []
+    for potential in (Harmonic((0,), 0.1), lambda x=0, u=0: 0.05 * x ** 2):
+        grid = Grid(grid_parameters(1, integrator="strang"))
+        simulation = Simulation(grid, potential)
+        simulation.set_init_function(Soliton((1,)) + Gaussian((-3,)))
+        simulation.start_split_operator()
+        grids.append(grid)
+
+    np.testing.assert_allclose(grids[0].grid, grids[1].grid, atol=1e-12)
+    assert repr(Soliton((1,)) + Gaussian((-3,))).startswith("Soliton(center=(1,)")
@@ -0,0 +1,85 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.Recording import Recorder, plot_values
+from tests.simulations import create_simulation, grid_parameters, run
+
+
+def test_stride_and_interval():
+    grid, _ = run(1, history_mode="recorded", record_interval=5, record_stride=3)
+    reference, _ = run(1, history_mode="full")
+
+    assert list(grid.plotted_time_steps()) == list(range(0, 41, 5))
+    axes, record = grid.plotted_state(20)
+    np.testing.assert_array_equal(axes[0], reference.x_axis.real[::3])
+    np.testing.assert_array_equal(record, reference.get_state(20)[::3])
+    assert record.dtype == grid.dtype
+    with pytest.raises(ValueError):
+        grid.plotted_state(21)
+
+
+def test_region_of_the_2d_grid():
+    region = ((-4, 2), (0, 6))
+    grid, _ = run(2, history_mode="recorded", record_region=region, record_stride=2, record_density=True)
+    reference, _ = run(2, history_mode="full")
+    x, y = reference.x_axis.real, reference.y_axis.real
+
+    # Info: The states of the 2D grid are indexed (y, x).
+    inside_x = np.nonzero((x >= -4) & (x <= 2))[0]
+    inside_y = np.nonzero((y >= 0) & (y <= 6))[0]
+    rows, columns = slice(inside_y[0], inside_y[-1] + 1, 2), slice(inside_x[0], inside_x[-1] + 1, 2)
+    expected = np.square(np.abs(reference.get_state(20)))[rows, columns]
+
+    (x_axis, y_axis), record = grid.plotted_state(20)
+    np.testing.assert_array_equal(x_axis, x[columns])
+    np.testing.assert_array_equal(y_axis, y[rows])
+    assert record.dtype == np.float32
+    np.testing.assert_allclose(record, expected, rtol=1e-6)
+
+
+def test_binning_averages_the_density():
+    grid, _ = run(3, history_mode="recorded", record_stride=4, record_binning=True, record_density=True)
+    reference, _ = run(3, history_mode="full")
+
+    density = np.square(np.abs(reference.get_state(10)))
+    expected = density.reshape(6, 4, 6, 4, 6, 4).mean(axis=(1, 3, 5))
+    axes, record = grid.plotted_state(10)
+    np.testing.assert_allclose(record, expected, rtol=1e-6)
+    np.testing.assert_allclose(axes[2], reference.z_axis.reshape(6, 4).mean(axis=1))
+    # the mean of the density keeps the norm of the blocks
+    assert np.sum(record) * 64 == pytest.approx(1.0, rel=1e-6)
+
+
+@pytest.mark.parametrize("parameters", [{"record_binning": True, "record_stride": 2}, {"record_stride": 0},
+                                        {"record_region": ((20, 30),)}, {"record_region": ((0, 1), (0, 1))}])
+def test_invalid_recordings(parameters):
+    with pytest.raises(ValueError):
+        Recorder(grid_parameters(1, history_mode="recorded", **parameters), [np.linspace(-10, 10, 101)])
+
+
+def test_density_records_cannot_show_the_real_part():
+    records = np.ones((2, 4), dtype=np.float32)
+
+    assert plot_values(records) is records
+    with pytest.raises(ValueError):
+        plot_values(records, square=False)
+
+
+def test_checkpoint_keeps_the_records(tmp_path):
+    path = str(tmp_path / "checkpoint.npz")
+    recording = {"history_mode": "recorded", "record_interval": 4, "record_stride": 2}
+    run(1, time_steps=21, checkpoint_interval=10, checkpoint_file=path, **recording)
+    reference, _ = run(1, **recording)
+
+    grid, simulation = create_simulation(1, grid_parameters(1, **recording))
+    simulation.resume_from(path)
+    assert list(grid.plotted_time_steps()) == list(range(0, 41, 4))
+    np.testing.assert_array_equal(grid.recorder.records, reference.recorder.records)
+    np.testing.assert_array_equal(grid.plotted_history()[2], reference.plotted_history()[2])
+
+    # a run which records differently only has the records from the checkpoint on
+    grid, simulation = create_simulation(1, grid_parameters(1, **dict(recording, record_stride=4)))
+    simulation.resume_from(path)
+    assert list(grid.plotted_time_steps()) == list(range(20, 41, 4))
+    assert len(grid.plotted_history()[2]) == 6
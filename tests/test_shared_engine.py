@@ -0,0 +1,68 @@
+import numpy as np
+
+import pytest
+
+from Simulator_1D.Grid import Grid as Grid1D
+from Simulator_1D.Simulation import Simulation as Simulation1D
+from Simulator_2D.Grid import Grid as Grid2D
+from Simulator_2D.Simulation import Simulation as Simulation2D
+from Simulator_3D.Grid import Grid as Grid3D
+from Simulator_3D.Simulation import Simulation as Simulation3D
+from Simulator_Core.MPISlab import MPISimulation
+from Simulator_Core.Profiles import Gaussian, Harmonic
+from Simulator_Core.SplitOperator import SplitOperatorSimulation
+from tests.simulations import grid_parameters, run
+
+# A packet in a harmonic potential which only depends on x. (constant along the other axes)
+INITIAL_FUNCTION = Gaussian((-2,), momentum=(1,))
+POTENTIAL = Harmonic((0,), 0.1)
+
+
+@pytest.mark.parametrize("integrator", ["lie", "suzuki4"])
+def test_dimensions_agree_along_x(integrator):
+    parameters = grid_parameters(1, integrator=integrator)
+    grid = Grid1D(parameters)
+    simulation = Simulation1D(grid, POTENTIAL, gravity=0)
+    simulation.set_init_function(INITIAL_FUNCTION)
+    simulation.start_split_operator()
+
+    x_axis = {"space_steps_X": parameters.space_steps, "space_step_size_X": parameters.space_step_size}
+    grid_2d = Grid2D(grid_parameters(2, integrator=integrator, time_steps=41, space_steps_Y=parameters.space_steps,
+                                     space_step_size_Y=parameters.space_step_size, **x_axis))
+    grid_3d = Grid3D(grid_parameters(3, integrator=integrator, time_steps=41, history_mode="full", space_steps_Y=4,
+                                     space_steps_Z=2, **x_axis))
+    for other, Simulation in [(grid_2d, Simulation2D), (grid_3d, Simulation3D)]:
+        simulation = Simulation(other, 0, POTENTIAL)
+        simulation.set_init_function(INITIAL_FUNCTION)
+        simulation.start_split_operator()
+
+    # Info: The states of the 2D grid are indexed (y, x), every line along x is the normalized 1D state.
+    for time_step in (10, 40):
+        state = grid.get_state(time_step)
+        np.testing.assert_allclose(grid_2d.get_state(time_step)[3] * np.sqrt(parameters.space_steps), state,
+                                   atol=1e-12)
+        np.testing.assert_allclose(grid_3d.get_state(time_step)[:, 1, 0] * np.sqrt(8), state, atol=1e-12)
+
+
+def test_simulations_share_the_engine():
+    for Simulation in (Simulation1D, Simulation2D, Simulation3D):
+        assert issubclass(Simulation, SplitOperatorSimulation)
+        assert "adaptive_split_operator" not in vars(Simulation)
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_default_potential_accepts_every_coordinate(dimension):
+    grid, _ = run(dimension, integrator="strang")
+
+    assert np.all(np.isfinite(grid.energy))
+
+
+@pytest.mark.parametrize("parameter, value", [("adaptive", True), ("checkpoint_interval", 5),
+                                              ("fft_backend", "scipy"), ("operator_cache_dir", "cache"),
+                                              ("diagnostics_interval", 5), ("profile", True),
+                                              ("absorbing_width", 2.0), ("engine", "jax")])
+def test_mpi_rejects_unsupported_parameters(parameter, value):
+    # Info: The parameters are rejected before MPI is initialized, so mpi4py is not needed.
+    parameters = grid_parameters(2, history_mode="ring", **{parameter: value})
+    with pytest.raises(ValueError, match="MPI"):
+        MPISimulation(Grid2D(parameters), parameters, 5)
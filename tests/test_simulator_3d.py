@@ -0,0 +1,37 @@
+import numpy as np
+
+from Simulator_3D.Grid import Grid
+from Simulator_3D.Simulation import Simulation
+from Simulator_Core.Profiles import Gaussian
+from tests.simulations import grid_parameters, run
+
+
+def test_norm_and_symmetry_are_kept():
+    grid, _ = run(3, history_mode="full", integrator="strang")
+    last = grid.grid_parameters.time_steps - 1
+
+    np.testing.assert_allclose(grid.energy, 1.0, rtol=1e-12)
+
+    # the two Gaussians at (-4, -4, -4) and (4, 4, 4) attract each other symmetrically
+    density = np.square(np.abs(grid.get_state(last)))
+    np.testing.assert_allclose(density, np.flip(density), atol=1e-12 * density.max())
+    assert not np.allclose(grid.get_state(last), grid.get_state(0))
+
+
+def test_free_packet_moves_along_its_momentum():
+    parameters = grid_parameters(3, time_steps=21, history_mode="full")
+    grid = Grid(parameters)
+    simulation = Simulation(grid, 0)
+    simulation.set_init_function(Gaussian((0, 0, 0), width=1.5, momentum=(1, 0, -0.5)))
+    simulation.start_split_operator()
+
+    x, y, z = [np.real(axis) for axis in grid.meshgrid()]
+    centers = []
+    for time_step in (10, 20):
+        density = np.square(np.abs(grid.get_state(time_step)))
+        centers.append(np.array([np.sum(density * axis) / np.sum(density) for axis in (x, y, z)]))
+
+    # Info: Without gravity the packet moves with a constant velocity parallel to its momentum.
+    assert centers[0][0] > 0.1
+    np.testing.assert_allclose(centers[1], 2 * centers[0], atol=1e-6)
+    np.testing.assert_allclose(centers[0], centers[0][0] * np.array([1, 0, -0.5]), atol=1e-6)
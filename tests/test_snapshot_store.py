@@ -0,0 +1,50 @@
+import numpy as np
+
+import pytest
+
+from Simulator_Core.SnapshotStore import HDF5SnapshotWriter, NpySnapshotWriter, load_snapshots
+from tests.simulations import grid_parameters, run
+
+
+def store_and_load(dimension, writer, path):
+    """
+    Runs a small simulation into a snapshot store and returns the reference run and the loaded one.
+
+    :param dimension: 1, 2 or 3.
+    :param writer: The class of the sink. (NpySnapshotWriter or HDF5SnapshotWriter)
+    :param path: The path of the store.
+    """
+
+    sink = writer(str(path), grid_parameters(dimension, snapshot_interval=5))
+    grid, _ = run(dimension, sink=sink, history_mode="ring", snapshot_interval=5)
+    sink.close(grid.energy, grid.time)
+    reference, _ = run(dimension, history_mode="full")
+
+    return reference, load_snapshots(str(path))
+
+
+@pytest.mark.parametrize("dimension", [1, 2, 3])
+def test_npy_store_round_trip(dimension, tmp_path):
+    reference, loaded = store_and_load(dimension, NpySnapshotWriter, tmp_path / "run")
+
+    assert isinstance(loaded.grid, np.memmap)
+    assert list(loaded.stored_time_steps()) == list(range(0, reference.grid_parameters.time_steps, 5))
+    for time_step in loaded.stored_time_steps():
+        np.testing.assert_array_equal(loaded.get_state(time_step), reference.get_state(time_step))
+    np.testing.assert_array_equal(loaded.energy, reference.energy)
+
+
+def test_hdf5_store_round_trip(tmp_path):
+    pytest.importorskip("h5py")
+    reference, loaded = store_and_load(2, HDF5SnapshotWriter, tmp_path / "run.h5")
+
+    last = reference.grid_parameters.time_steps - 1
+    np.testing.assert_array_equal(loaded.get_state(last), reference.get_state(last))
+    np.testing.assert_array_equal(loaded.energy, reference.energy)
+
+
+def test_resume_rejects_another_size(tmp_path):
+    NpySnapshotWriter(str(tmp_path), grid_parameters(1)).close()
+
+    with pytest.raises(ValueError):
+        NpySnapshotWriter(str(tmp_path), grid_parameters(1, space_steps=64), resume=True)